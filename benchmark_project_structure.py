@@ -0,0 +1,745 @@
+import os  # Import os module for interacting with the operating system.
+import sys  # Import sys module for the exit status.
+import json  # Import json module for reading and writing benchmark baselines.
+import random  # Import random module for the deterministic synthetic repository.
+import shutil  # Import shutil module for removing the synthetic repository.
+import tempfile  # Import tempfile module for the benchmark working directory.
+import argparse  # Import argparse module for command line options.
+import platform  # Import platform module for recording the benchmark environment.
+import time  # Import time module for timing benchmark runs.
+import tracemalloc  # Import tracemalloc module for measuring peak memory.
+import contextlib  # Import contextlib module for silencing generator output.
+import io  # Import io module for silencing generator output.
+import re  # Import re module for parsing the text exports.
+import resource  # Import resource module for the peak resident memory of child processes.
+import multiprocessing  # Import multiprocessing module for measuring memory in fresh processes.
+from concurrent.futures import ProcessPoolExecutor  # Import ProcessPoolExecutor for measuring memory in fresh processes.
+import project_structure_generator as psg  # Import the generator being benchmarked.
+import benchmark_legacy as legacy  # Import the version 1.5 implementation the comparisons measure against.
+
+# Benchmark settings
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")  # Stored baseline to compare against.
+REGRESSION_THRESHOLD = 0.25  # Fraction by which throughput may drop (or peak memory grow) before a result counts as a regression.
+REPEATS = 3  # Minimum number of timed runs per scenario; the fastest one is kept.
+MIN_SECONDS = 1.0  # Scenarios are repeated until they have run for at least this long, so fast ones are not dominated by noise.
+SCENARIOS = ['walk', 'extract', 'full']  # Scenarios to run, in order.
+COMPARISONS = ['workers', 'walk-syscalls', 'line-index', 'php', 'memory', 'load', 'matcher']  # Comparisons --compare can run; they report side-by-side numbers instead of checking a baseline.
+WORKER_COUNTS = [1, 2, 4, 8]  # Worker counts timed by the workers comparison.
+WALK_ENTRIES = 1_000_000  # Approximate number of files and directories in the tree of the walk-syscalls comparison.
+WALK_TREE_DEPTH = 8  # Directory levels of that tree.
+WALK_MAX_DEPTH = 4  # max_depth both walkers use on that tree; os.walk still lists everything deeper, walk_project does not.
+LARGE_FILE_FUNCTIONS = 2000  # Functions (or methods) in each large synthetic file of the line-index comparison.
+MEMORY_DEPTHS = [3, 4, 5, 6]  # Depths of the growing synthetic repositories of the memory comparison.
+MATCHER_FILES = 100_000  # Files in the single directory of the matcher comparison.
+PHP_CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'corpus', 'php')  # PHP regression corpus of the php comparison.
+
+# Synthetic repository settings
+SEED = 1234  # Seed of the synthetic repository; the same seed always produces the same files.
+DEPTH = 4  # Number of directory levels below the root.
+FAN_OUT = 4  # Number of subdirectories per directory.
+FILES_PER_DIR = 12  # Number of source files per directory.
+LANGUAGE_MIX = {'.py': 0.4, '.php': 0.3, '.js': 0.3}  # Share of each source file extension.
+FUNCTIONS_PER_FILE = (2, 30)  # Range of the number of functions (or methods) per source file, which sets the file sizes.
+PATTERN_FILES_PER_DIR = 6  # Number of data files per directory named to match PATTERNS.
+OTHER_FILES_PER_DIR = 4  # Number of files per directory that are not extracted (.css, .txt, .md).
+SPECIAL_DIR_RATIO = 0.1  # Share of subdirectories named to match SPECIAL_DIR_PATTERNS.
+IGNORED_DIR_RATIO = 0.05  # Share of subdirectories named after an entry of IGNORE_DIRS.
+
+# Generator settings used by every scenario
+EXTENSIONS_TO_INCLUDE = ('.py', '.js', '.php', '.css')  # Extensions listed in the tree; includes .py so Python is extracted.
+LANGUAGES = ['python', 'php', 'javascript']  # Languages extracted by the extraction and full scenarios.
+
+# Helper function to write a synthetic Python file
+def synthetic_python_file(rng, functions):
+    ### Return the text of a Python file with the given number of functions, some with leading comments.
+    parts = ['import os\n\n']
+    for index in range(functions):
+        if rng.random() < 0.5:
+            parts.append(f'# Helper function number {index}\n# Second comment line\n')
+        parts.append(f'def function_{index}(first, second):\n    value = first + second\n    return value * {index}\n\n')
+    return ''.join(parts)
+
+# Helper function to write a synthetic PHP file
+def synthetic_php_file(rng, functions):
+    ### Return the text of a PHP file whose functions are split between classes and standalone functions.
+    parts = [f'<?php\n/**\n * Description: Synthetic PHP file {rng.randrange(1 << 30)}\n */\n\n']
+    index = 0
+    while index < functions:
+        if rng.random() < 0.5:
+            methods = min(functions - index, rng.randint(1, 6))
+            parts.append(f'class Synthetic{index} extends Base {{\n')
+            for method in range(methods):
+                parts.append(f'    public function method_{method}($value) {{\n        /*** Method {method} ***/\n        if ($value) {{ return {{$value}}; }}\n        return null;\n    }}\n\n')
+            parts.append('}\n\n')
+            index += methods
+        else:
+            parts.append(f'function function_{index}($value) {{\n    /*** Function {index} ***/\n    return $value;\n}}\n\n')
+            index += 1
+    return ''.join(parts)
+
+# Helper function to write a synthetic JavaScript file
+def synthetic_javascript_file(rng, functions):
+    ### Return the text of a JavaScript file mixing function declarations, function expressions and arrow functions.
+    parts = ['/**\n * @description Synthetic JavaScript file\n */\n\n']
+    for index in range(functions):
+        style = rng.randrange(3)
+        if rng.random() < 0.5:
+            parts.append(f'// Function number {index}\n')
+        if style == 0:
+            parts.append(f'function function_{index}(first, second) {{\n  /*** Function {index} ***/\n  return first + second;\n}}\n\n')
+        elif style == 1:
+            parts.append(f'var function_{index} = function(value) {{\n  return value;\n}};\n\n')
+        else:
+            parts.append(f'function_{index} = (value) => {{\n  return value;\n}};\n\n')
+    return ''.join(parts)
+
+SYNTHETIC_WRITERS = {'.py': synthetic_python_file, '.php': synthetic_php_file, '.js': synthetic_javascript_file}  # Source file writer of each extension.
+
+# Helper function to generate the synthetic repository
+def generate_synthetic_repo(root, seed=SEED, depth=DEPTH, fan_out=FAN_OUT, files_per_dir=FILES_PER_DIR, language_mix=LANGUAGE_MIX, functions_per_file=FUNCTIONS_PER_FILE, pattern_files_per_dir=PATTERN_FILES_PER_DIR, other_files_per_dir=OTHER_FILES_PER_DIR, special_dir_ratio=SPECIAL_DIR_RATIO, ignored_dir_ratio=IGNORED_DIR_RATIO):
+    ### Create a synthetic repository under root and return its statistics; the same arguments always produce the same files.
+    rng = random.Random(seed)
+    extensions = sorted(language_mix)
+    weights = [language_mix[extension] for extension in extensions]
+    stats = {'directories': 0, 'source_files': 0, 'source_bytes': 0, 'files': 0}
+    stack = [(root, 0)]
+    while stack:
+        directory, level = stack.pop()
+        os.makedirs(directory)
+        stats['directories'] += 1
+
+        # Write the source files of the directory.
+        for index in range(files_per_dir):
+            extension = rng.choices(extensions, weights)[0]
+            content = SYNTHETIC_WRITERS[extension](rng, rng.randint(*functions_per_file))
+            with open(os.path.join(directory, f'module_{index}{extension}'), 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+            stats['source_files'] += 1
+            stats['source_bytes'] += len(content.encode('utf-8'))
+
+        # Write data files matching the grouping PATTERNS, and files that are listed or ignored but never extracted.
+        for index in range(pattern_files_per_dir):
+            name = rng.choice([f'links_{index}-{index + 1}.csv', f'part_{index}.csv', f'links_{index}.csv', f'export_part_{index}.csv'])
+            with open(os.path.join(directory, name), 'w', encoding='utf-8') as f:
+                f.write('id,value\n')
+        for index in range(other_files_per_dir):
+            with open(os.path.join(directory, f'asset_{index}{rng.choice([".css", ".txt", ".md"])}'), 'w', encoding='utf-8') as f:
+                f.write('/* asset */\n')
+        stats['files'] += files_per_dir + pattern_files_per_dir + other_files_per_dir
+
+        # Queue the subdirectories, some named to match SPECIAL_DIR_PATTERNS or IGNORE_DIRS.
+        if level < depth:
+            names = set()
+            for index in range(fan_out):
+                draw = rng.random()
+                if draw < special_dir_ratio:
+                    name = f'run_{index}'
+                elif draw < special_dir_ratio + ignored_dir_ratio:
+                    name = rng.choice(psg.IGNORE_DIRS)
+                else:
+                    name = f'package_{index}'
+                if name not in names:
+                    names.add(name)
+                    stack.append((os.path.join(directory, name), level + 1))
+    return stats
+
+# Helper function to generate file and directory names
+def synthetic_names(rng, count):
+    ### Return count distinct names mixing source, data, hidden and ignored files, names matching the grouping PATTERNS, names
+    ### with several dots or odd case, and directory names that are ignored, special or only look that way.
+    stems = ['module', 'index', 'app', 'test_utils', 'Controller', 'café', 'data-export', 'node_modules', 'lib', 'libs2', 'venv', 'chrome.app']
+    extensions = ['.py', '.js', '.php', '.css', '.txt', '.md', '.csv', '.min.js', '.json', '.PY', '.tar.gz', '.py.bak', '']
+    names = []
+    seen = set()
+    while len(names) < count:
+        index = len(names)
+        draw = rng.random()
+        if draw < 0.1:
+            name = rng.choice([f'links_{index}-{index + 1}.csv', f'part_{index}.csv', f'links_{index}.csv', f'export_part_{index}.csv', f'links_{index}.css'])
+        elif draw < 0.15:
+            name = rng.choice([f'.hidden_{index}.py', 'README.md', 'CHANGELOG.md', f'notes_{index}.txt', '.env', '.git'])
+        elif draw < 0.2:
+            name = rng.choice([f'run_{index}', f'run_{index}x', f'run_x{index}', 'node_modules', 'lib', 'DataTables', '.vscode', 'chrome.app'])
+        else:
+            name = f'{rng.choice(stems)}_{index}{rng.choice(extensions)}'
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+# Helper function to generate the tree of the walk-syscalls comparison
+def generate_walk_tree(root, entries=WALK_ENTRIES, depth=WALK_TREE_DEPTH, fan_out=FAN_OUT):
+    ### Create a tree of about entries files and directories under root and return the exact number created. Every directory has
+    ### fan_out subdirectories down to depth levels and the same number of empty files; two of the root's subdirectories are
+    ### named node_modules and run_1, so they are ignored and special. Smaller trees get fewer levels.
+    directories = sum(fan_out ** level for level in range(depth + 1))
+    while depth > 1 and directories > entries:
+        directories -= fan_out ** depth
+        depth -= 1
+    files_per_dir = max(0, entries // directories - 1)
+    created = 0
+    stack = [(root, 0)]
+    while stack:
+        directory, level = stack.pop()
+        os.mkdir(directory)
+        for index in range(files_per_dir):
+            os.close(os.open(os.path.join(directory, f'module_{index}.py'), os.O_CREAT | os.O_WRONLY, 0o644))
+        created += 1 + files_per_dir
+        if level < depth:
+            for index in range(fan_out):
+                name = f'package_{index}'
+                if level == 0 and index < 2:
+                    name = ['node_modules', 'run_1'][index]
+                stack.append((os.path.join(directory, name), level + 1))
+    return created
+
+# Helper function to list the extraction jobs of a repository
+def collect_extraction_jobs(project_dir, languages=LANGUAGES):
+    ### Return the (file_path, language, relative_file_path) jobs and total bytes of the files a full run would extract, and the
+    ### number of files the walk lists (files under ignored, special and too-deep directories are never listed).
+    matcher = psg.NameMatcher(psg.IGNORE_DIRS, psg.IGNORE_FILES, psg.SPECIAL_DIR_PATTERNS, psg.PATTERNS, EXTENSIONS_TO_INCLUDE, languages, False)
+    jobs = []
+    total_bytes = 0
+    listed_files = 0
+    for dirpath, relative_path, _, _, filenames in psg.walk_project(project_dir, psg.MAX_DEPTH, matcher.should_prune_directory):
+        listed_files += len(filenames)
+        if matcher.is_ignored_directory(os.path.basename(dirpath)):
+            continue
+        for file in filenames:
+            classification = matcher.classify_file(file)
+            if classification is None:
+                continue
+            for lang in classification[1]:
+                file_path = os.path.join(dirpath, file)
+                jobs.append((file_path, lang, os.path.join(relative_path, file) if relative_path != '.' else file))
+                total_bytes += os.path.getsize(file_path)
+    return jobs, total_bytes, listed_files
+
+# Helper function to run the generator with the benchmark settings
+def run_generator(project_dir, output_dir, languages, export, workers):
+    ### Run generate_project_structure on the synthetic repository, writing every output (or only the tree) to output_dir.
+    documentation_dir = psg.DOCUMENTATION_DIR
+    psg.DOCUMENTATION_DIR = output_dir  # The combined writer creates DOCUMENTATION_DIR.
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            psg.generate_project_structure(
+                project_dir=project_dir,
+                ignore_dirs=psg.IGNORE_DIRS,
+                ignore_files=psg.IGNORE_FILES,
+                extensions_to_include=EXTENSIONS_TO_INCLUDE,
+                patterns=psg.PATTERNS,
+                special_dir_patterns=psg.SPECIAL_DIR_PATTERNS,
+                languages=languages,
+                output_file=os.path.join(output_dir, 'project_structure.txt'),
+                functions_file=os.path.join(output_dir, 'functions.txt'),
+                combined_file=os.path.join(output_dir, 'combined_structure.txt'),
+                export_structure=True,
+                export_functions=export,
+                export_combined=export,
+                return_folders_only=False,
+                max_depth=psg.MAX_DEPTH,
+                include_all_files=False,
+                workers=workers,
+                export_jsonl=export,
+                jsonl_file=os.path.join(output_dir, 'functions.jsonl'),
+                export_binary=export,
+                binary_file=os.path.join(output_dir, 'functions.bin')
+            )
+    finally:
+        psg.DOCUMENTATION_DIR = documentation_dir
+
+# Helper function to time a scenario
+def measure(run, repeats, min_seconds=MIN_SECONDS, trace_memory=True):
+    ### Return (fastest wall seconds, peak traced memory in bytes) of run(); memory is traced in one extra, untimed run,
+    ### which is skipped (and the peak reported as None) when trace_memory is false.
+    best = None
+    runs = 0
+    total = 0.0
+    while runs < repeats or total < min_seconds:
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+        runs += 1
+        total += elapsed
+    if not trace_memory:
+        return best, None
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+# Helper function to run the benchmark scenarios
+def run_benchmarks(work_dir, scenarios=SCENARIOS, repeats=REPEATS, workers=1, repo_settings=None):
+    ### Generate the synthetic repository in work_dir and return the benchmark report with one result per scenario.
+    repo_settings = repo_settings or {}
+    project_dir = os.path.join(work_dir, 'synthetic_repo')
+    output_dir = os.path.join(work_dir, 'docs')
+    repo_stats = generate_synthetic_repo(project_dir, **repo_settings)
+    os.makedirs(output_dir)
+    jobs, job_bytes, listed_files = collect_extraction_jobs(project_dir)
+
+    # Each scenario: (function to run, files it processes, bytes it processes).
+    runners = {
+        'walk': (lambda: run_generator(project_dir, output_dir, [], False, workers), listed_files, 0),
+        'extract': (lambda: [None for _ in psg.iter_extraction_results(iter(jobs), workers)], len(jobs), job_bytes),
+        'full': (lambda: run_generator(project_dir, output_dir, LANGUAGES, True, workers), len(jobs), job_bytes),
+    }
+    results = {}
+    for scenario in scenarios:
+        run, files, size = runners[scenario]
+        seconds, peak = measure(run, repeats)
+        results[scenario] = {
+            'seconds': seconds,
+            'files_per_second': files / seconds if seconds else 0.0,
+            'mb_per_second': size / (1 << 20) / seconds if seconds and size else 0.0,
+            'peak_memory_bytes': peak,
+        }
+    return {
+        'generator_version': psg.GENERATOR_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'settings': dict(repo_settings, repeats=repeats, workers=workers),
+        'repository': dict(repo_stats, listed_files=listed_files, extraction_jobs=len(jobs)),
+        # tracemalloc only sees this process, so with workers > 1 the extraction done in worker processes is not counted.
+        'peak_memory_scope': 'main process only, worker processes excluded' if workers > 1 else 'whole run',
+        'results': results,
+    }
+
+# Helper function to time extraction with a growing number of worker processes
+def compare_workers(work_dir, repeats, repo_settings, options):
+    ### Return the extract and full scenario times on the synthetic repository for each worker count, with the speedup over the first count.
+    project_dir = os.path.join(work_dir, 'synthetic_repo')
+    output_dir = os.path.join(work_dir, 'docs')
+    generate_synthetic_repo(project_dir, **repo_settings)
+    os.makedirs(output_dir)
+    jobs, job_bytes, _ = collect_extraction_jobs(project_dir)
+    rows = {}
+    first = None
+    for workers in options.get('worker_counts', WORKER_COUNTS):
+        extract_seconds, _ = measure(lambda: [None for _ in psg.iter_extraction_results(iter(jobs), workers)], repeats, trace_memory=False)
+        full_seconds, _ = measure(lambda: run_generator(project_dir, output_dir, LANGUAGES, True, workers), repeats, trace_memory=False)
+        first = first or (extract_seconds, full_seconds)
+        rows[f'workers {workers}'] = {
+            'extract_seconds': extract_seconds,
+            'extract_speedup': first[0] / extract_seconds,
+            'full_seconds': full_seconds,
+            'full_speedup': first[1] / full_seconds,
+            'extract_mb_per_second': job_bytes / (1 << 20) / extract_seconds,
+        }
+    # Speedups are capped by the CPUs available, so record them with the results.
+    return {'cpu_count': os.cpu_count(), 'extraction_jobs': len(jobs), 'rows': rows}
+
+# Helper function to count the directory listings and stat calls made through the os module
+def count_file_system_calls(run):
+    ### Return the result of run() and the number of os.scandir calls and of os.stat and os.lstat calls it made, counted by
+    ### wrapping them while it runs. os.walk lists directories with os.scandir and checks symlinks with os.lstat.
+    counts = {'scandir': 0, 'stat': 0}
+    originals = {name: getattr(os, name) for name in ('scandir', 'stat', 'lstat')}
+
+    # Helper function to wrap one os function with a counter
+    def counted(name, key):
+        ### Return a function calling the original os function name after counting the call under key.
+        original = originals[name]
+        def call(*args, **kwargs):
+            counts[key] += 1
+            return original(*args, **kwargs)
+        return call
+
+    os.scandir, os.stat, os.lstat = counted('scandir', 'scandir'), counted('stat', 'stat'), counted('lstat', 'stat')
+    try:
+        result = run()
+    finally:
+        os.scandir, os.stat, os.lstat = originals['scandir'], originals['stat'], originals['lstat']
+    return result, counts['scandir'], counts['stat']
+
+# Helper function to compare the system calls of the version 1.5 walk and walk_project
+def compare_walk_syscalls(work_dir, repeats, repo_settings, options):
+    ### Return the time and the directory listings and stat calls of the version 1.5 os.walk loop and of walk_project on a tree
+    ### of about options['walk_entries'] entries, walked to WALK_MAX_DEPTH, and whether both process the same directories.
+    project_dir = os.path.join(work_dir, 'walk_tree')
+    entries = generate_walk_tree(project_dir, options.get('walk_entries', WALK_ENTRIES))
+    matcher = psg.NameMatcher(psg.IGNORE_DIRS, psg.IGNORE_FILES, psg.SPECIAL_DIR_PATTERNS, psg.PATTERNS, EXTENSIONS_TO_INCLUDE, LANGUAGES, False)
+    walkers = {
+        'version 1.5': lambda: [(relative_path, sorted(filenames)) for _, relative_path, _, filenames in legacy.legacy_walk(project_dir, WALK_MAX_DEPTH, psg.IGNORE_DIRS, psg.SPECIAL_DIR_PATTERNS)],
+        'walk_project': lambda: [(relative_path, sorted(filenames)) for dirpath, relative_path, _, _, filenames in psg.walk_project(project_dir, WALK_MAX_DEPTH, matcher.should_prune_directory) if not matcher.is_ignored_directory(os.path.basename(dirpath))],
+    }
+    rows = {}
+    processed = []
+    for label, walk in walkers.items():
+        seconds, _ = measure(walk, repeats, trace_memory=False)
+        listings, scandir_calls, stat_calls = count_file_system_calls(walk)
+        processed.append(listings)
+        rows[label] = {'seconds': seconds, 'scandir_calls': scandir_calls, 'stat_calls': stat_calls, 'directories_processed': len(listings)}
+    return {
+        'entries': entries,
+        'max_depth': WALK_MAX_DEPTH,
+        'speedup': rows['version 1.5']['seconds'] / rows['walk_project']['seconds'],
+        'identical': processed[0] == processed[1],
+        'rows': rows,
+    }
+
+# Helper function to compare version 1.5 and current extraction on large files
+def compare_line_index(work_dir, repeats, repo_settings, options):
+    ### Return the extraction time of the version 1.5 extract_functions and of the current one on a large synthetic Python, PHP and
+    ### JavaScript file with options['large_file_functions'] functions each, and whether both find the same definitions.
+    rng = random.Random(repo_settings.get('seed', SEED))
+    rows = {}
+    identical = True
+    for extension, language in (('.py', 'python'), ('.php', 'php'), ('.js', 'javascript')):
+        file_path = os.path.join(work_dir, f'large{extension}')
+        content = SYNTHETIC_WRITERS[extension](rng, options.get('large_file_functions', LARGE_FILE_FUNCTIONS))
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        legacy_seconds, _ = measure(lambda: legacy.legacy_extract_functions(file_path, language), repeats, trace_memory=False)
+        seconds, _ = measure(lambda: psg.extract_functions(file_path, language), repeats, trace_memory=False)
+        expected = legacy.strip_method_lines(legacy.legacy_extract_functions(file_path, language))
+        identical = identical and legacy.strip_method_lines(psg.extract_functions(file_path, language)) == expected
+        rows[language] = {
+            'bytes': len(content.encode('utf-8')),
+            'lines': content.count('\n'),
+            'version_1_5_seconds': legacy_seconds,
+            'seconds': seconds,
+            'speedup': legacy_seconds / seconds,
+        }
+    return {'identical': identical, 'rows': rows}
+
+# Helper function to compare version 1.5 and current PHP extraction throughput
+def compare_php(work_dir, repeats, repo_settings, options):
+    ### Return the MB/s of the version 1.5 extract_functions and of the current one on the PHP regression corpus and on a large
+    ### synthetic PHP file, and whether both find the same definitions in every file.
+    rng = random.Random(repo_settings.get('seed', SEED))
+    synthetic_path = os.path.join(work_dir, 'large.php')
+    with open(synthetic_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(synthetic_php_file(rng, options.get('large_file_functions', LARGE_FILE_FUNCTIONS)))
+    file_sets = {
+        'corpus': sorted(os.path.join(PHP_CORPUS_DIR, name) for name in os.listdir(PHP_CORPUS_DIR) if name.endswith('.php')),
+        'synthetic': [synthetic_path],
+    }
+    rows = {}
+    identical = True
+    for label, file_paths in file_sets.items():
+        size = sum(os.path.getsize(file_path) for file_path in file_paths)
+        legacy_seconds, _ = measure(lambda: [legacy.legacy_extract_functions(file_path, 'php') for file_path in file_paths], repeats, trace_memory=False)
+        seconds, _ = measure(lambda: [psg.extract_functions(file_path, 'php') for file_path in file_paths], repeats, trace_memory=False)
+        for file_path in file_paths:
+            expected = legacy.strip_method_lines(legacy.legacy_extract_functions(file_path, 'php'))
+            identical = identical and legacy.strip_method_lines(psg.extract_functions(file_path, 'php')) == expected
+        rows[label] = {
+            'files': len(file_paths),
+            'bytes': size,
+            'version_1_5_mb_per_second': size / (1 << 20) / legacy_seconds,
+            'mb_per_second': size / (1 << 20) / seconds,
+            'speedup': legacy_seconds / seconds,
+        }
+    return {'identical': identical, 'rows': rows}
+
+# Helper function to run one generator in a fresh process and report its memory
+def measure_generator_rss(generator, project_dir, output_dir):
+    ### Run the version 1.5 generator ('version 1.5') or the current one with ('symbol index') or without ('streaming') its symbol
+    ### index on project_dir, writing the tree, functions and combined outputs, and return (peak RSS before the run, peak RSS
+    ### after it) in bytes. Meant to run in a fresh process, whose peak RSS covers nothing else.
+    scale = 1 if sys.platform == 'darwin' else 1024  # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    arguments = dict(
+        project_dir=project_dir,
+        ignore_dirs=psg.IGNORE_DIRS,
+        ignore_files=psg.IGNORE_FILES,
+        extensions_to_include=EXTENSIONS_TO_INCLUDE,
+        patterns=psg.PATTERNS,
+        special_dir_patterns=psg.SPECIAL_DIR_PATTERNS,
+        languages=LANGUAGES,
+        output_file=os.path.join(output_dir, 'project_structure.txt'),
+        functions_file=os.path.join(output_dir, 'functions.txt'),
+        combined_file=os.path.join(output_dir, 'combined_structure.txt'),
+        export_structure=True,
+        export_functions=True,
+        export_combined=True,
+        return_folders_only=False,
+        max_depth=psg.MAX_DEPTH,
+        include_all_files=False
+    )
+    psg.DOCUMENTATION_DIR = output_dir  # The combined writer creates DOCUMENTATION_DIR.
+    with contextlib.redirect_stdout(io.StringIO()):
+        if generator == 'version 1.5':
+            legacy.legacy_generate_project_structure(**arguments)
+        else:
+            psg.generate_project_structure(**arguments, symbol_index=generator == 'symbol index')
+    return before, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+# Helper function to compare the memory of the version 1.5 and current generators as the repository grows
+def compare_memory(work_dir, repeats, repo_settings, options):
+    ### Return the peak RSS growth of the version 1.5 generator and of the current one, with and without its symbol index, on
+    ### synthetic repositories of each depth in options['memory_depths']. Every run gets a fresh process, so tracemalloc's blind
+    ### spots (C allocations, worker processes) do not apply; RSS is also noisier, so look at the trend rather than single values.
+    rows = {}
+    context = multiprocessing.get_context('spawn')
+    for depth in options.get('memory_depths', MEMORY_DEPTHS):
+        project_dir = os.path.join(work_dir, f'synthetic_repo_{depth}')
+        stats = generate_synthetic_repo(project_dir, **dict(repo_settings, depth=depth))
+        row = {'source_files': stats['source_files'], 'source_bytes': stats['source_bytes']}
+        for generator in ('version 1.5', 'streaming', 'symbol index'):
+            output_dir = os.path.join(work_dir, f'docs_{depth}_{generator.replace(" ", "_")}')
+            os.makedirs(output_dir)
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                before, after = executor.submit(measure_generator_rss, generator, project_dir, output_dir).result()
+            row[f"{generator.replace(' ', '_').replace('.', '_')}_rss_growth_bytes"] = after - before
+        shutil.rmtree(project_dir)
+        rows[f'depth {depth}'] = row
+    return {'rows': rows}
+
+# Helper function to parse the file entries of a text export
+def parse_text_export(text_file):
+    ### Return the file entries of functions.txt or of the File Structure section of combined_structure.txt, the way a downstream
+    ### tool without the structured exports has to: line by line, with comments and descriptions continuing on the following lines.
+    entries = []
+    entry = None
+    target = None  # Entry field, or function, that a continuation line belongs to.
+    with open(text_file, encoding='utf-8') as f:
+        lines = iter(f)
+        if os.path.basename(text_file).startswith('combined'):
+            for line in lines:
+                if line == 'File Structure:\n':
+                    break
+        for line in lines:
+            stripped = line.strip()
+            file_match = re.match(r'File: (.*) \((python|php|javascript)\)', stripped)
+            if file_match:
+                entry = {'file': file_match.group(1), 'language': file_match.group(2), 'functions': [], 'classes': [], 'file_description': ''}
+                entries.append(entry)
+                target = None
+            elif entry is None or not stripped:
+                continue
+            elif stripped.startswith('Class: '):
+                entry['classes'].append({'name': stripped[7:], 'functions': []})
+            elif stripped.startswith('Function: '):
+                function_match = re.match(r'Function: (.*) \(Line (\d+)\)$', stripped)
+                if function_match:
+                    target = {'name': function_match.group(1), 'line': int(function_match.group(2)), 'comment': ''}
+                    entry['functions'].append(target)
+                else:
+                    target = {'name': stripped[10:], 'comment': ''}
+                    entry['classes'][-1]['functions'].append(target)
+            elif stripped.startswith('- Function Description: '):
+                target['comment'] = stripped[24:]
+            elif stripped.startswith(('File Description: ', '- File Description: ')):
+                entry['file_description'] = stripped.split(': ', 1)[1]
+                target = entry
+            elif target is entry:
+                entry['file_description'] += '\n' + line.rstrip('\n')
+            elif target is not None:
+                target['comment'] += '\n' + line.rstrip('\n')
+    return entries
+
+# Helper function to list the definitions of file entries
+def entry_definitions(entries):
+    ### Return (file, class name or '', function name) of every function and method of the entries, to compare exports by.
+    return [(entry['file'], cls['name'], func['name']) for entry in entries for cls in entry['classes'] for func in cls['functions']] + [(entry['file'], '', func['name']) for entry in entries for func in entry['functions']]
+
+# Helper function to load every record of the binary export
+def load_binary_export(binary_file):
+    ### Return the entries of every file in the binary export, looked up one file at a time.
+    with psg.BinaryExportReader(binary_file) as reader:
+        return [entry for relative_file_path in reader.files() for entry in reader.get(relative_file_path)]
+
+# Helper function to compare how long downstream tools take to load the exports
+def compare_load(work_dir, repeats, repo_settings, options):
+    ### Return the time to load every file entry from functions.txt, combined_structure.txt, functions.jsonl and functions.bin of
+    ### the synthetic repository, and to look up a single file in the binary export, with the speedup over parsing functions.txt.
+    ### The text exports have to be parsed in full even to find one file. Also checks that every export holds the same definitions.
+    project_dir = os.path.join(work_dir, 'synthetic_repo')
+    output_dir = os.path.join(work_dir, 'docs')
+    generate_synthetic_repo(project_dir, **repo_settings)
+    os.makedirs(output_dir)
+    run_generator(project_dir, output_dir, LANGUAGES, True, 1)
+    functions_file, combined_file = os.path.join(output_dir, 'functions.txt'), os.path.join(output_dir, 'combined_structure.txt')
+    jsonl_file, binary_file = os.path.join(output_dir, 'functions.jsonl'), os.path.join(output_dir, 'functions.bin')
+
+    # Helper function to load the JSON Lines export
+    def load_jsonl():
+        with open(jsonl_file, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    entries = load_jsonl()
+    middle_file = entries[len(entries) // 2]['file']
+
+    # Helper function to look up one file in the binary export
+    def lookup_binary():
+        with psg.BinaryExportReader(binary_file) as reader:
+            return reader.get(middle_file)
+
+    loaders = {
+        'functions.txt': lambda: parse_text_export(functions_file),
+        'combined_structure.txt': lambda: parse_text_export(combined_file),
+        'functions.jsonl': load_jsonl,
+        'functions.bin': lambda: load_binary_export(binary_file),
+        'functions.bin lookup': lookup_binary,
+    }
+    rows = {}
+    identical = True
+    for label, load in loaders.items():
+        seconds, _ = measure(load, repeats, trace_memory=False)
+        loaded = load()
+        if label != 'functions.bin lookup':
+            identical = identical and sorted(entry_definitions(loaded)) == sorted(entry_definitions(entries))
+        rows[label] = {
+            'bytes': os.path.getsize(binary_file if label.startswith('functions.bin') else os.path.join(output_dir, label)),
+            'entries': len(loaded),
+            'seconds': seconds,
+            'speedup': rows['functions.txt']['seconds'] / seconds if rows else 1.0,
+        }
+    return {'identical': identical, 'files': len(entries), 'rows': rows}
+
+# Helper function to compare version 1.5 name classification with NameMatcher
+def compare_matcher(work_dir, repeats, repo_settings, options):
+    ### Return the time to classify the names of a directory with options['matcher_files'] files with the version 1.5 per-pattern
+    ### checks and with NameMatcher, and to run each generator's tree-only pass over that directory, and whether both classify
+    ### every name the same way.
+    project_dir = os.path.join(work_dir, 'large_directory')
+    os.makedirs(project_dir)
+    for name in synthetic_names(random.Random(repo_settings.get('seed', SEED)), options.get('matcher_files', MATCHER_FILES)):
+        os.close(os.open(os.path.join(project_dir, name), os.O_CREAT | os.O_WRONLY, 0o644))
+    names = os.listdir(project_dir)
+    extensions = EXTENSIONS_TO_INCLUDE + ('.csv',)  # Data files are included so names go through the grouping PATTERNS.
+    matcher = psg.NameMatcher(psg.IGNORE_DIRS, psg.IGNORE_FILES, psg.SPECIAL_DIR_PATTERNS, psg.PATTERNS, extensions, LANGUAGES, False)
+    compiled_ignore_file_patterns = legacy.legacy_compile_ignore_patterns(psg.IGNORE_FILES)
+    compiled_patterns = [re.compile(pattern_str) for pattern_str in psg.PATTERNS]
+
+    # Helper function to classify every name the way version 1.5 did
+    def legacy_classify():
+        return [legacy.legacy_classify_file(name, compiled_ignore_file_patterns, extensions, False, compiled_patterns, LANGUAGES) for name in names]
+
+    output_dir = os.path.join(work_dir, 'docs')
+    os.makedirs(output_dir)
+
+    # Helper function to run the version 1.5 generator's tree-only pass, writing project_structure.txt like run_generator() does
+    def legacy_tree():
+        with contextlib.redirect_stdout(io.StringIO()):
+            legacy.legacy_generate_project_structure(project_dir, psg.IGNORE_DIRS, psg.IGNORE_FILES, EXTENSIONS_TO_INCLUDE, psg.PATTERNS, psg.SPECIAL_DIR_PATTERNS, [], os.path.join(output_dir, 'legacy_structure.txt'), None, None, True, False, False, False, psg.MAX_DEPTH, False)
+
+    runs = {
+        'classify': (legacy_classify, lambda: [matcher.classify_file(name) for name in names]),
+        'tree': (legacy_tree, lambda: run_generator(project_dir, output_dir, [], False, 1)),
+    }
+    rows = {}
+    for label, (legacy_run, run) in runs.items():
+        legacy_seconds, _ = measure(legacy_run, repeats, trace_memory=False)
+        seconds, _ = measure(run, repeats, trace_memory=False)
+        rows[label] = {'version_1_5_seconds': legacy_seconds, 'seconds': seconds, 'speedup': legacy_seconds / seconds}
+    return {'files': len(names), 'identical': legacy_classify() == [matcher.classify_file(name) for name in names], 'rows': rows}
+
+COMPARISON_RUNNERS = {'workers': compare_workers, 'walk-syscalls': compare_walk_syscalls, 'line-index': compare_line_index, 'php': compare_php, 'memory': compare_memory, 'load': compare_load, 'matcher': compare_matcher}  # Function running each comparison.
+
+# Helper function to run the comparisons
+def run_comparisons(work_dir, comparisons=COMPARISONS, repeats=REPEATS, repo_settings=None, options=None):
+    ### Run each comparison in its own subdirectory of work_dir and return the report with one result per comparison;
+    ### options holds the settings of individual comparisons (such as worker_counts) that override the defaults above.
+    repo_settings = repo_settings or {}
+    options = options or {}
+    results = {}
+    for comparison in comparisons:
+        comparison_dir = os.path.join(work_dir, comparison)
+        os.makedirs(comparison_dir)
+        results[comparison] = COMPARISON_RUNNERS[comparison](comparison_dir, repeats, repo_settings, options)
+    return {
+        'generator_version': psg.GENERATOR_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'settings': dict(repo_settings, repeats=repeats, **options),
+        'comparisons': results,
+    }
+
+# Helper function to format the measurements of one comparison row
+def format_row(measurements):
+    ### Return the measurements as 'name value' pairs, with floats rounded to three significant digits.
+    return ', '.join(f"{name} {value:.3g}" if isinstance(value, float) else f"{name} {value}" for name, value in measurements.items())
+
+# Helper function to compare a report with a baseline
+def find_regressions(report, baseline, threshold=REGRESSION_THRESHOLD):
+    ### Return a message for every scenario whose throughput dropped, or peak memory grew, by more than threshold.
+    regressions = []
+    if baseline.get('repository') != report['repository']:
+        regressions.append("Synthetic repository differs from the baseline's; regenerate the baseline with --save-baseline")
+        return regressions
+    for scenario, result in report['results'].items():
+        previous = baseline.get('results', {}).get(scenario)
+        if previous is None:
+            continue
+        if result['files_per_second'] < previous['files_per_second'] * (1 - threshold):
+            regressions.append(f"{scenario}: {result['files_per_second']:.0f} files/s, baseline {previous['files_per_second']:.0f} files/s")
+        if result['peak_memory_bytes'] > previous['peak_memory_bytes'] * (1 + threshold):
+            regressions.append(f"{scenario}: peak memory {result['peak_memory_bytes']} bytes, baseline {previous['peak_memory_bytes']} bytes")
+    return regressions
+
+# Helper function to parse command line options
+def parse_arguments():
+    ### Parse command line options that override the benchmark settings.
+    parser = argparse.ArgumentParser(description='Benchmark the project structure generator on a deterministic synthetic repository.')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='Baseline file to compare against or save to (default: %(default)s).')
+    parser.add_argument('--save-baseline', action='store_true', help='Save the results as the new baseline instead of comparing.')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, help='Allowed fractional regression before failing (default: %(default)s).')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=SCENARIOS, help='Scenarios to run (default: all).')
+    parser.add_argument('--compare', nargs='+', choices=COMPARISONS, help='Run these comparisons instead of the scenarios; nothing is checked against the baseline.')
+    parser.add_argument('--repeats', type=int, default=REPEATS, help='Minimum timed runs per scenario; the fastest is kept (default: %(default)s).')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes used for extraction (default: %(default)s).')
+    parser.add_argument('--seed', type=int, default=SEED, help='Seed of the synthetic repository (default: %(default)s).')
+    parser.add_argument('--depth', type=int, default=DEPTH, help='Directory levels below the root (default: %(default)s).')
+    parser.add_argument('--fan-out', type=int, default=FAN_OUT, help='Subdirectories per directory (default: %(default)s).')
+    parser.add_argument('--files-per-dir', type=int, default=FILES_PER_DIR, help='Source files per directory (default: %(default)s).')
+    parser.add_argument('--worker-counts', type=int, nargs='+', default=WORKER_COUNTS, help='Worker counts timed by the workers comparison (default: %(default)s).')
+    parser.add_argument('--walk-entries', type=int, default=WALK_ENTRIES, help='Files and directories in the tree of the walk-syscalls comparison (default: %(default)s).')
+    parser.add_argument('--large-file-functions', type=int, default=LARGE_FILE_FUNCTIONS, help='Functions in each large file of the line-index comparison (default: %(default)s).')
+    parser.add_argument('--memory-depths', type=int, nargs='+', default=MEMORY_DEPTHS, help='Depths of the growing repositories of the memory comparison (default: %(default)s).')
+    parser.add_argument('--matcher-files', type=int, default=MATCHER_FILES, help='Files in the directory of the matcher comparison (default: %(default)s).')
+    parser.add_argument('--output', help='Also write the results to this JSON file.')
+    return parser.parse_args()
+
+# Entry point of the script.
+if __name__ == '__main__':
+    args = parse_arguments()
+    work_dir = tempfile.mkdtemp(prefix='project_structure_benchmark_')
+    repo_settings = {'seed': args.seed, 'depth': args.depth, 'fan_out': args.fan_out, 'files_per_dir': args.files_per_dir}
+    if args.compare:
+        try:
+            report = run_comparisons(work_dir, args.compare, args.repeats, repo_settings, {'worker_counts': args.worker_counts, 'walk_entries': args.walk_entries, 'large_file_functions': args.large_file_functions, 'memory_depths': args.memory_depths, 'matcher_files': args.matcher_files})
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        for comparison, result in report['comparisons'].items():
+            print(f"{comparison}: {format_row({name: value for name, value in result.items() if name != 'rows'})}")
+            for label, measurements in result['rows'].items():
+                print(f"  {label}: {format_row(measurements)}")
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        # Comparisons that check their results report whether both sides agree.
+        sys.exit(0 if all(result.get('identical', True) for result in report['comparisons'].values()) else 1)
+    try:
+        report = run_benchmarks(work_dir, args.scenarios, args.repeats, args.workers, repo_settings)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for scenario, result in report['results'].items():
+        print(f"{scenario}: {result['seconds']:.3f}s, {result['files_per_second']:.0f} files/s, {result['mb_per_second']:.2f} MB/s, peak memory {result['peak_memory_bytes'] / (1 << 20):.1f} MB")
+    if args.workers > 1:
+        print(f"Peak memory covers the {report['peak_memory_scope']}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Benchmark baseline has been saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = find_regressions(report, json.load(f), args.threshold)
+        for message in regressions:
+            print(f"Regression: {message}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+    else:
+        print(f"No baseline found at {args.baseline}; run with --save-baseline to create one")
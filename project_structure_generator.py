@@ -1,6 +1,24 @@
 import os  # Import os module for interacting with the operating system.
 import re  # Import re module for regular expressions.
 import fnmatch  # Import fnmatch module for wildcard matching.
+import argparse  # Import argparse module for command line options.
+import json  # Import json module for serializing cached extraction results.
+import hashlib  # Import hashlib module for hashing file contents.
+import sqlite3  # Import sqlite3 module for the on-disk extraction cache.
+import subprocess  # Import subprocess module for listing files with git.
+import shutil  # Import shutil module for copying spooled output.
+import tempfile  # Import tempfile module for spooling output sections.
+import mmap  # Import mmap module for reading the binary export without loading it.
+import struct  # Import struct module for the binary export layout.
+import zlib  # Import zlib module for the stable hash that assigns subtrees to shards.
+import time  # Import time module for profiling timers.
+import heapq  # Import heapq module for keeping the slowest files of a profiled run.
+import cProfile  # Import cProfile module for optional profiler statistics dumps.
+import sys  # Import sys module for the byte order of the symbol index columns.
+from array import array  # Import array for the compact columns of the symbol index.
+from bisect import bisect_left, bisect_right  # Import bisect functions for position lookups.
+from collections import deque  # Import deque for tracking in-flight extraction chunks.
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # Import executors for parallel extraction and file prefetching.
 
 # Configuration settings
 PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))  # Root directory of the project (current directory of this file).
@@ -11,6 +29,13 @@ COMBINED_FILE = f"{DOCUMENTATION_DIR}/combined_structure.txt"  # Output file pat
 EXPORT_STRUCTURE = False  # Whether to export the project structure file.
 EXPORT_FUNCTIONS = False  # Whether to export the functions file.
 EXPORT_COMBINED = True  # Whether to export the combined file.
+JSONL_FILE = f"{DOCUMENTATION_DIR}/functions.jsonl"  # Output file path for functions as JSON Lines.
+BINARY_FILE = f"{DOCUMENTATION_DIR}/functions.bin"  # Output file path for functions in the indexed binary format.
+EXPORT_JSONL = False  # Whether to export the JSON Lines file.
+EXPORT_BINARY = False  # Whether to export the indexed binary file.
+SYMBOLS_FILE = f"{DOCUMENTATION_DIR}/symbols.idx"  # Output file path for the symbol index.
+EXPORT_SYMBOLS = False  # Whether to save the symbol index.
+SYMBOL_INDEX = True  # Whether generate_project_structure() builds the symbol index it returns; saving it always builds it.
 RETURN_FOLDERS_ONLY = False  # If True, only include folder names in the output.
 INCLUDE_ALL_FILES = False  # If True, include all files regardless of extensions.
 MAX_DEPTH = 18  # Maximum depth for directory traversal.
@@ -20,388 +45,2405 @@ EXTENSIONS_TO_INCLUDE = ('.js','.php', '.css')  # File extensions to include in
 PATTERNS = [r'links_(\d+)-(\d+)\.csv', r'part_\d+\.csv', r'links_\d+\.csv', r'(.*)_part_(\d+)\.csv']  # Patterns for identifying unique files.
 SPECIAL_DIR_PATTERNS = [r'run_\d+']  # Patterns for special directories.
 LANGUAGES = ['python', 'php', 'javascript']  # Languages to process for function and class extraction.
+WORKERS = 1  # Number of worker processes used for function and class extraction (1 = serial).
+EXTRACTION_CHUNK_SIZE = 64  # Number of files sent to a worker process at a time.
+PREFETCH_THREADS = 0  # Number of threads reading upcoming files while the current one is parsed (0 = no prefetching).
+PREFETCH_BYTES = 64 << 20  # Budget, in bytes, of file contents read ahead of extraction.
+MMAP_THRESHOLD = 4 << 20  # Files at least this large, in bytes, are read through mmap instead of a buffered read.
+MAX_FILE_BYTES = 8 << 20  # Files larger than this, in bytes, are truncated to the whole lines within their first MAX_FILE_BYTES before extraction (None = no limit).
+MAX_FILE_SECONDS = 10.0  # Extraction of a single file is abandoned, and the file skipped, after this many seconds (None = no limit).
+MINIFIED_LINE_LENGTH = 500  # Files whose average line is longer than this many characters are treated as minified or generated and skipped.
+MINIFIED_MIN_BYTES = 4096  # Files shorter than this are never treated as minified.
+USE_CACHE = False  # If True, reuse cached extraction results for files that have not changed since the last run.
+CACHE_FILE = f"{DOCUMENTATION_DIR}/.extraction_cache.sqlite"  # Output file path for the extraction cache.
+GENERATOR_VERSION = '1.6'  # Version of the generator, used to invalidate the extraction cache.
+WRITE_BUFFER_SIZE = 1 << 20  # Buffer size, in bytes, of the output files.
+SPOOL_MAX_SIZE = 8 << 20  # Bytes of combined output kept in memory while the tree section is still being written, before spilling to a temporary file.
+BINARY_MAGIC = b'PSGB'  # Magic bytes at the start and end of the binary export.
+BINARY_VERSION = 1  # Layout version of the binary export.
+BINARY_HEADER = struct.Struct('<4sHH')  # Magic, layout version, reserved.
+BINARY_INDEX_ENTRY = struct.Struct('<QIQI')  # Path offset, path length, record offset, record length.
+BINARY_FOOTER = struct.Struct('<QI4s')  # Index offset, entry count, magic.
+SYMBOLS_MAGIC = b'PSGS'  # Magic bytes at the start of a saved symbol index.
+SYMBOLS_VERSION = 1  # Layout version of the saved symbol index.
+SYMBOLS_HEADER = struct.Struct('<4sHH')  # Magic, layout version, reserved.
+SYMBOLS_SECTION = struct.Struct('<Q')  # Length of the section that follows.
+SYMBOL_KINDS = ('function', 'class', 'method')  # Kinds of symbol, stored in the index by position.
+FILE_SOURCE = 'walk'  # Where files are enumerated from: 'walk' lists the file system, 'git' reads the files tracked in the git index.
+SHARD = None  # If set to (index, count), only the root (shard 0) and the top-level directories hashed to shard index of count are processed, and partial results are written to SHARD_FILE.
+SHARD_FILE = f"{DOCUMENTATION_DIR}/shard_{{index}}_of_{{count}}.jsonl"  # Output file path for the partial results of a shard, merged by merge_shards().
+SINCE_REVISION = None  # If set to a git revision, only files changed since it are extracted again; the rest come from the extraction cache.
+WATCH = False  # If True, keep running after the first pass and rewrite the outputs whenever files change.
+WATCH_INTERVAL = 1.0  # Seconds between two polls of the watched directories and files.
+WATCH_DEBOUNCE = 0.5  # Seconds without further changes before the outputs are rewritten, so a burst of saves triggers a single rewrite.
+PROFILE = False  # If True, record per-phase and per-language timings and counters and save them as a JSON report.
+PROFILE_FILE = f"{DOCUMENTATION_DIR}/profile_report.json"  # Output file path for the profiling report.
+PROFILE_STATS = False  # If True, also run the generator under cProfile and dump its statistics (requires PROFILE).
+PROFILE_STATS_FILE = f"{DOCUMENTATION_DIR}/profile.pstats"  # Output file path for the cProfile statistics.
+PROFILE_TOP_FILES = 20  # Number of slowest files listed in the profiling report.
+EXTRACTOR_REVISION = 3  # Revision of the extraction results, bumped whenever extract_functions output changes to invalidate the extraction cache.
 
-def generate_project_structure(project_dir,ignore_dirs,ignore_files,extensions_to_include,patterns,special_dir_patterns,languages,output_file,functions_file,combined_file,export_structure,export_functions,export_combined,return_folders_only,max_depth,include_all_files):
-    ### Generate the project structure, extract functions/classes, and save to specified output files.
-    tree = [os.path.basename(os.path.normpath(project_dir)) + "/"]  # Initialize the tree representation with the root directory.
-    functions_data = []  # List to store function and class information for functions.txt
-
-    # Compile all patterns from the provided list.
-    compiled_patterns = [re.compile(pattern_str) for pattern_str in patterns]
-    compiled_special_patterns = [re.compile(pattern) for pattern in special_dir_patterns]
-    compiled_ignore_dir_patterns = [re.compile(fnmatch.translate(ignore)) for ignore in ignore_dirs]  # Compile ignore directory patterns.
-    compiled_ignore_file_patterns = [re.compile(fnmatch.translate(ignore)) for ignore in ignore_files]  # Compile ignore file patterns.
-
-    # Language-specific regex patterns for function and class extraction
-    language_patterns = {
-        'python': {
-            'extensions': ('.py',),
-            'function_regex': r'(?:^|\n)(?:[ \t]*#.*\n)*[ \t]*def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\([^)]*\)\s*:',
-            'comment_regex': r'((?:^[ \t]*#.*\n)*)[ \t]*def\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*:',
-        },
-        'php': {
-            'extensions': ('.php',),
-            'class_regex': r'(?:^|\n)(?:[ \t]*\/\*\*.*?\*\/[ \t]*\n)?[ \t]*(?:abstract\s+)?class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends\s+[a-zA-Z_][a-zA-Z0-9_]*\s*)?(?:implements\s+[a-zA-Z_][a-zA-Z0-9_]*(?:\s*,\s*[a-zA-Z_][a-zA-Z0-9_]*)*\s*)?{',
-            'function_regex': r'(?:^|\n)[ \t]*(?:public|private|protected)?\s*(?:static\s+)?function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\([^)]*\)\s*(?::\s*[a-zA-Z_][a-zA-Z0-9_]*(?:\|\s*[a-zA-Z_][a-zA-Z0-9_]*)*\s*)?{\s*(?:[ \t]*\/\*\*\*[\s\S]*?\*\*\*[ \t]*\n)?',
-            'comment_regex': r'function\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*\{\s*(\/\*\*\*[\s\S]*?\*\*\*\/)',
-            'file_description_regex': r'<\?php\s*\n\/\*\*\s*\n\s*\*\s*Description:\s*(.*?)\s*\n\s*\*\s*File:.*?\*\/',
-        },
-        'javascript': {
-            'extensions': ('.js',),
-            'function_regex': r'(?:^|\n)(?:[ \t]*//.*\n|[ \t]*\/\*[^*]*\*\/[ \t]*\n)*[ \t]*(?:function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\([^)]*\)|([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*function\s*\([^)]*\)|([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\([^)]*\)\s*=>)\s*{',
-            'comment_regex': r'function\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*\{\s*(\/\*\*\*[\s\S]*?\*\*\*\/)',
-            'file_description_regex': r'\/\*\*\s*\n\s*\*[^\n]*\n\s*\*\s*File:.*?\n\s*\*\s*@version.*?\n\s*\*\s*@description\s*(.*?)\s*\n\s*\*\/',
-        }
+# Language-specific regex patterns for function and class extraction
+LANGUAGE_PATTERNS = {
+    'python': {
+        'extensions': ('.py',),
+        'function_regex': r'(?:^|\n)(?:[ \t]*#.*\n)*[ \t]*def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\([^)]*\)\s*:',
+        'comment_regex': r'((?:^[ \t]*#.*\n)*)[ \t]*def\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*:',
+    },
+    'php': {
+        'extensions': ('.php',),
+        'class_regex': r'(?:^|\n)(?:[ \t]*\/\*\*.*?\*\/[ \t]*\n)?[ \t]*(?:abstract\s+)?class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends\s+[a-zA-Z_][a-zA-Z0-9_]*\s*)?(?:implements\s+[a-zA-Z_][a-zA-Z0-9_]*(?:\s*,\s*[a-zA-Z_][a-zA-Z0-9_]*)*\s*)?{',
+        'function_regex': r'(?:^|\n)[ \t]*(?:public|private|protected)?\s*(?:static\s+)?function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\([^)]*\)\s*(?::\s*[a-zA-Z_][a-zA-Z0-9_]*(?:\|\s*[a-zA-Z_][a-zA-Z0-9_]*)*\s*)?{\s*',
+        'function_doc_terminator_regex': r'\*\*\*[ \t]*\n',  # A /*** block right after a function's opening brace is consumed up to this terminator.
+        'comment_regex': r'function\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*\{\s*(\/\*\*\*[\s\S]*?\*\*\*\/)',
+        'file_description_regex': r'<\?php\s*\n\/\*\*\s*\n\s*\*\s*Description:\s*(.*?)\s*\n\s*\*\s*File:.*?\*\/',
+    },
+    'javascript': {
+        'extensions': ('.js',),
+        'function_regex': r'(?:^|\n)(?:[ \t]*//.*\n|[ \t]*\/\*[^*]*\*\/[ \t]*\n)*[ \t]*(?:function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\([^)]*\)|([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*function\s*\([^)]*\)|([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\([^)]*\)\s*=>)\s*{',
+        'comment_regex': r'function\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*\{\s*(\/\*\*\*[\s\S]*?\*\*\*\/)',
+        'file_description_regex': r'\/\*\*\s*\n\s*\*[^\n]*\n\s*\*\s*File:.*?\n\s*\*\s*@version.*?\n\s*\*\s*@description\s*(.*?)\s*\n\s*\*\/',
     }
+}
 
-    # Validate provided languages and filter based on extensions_to_include
-    valid_languages = language_patterns.keys()
-    processed_languages = []
-    for lang in languages:
-        if lang not in valid_languages:
-            print(f"Warning: Language '{lang}' is not supported. Supported languages: {', '.join(valid_languages)}")
-        elif any(ext in extensions_to_include for ext in language_patterns[lang]['extensions']):
-            processed_languages.append(lang)
+# Helper function to index the newlines of a file
+def build_line_index(content):
+    ### Return the offsets of every newline in the content, computed once per file.
+    return [match.start() for match in re.finditer('\n', content)]
+
+# Helper function to turn matched functions into function entries
+def build_function_entries(function_list, comment_list, line_index, comment_after):
+    ### Pair each (name, start) function with its closest comment in one merge pass over the sorted positions.
+    ### PHP comments follow the function start (comment_after=True); Python/JavaScript comments precede it.
+    entries = []
+    comment_index = 0
+    for func_name, func_start in function_list:
+        if comment_after:
+            while comment_index < len(comment_list) and comment_list[comment_index][1] <= func_start:
+                comment_index += 1
+            closest_comment = comment_list[comment_index][0] if comment_index < len(comment_list) else ''
         else:
-            print(f"Warning: Language '{lang}' skipped as its extensions are not in extensions_to_include")
+            while comment_index < len(comment_list) and comment_list[comment_index][1] < func_start:
+                comment_index += 1
+            closest_comment = comment_list[comment_index - 1][0] if comment_index > 0 else ''
+        entries.append({
+            'name': func_name,
+            'comment': closest_comment,
+            'line': bisect_left(line_index, func_start) + 1  # Number of newlines before func_start, plus one.
+        })
+    return entries
 
-    # Helper function to check if a directory matches any special pattern.
-    def is_special_directory(directory):
-        ### Check if the directory matches any special pattern.
-        return any(re.match(pattern, directory) for pattern in compiled_special_patterns)
+# Exception raised when a file runs past its extraction time budget
+class ExtractionTimeout(Exception):
+    ### Raised by check_deadline() and caught by extract_functions(), which skips the file.
+    pass
 
-    # Helper function to check if a directory should be ignored based on ignore_patterns.
-    def should_ignore_directory(directory):
-        ### Check if the directory should be ignored based on patterns.
-        return any(pattern.match(directory) for pattern in compiled_ignore_dir_patterns)
-
-    # Helper function to check if a file should be ignored based on ignore_file_patterns.
-    def should_ignore_file(file):
-        ### Check if the file should be ignored based on patterns.
-        return any(pattern.match(file) for pattern in compiled_ignore_file_patterns)
-
-    # Helper function to find the end of a class (matching braces)
-    def find_class_end(content, start_pos):
-        ### Find the end of a class by matching braces.
-        brace_count = 1
-        pos = start_pos
-        while pos < len(content) and brace_count > 0:
-            if content[pos] == '{':
-                brace_count += 1
-            elif content[pos] == '}':
-                brace_count -= 1
-            pos += 1
-        return pos if brace_count == 0 else len(content)
-
-    # Helper function to extract functions and classes from a file
-    def extract_functions(file_path, language):
-        ### Extract functions, classes, and file descriptions from a file based on the specified language.
-        if language not in language_patterns:
-            return {'functions': [], 'classes': [], 'file_description': ''}
+# Helper function to enforce the extraction time budget
+def check_deadline(deadline):
+    ### Raise ExtractionTimeout once time.monotonic() has passed deadline (None means no budget).
+    if deadline is not None and time.monotonic() > deadline:
+        raise ExtractionTimeout()
+
+# Helper function to complete definition heads whose arguments run to the next ')'
+def make_definition_matcher(content, tail_regexes):
+    ### Return complete(head_match) -> (name, end) or None for heads ending with '(' whose group i + 1 is followed by tail_regexes[i].
+    ### Heads are completed in order, so the closing ')' is found once for every head before it and each tail is tried once
+    ### per ')', where the regex would rescan the rest of the file for each unclosed '('.
+    tails = [re.compile(tail) for tail in tail_regexes]
+    closing = [len(content) + 1, -1]  # Position the last ')' was searched from (past the end before the first search), and the ')' found there (-1 when there is none).
+    last_tail = [None, None]  # (group, ')' position) of the last tail tried, and the end of its match or None.
+
+    # Helper function to complete one head
+    def complete(head_match):
+        ### Return (name, end) when the arguments and tail follow the head, else None.
+        arguments_start = head_match.end()
+        if not (closing[0] <= arguments_start and (closing[1] < 0 or arguments_start <= closing[1])):
+            closing[:] = [arguments_start, content.find(')', arguments_start)]
+        if closing[1] < 0:
+            return None
+        group = head_match.lastindex
+        if last_tail[0] != (group, closing[1]):
+            tail_match = tails[group - 1].match(content, closing[1] + 1)
+            last_tail[:] = [(group, closing[1]), tail_match.end() if tail_match else None]
+        if last_tail[1] is None:
+            return None
+        return head_match.group(group), last_tail[1]
+
+    return complete
+
+# Helper function to find definitions with the comment lines above them in linear time
+def scan_commented_definitions(content, comment_unit_regexes, head_regex, tail_regexes, deadline=None):
+    ### Return the (name, start) matches re.finditer() finds for (?:^|\n)(?:COMMENT_UNIT)*[ \t]*DEFINITION, in linear time.
+    ### Comment units (anchored at line starts and ending with a newline) and definitions (head_regex, anchored at line
+    ### starts, completed by make_definition_matcher()) are each matched once; a head never spans the start of another.
+    ### A match starts at the newline before its run of comment units, or at 0; runs reaching back into the previous match
+    ### are cut short.
+    unit_ends = {}  # Line start of every comment unit -> line start after it.
+    for regex in comment_unit_regexes:
+        for match in re.finditer(regex, content, re.MULTILINE):
+            unit_ends[match.start()] = match.end()
+    complete = make_definition_matcher(content, tail_regexes)
+    definitions = {}  # Line start of every definition that matches -> (name, end).
+    for index, head in enumerate(re.finditer(head_regex, content, re.MULTILINE)):
+        if not index & 255:
+            check_deadline(deadline)
+        definition = complete(head)
+        if definition:
+            definitions[head.start()] = definition
+
+    run_ends = {}  # Line start of a comment unit -> line start where its run of units stops.
+    matches = []
+    previous_end = 0
+    for line_start in sorted(unit_ends.keys() | definitions.keys()):
+        start = line_start - 1 if line_start else 0  # The newline before the line, or the start of the file.
+        if start < previous_end:
+            continue
+        position = line_start
+        if position in unit_ends:
+            run = []
+            while position in unit_ends and position not in run_ends:
+                run.append(position)
+                position = unit_ends[position]
+            position = run_ends.get(position, position)
+            for unit_start in run:
+                run_ends[unit_start] = position
+        definition = definitions.get(position)
+        if definition:
+            previous_end = definition[1]
+            matches.append((definition[0], start))
+    return matches
+
+# Helper function to find Python functions in linear time
+def scan_python_functions(content, deadline=None):
+    ### Return the (name, start) matches of LANGUAGE_PATTERNS['python']['function_regex'].
+    return scan_commented_definitions(content, (r'^[ \t]*#.*\n',), r'^[ \t]*def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', (r'\s*:',), deadline)
+
+# Helper function to find JavaScript functions in linear time
+def scan_javascript_functions(content, deadline=None):
+    ### Return the (name, start) matches of LANGUAGE_PATTERNS['javascript']['function_regex'].
+    return scan_commented_definitions(
+        content,
+        (r'^[ \t]*//.*\n', r'^[ \t]*\/\*[^*]*\*\/[ \t]*\n'),
+        r'^[ \t]*(?:function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(|([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*function\s*\(|([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\()',
+        (r'\s*{', r'\s*{', r'\s*=>\s*{'),
+        deadline
+    )
+
+# Helper function to find Python function comments in linear time
+def scan_python_comments(content, deadline=None):
+    ### Return the (comment, start) matches of LANGUAGE_PATTERNS['python']['comment_regex'].
+    ### Without MULTILINE its comment group only matches at the start of the file, so every later match has an empty
+    ### comment and starts at the blanks before a def.
+    complete = make_definition_matcher(content, (r'\s*:',))
+    matches = []
+    position = 0
+    first_line = re.match(r'[ \t]*#.*\n', content)
+    first_head = re.compile(r'[ \t]*def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(').match(content, first_line.end()) if first_line else None
+    definition = complete(first_head) if first_head else None
+    if definition:
+        matches.append((first_line.group().strip(), 0))
+        position = definition[1]
+    for index, head in enumerate(re.finditer(r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)):
+        if not index & 255:
+            check_deadline(deadline)
+        if head.start() < position:
+            continue
+        definition = complete(head)
+        if definition:
+            start = head.start()
+            while start > position and content[start - 1] in ' \t':
+                start -= 1
+            matches.append(('', start))
+            position = definition[1]
+    return matches
+
+# Helper function to find /*** function comments in linear time
+def scan_function_doc_comments(content, deadline=None):
+    ### Return the (comment, start) matches of LANGUAGE_PATTERNS['javascript']['comment_regex'].
+    ### The closing ***/ is found once with str.find() and shared by every comment opened before it.
+    complete = make_definition_matcher(content, (r'\s*\{\s*\/\*\*\*',))
+    closing = [len(content) + 1, -1]  # Position the last ***/ was searched from (past the end before the first search), and the ***/ found there (-1 when there is none).
+    matches = []
+    position = 0
+    for index, head in enumerate(re.finditer(r'function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)):
+        if not index & 255:
+            check_deadline(deadline)
+        if head.start() < position:
+            continue
+        definition = complete(head)
+        if definition:
+            opened = definition[1]  # Just past the opening /***.
+            if not (closing[0] <= opened and (closing[1] < 0 or opened <= closing[1])):
+                closing[:] = [opened, content.find('***/', opened)]
+            if closing[1] >= 0:
+                matches.append((content[opened - 4:closing[1] + 4].strip(), head.start()))
+                position = closing[1] + 4
+    return matches
+
+WHITESPACE_REGEX = re.compile(r'\s*')  # Run of whitespace, matched forward by whitespace_end().
+
+# Helper function to find where a run of whitespace ends
+def whitespace_end(content, position):
+    ### Return the position of the first non-whitespace character (as \s sees it) at or after position, or len(content).
+    return WHITESPACE_REGEX.match(content, position).end()
+
+# Helper function to find where a run of whitespace starts
+def whitespace_start(content, end, characters=None):
+    ### Return the start of the run of whitespace (or of the given characters) that ends at end.
+    start = end
+    while start > 0 and (content[start - 1] in characters if characters else content[start - 1].isspace()):
+        start -= 1
+    return start
+
+# Helper function to find tag lines of documentation comments
+def find_tag_lines(content, tag_regex):
+    ### Return (newlines, ends) for every match of tag_regex (starting with \*) whose leading whitespace holds a newline,
+    ### so that \n\s*TAG matches from each newline of that whitespace: newlines holds the last of them and ends the match end.
+    newlines, ends = [], []
+    for match in re.finditer(tag_regex, content):
+        newline = content.rfind('\n', whitespace_start(content, match.start()), match.start())
+        if newline >= 0:
+            newlines.append(newline)
+            ends.append(match.end())
+    return newlines, ends
+
+# Helper function to find the first tag line after a position
+def next_tag_line(tag_lines, position):
+    ### Return the end of the first tag line of find_tag_lines() that \n\s*TAG can match at or after position, or None.
+    newlines, ends = tag_lines
+    index = bisect_left(newlines, position)
+    return ends[index] if index < len(ends) else None
+
+# Helper function to find the JavaScript file description in linear time
+def scan_javascript_description(content, deadline=None):
+    ### Return group 1 of re.search(LANGUAGE_PATTERNS['javascript']['file_description_regex'], content, re.DOTALL), or None.
+    ### Every lazy .*? of the regex stops at the first tag line that lets the rest match, so each /** is settled with
+    ### lookups in the tag lines and comment ends found once, where the regex rescans the rest of the file for each /**.
+    version_lines = find_tag_lines(content, r'\*\s*@version')
+    description_lines = find_tag_lines(content, r'\*\s*@description')
+    closings, closing_starts = [], []  # Every */ preceded by whitespace holding a newline, and where that whitespace starts.
+    for match in re.finditer(r'\*\/', content):
+        start = whitespace_start(content, match.start())
+        if content.find('\n', start, match.start()) >= 0:
+            closings.append(match.start())
+            closing_starts.append(start)
+    for index, match in enumerate(re.finditer(r'\/\*\*', content)):
+        if not index & 255:
+            check_deadline(deadline)
+        star = whitespace_end(content, match.end())
+        if not content.startswith('*', star) or content.find('\n', match.end(), star) < 0:
+            continue
+        line_end = content.find('\n', star)
+        if line_end < 0:
+            continue
+        star = whitespace_end(content, line_end + 1)
+        label = whitespace_end(content, star + 1)
+        if not content.startswith('*', star) or not content.startswith('File:', label):
+            continue
+        version_end = next_tag_line(version_lines, label + 5)
+        description_end = next_tag_line(description_lines, version_end) if version_end is not None else None
+        if description_end is None:
+            continue
+        text_start = whitespace_end(content, description_end)
+        closing = bisect_right(closings, text_start)
+        if closing < len(closings):
+            return content[text_start:closing_starts[closing]]
+        if content.startswith('*/', text_start) and content.find('\n', description_end, text_start) >= 0:
+            return ''  # The comment closes right after the tag; the whitespace before the newline is given back to the group.
+    return None
+
+# Helper function to find the PHP file description in linear time
+def scan_php_description(content, deadline=None):
+    ### Return group 1 of re.search(LANGUAGE_PATTERNS['php']['file_description_regex'], content, re.DOTALL), or None, the
+    ### same way as scan_javascript_description().
+    file_lines = find_tag_lines(content, r'\*\s*File:')
+    file_stars = {}  # Star of every File: line -> its index in file_lines.
+    for index, end in enumerate(file_lines[1]):
+        file_stars[content.rfind('*', 0, end)] = index
+    last_closing = content.rfind('*/')
+    for index, match in enumerate(re.finditer(r'<\?php', content)):
+        if not index & 255:
+            check_deadline(deadline)
+        opening = whitespace_end(content, match.end())
+        if not content.startswith('/**', opening) or opening == match.end() or content[opening - 1] != '\n':
+            continue
+        star = whitespace_end(content, opening + 3)
+        label = whitespace_end(content, star + 1)
+        if not content.startswith('*', star) or content.find('\n', opening + 3, star) < 0 or not content.startswith('Description:', label):
+            continue
+        text_start = whitespace_end(content, label + 12)
+        line = bisect_right(file_lines[0], text_start)
+        if line < len(file_lines[0]) and file_lines[1][line] <= last_closing:
+            return content[text_start:whitespace_start(content, file_lines[0][line])]
+        line = file_stars.get(text_start)
+        if line is not None and file_lines[1][line] <= last_closing and content.find('\n', label + 12, text_start) >= 0:
+            return ''
+    return None
+
+# Helper function to find the first occurrence of a string at or after increasing positions
+def make_finder(content, needle):
+    ### Return find(position) -> content.find(needle, position), reusing the last occurrence found while positions stay
+    ### before it, so finds from increasing positions scan the file once.
+    found = [len(content) + 1, -1]  # Position the last find started from (past the end before the first find), and what it returned.
+
+    def find(position):
+        if not (found[0] <= position and (found[1] < 0 or position <= found[1])):
+            found[:] = [position, content.find(needle, position)]
+        return found[1]
+
+    return find
+
+# Helper function to find PHP functions in linear time
+def make_php_function_searcher(content, deadline=None):
+    ### Return search(position, endpos) -> (name, start, end) of LANGUAGE_PATTERNS['php']['function_regex'].search(content,
+    ### position, endpos), or None. Every "function" keyword is completed once up front, and the starts from which the regex
+    ### reaches it (the newline before its modifiers, or any newline in the whitespace before it) are worked out backwards
+    ### from it, where the regex tries every newline of a blank run and skips the whole run from each of them.
+    head_regex = re.compile(r'function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(')
+    complete = make_definition_matcher(content, (r'\s*(?::\s*[a-zA-Z_][a-zA-Z0-9_]*(?:\|\s*[a-zA-Z_][a-zA-Z0-9_]*)*\s*)?{\s*',))
+    keywords = []  # Position of every keyword that completes and can be reached.
+    definitions = []  # (name, opening brace, match end, start ranges) of those keywords.
+
+    # Helper function to list where the regex can start to reach a keyword
+    def start_ranges(keyword):
+        ### Return the start ranges of [ \t]*(?:public|private|protected)?\s*(?:static\s+)?function ending at keyword, as
+        ### (low, high, at_file_start) tuples: any newline in content[low:high] is a start, and so is the start of the file
+        ### when at_file_start is set.
+        blank = whitespace_start(content, keyword)
+        ranges = [(blank, keyword, blank == 0)]  # Only whitespace before the keyword.
+        modifier_ends = [blank]
+        if blank < keyword and content.endswith('static', 0, blank):
+            static_blank = whitespace_start(content, blank - 6)
+            ranges.append((static_blank, blank - 6, static_blank == 0))  # Whitespace, static and whitespace before the keyword.
+            modifier_ends.append(static_blank)
+        for modifier_end in modifier_ends:
+            for modifier in ('public', 'private', 'protected'):
+                if content.endswith(modifier, 0, modifier_end):
+                    indent = whitespace_start(content, modifier_end - len(modifier), ' \t')
+                    ranges.append((indent - 1, indent, False) if indent else (0, 0, True))  # Only the newline before the indent.
+        return ranges
+
+    for index, match in enumerate(re.finditer('function', content)):
+        if not index & 255:
+            check_deadline(deadline)
+        head = head_regex.match(content, match.start())
+        completed = complete(head) if head else None
+        if completed:
+            ranges = start_ranges(match.start())
+            if any(at_file_start or content.find('\n', low, high) >= 0 for low, high, at_file_start in ranges):
+                keywords.append(match.start())
+                definitions.append((completed[0], content.rfind('{', 0, completed[1]), completed[1], ranges))
+
+    def search(position, endpos):
+        # The starts of a keyword lie after every keyword before it, so only the first one from position can be
+        # unreachable; and a later keyword never closes its head before an earlier one.
+        for index in range(bisect_left(keywords, position), len(keywords)):
+            name, brace, end, ranges = definitions[index]
+            if brace >= endpos:
+                return None
+            starts = []
+            for low, high, at_file_start in ranges:
+                if at_file_start and position == 0:
+                    starts.append(0)
+                newline = content.find('\n', max(low, position), high)
+                if newline >= 0:
+                    starts.append(newline)
+            if starts:
+                return name, min(starts), min(end, endpos)
+        return None
+
+    return search
+
+# Helper function to find /*** function comments in linear time
+def make_doc_comment_searcher(content, deadline=None):
+    ### Return search(position, endpos) -> (comment, start, end) of re.search() for the stock comment_regex (shared by PHP
+    ### and JavaScript) in content[position:endpos], or None. Every "function" keyword is completed once up front, and the
+    ### closing ***/ is found once and shared like in scan_function_doc_comments().
+    head_regex = re.compile(r'function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(')
+    complete = make_definition_matcher(content, (r'\s*\{\s*\/\*\*\*',))
+    find_closing = make_finder(content, '***/')
+    keywords = []  # Position of every keyword followed by a closed /*** comment.
+    comments = []  # (start of its /***, start of its ***/) for those keywords.
+    for index, match in enumerate(re.finditer('function', content)):
+        if not index & 255:
+            check_deadline(deadline)
+        head = head_regex.match(content, match.start())
+        completed = complete(head) if head else None
+        closing = find_closing(completed[1]) if completed else -1
+        if closing >= 0:
+            keywords.append(match.start())
+            comments.append((completed[1] - 4, closing))
+
+    def search(position, endpos):
+        # A later keyword never closes its comment before an earlier one, so only the first one from position can match.
+        index = bisect_left(keywords, position)
+        if index < len(keywords) and comments[index][1] + 4 <= endpos:
+            opening, closing = comments[index]
+            return content[opening:closing + 4], keywords[index], closing + 4
+        return None
+
+    return search
+
+# Linear-time scanners for the stock Python and JavaScript patterns; customized patterns fall back to re.finditer()
+LINEAR_SCANNERS = {
+    LANGUAGE_PATTERNS['python']['function_regex']: scan_python_functions,
+    LANGUAGE_PATTERNS['python']['comment_regex']: scan_python_comments,
+    LANGUAGE_PATTERNS['javascript']['function_regex']: scan_javascript_functions,
+    LANGUAGE_PATTERNS['javascript']['comment_regex']: scan_function_doc_comments,
+}
+
+# Linear-time searchers for the stock PHP patterns, searched from varying positions; customized patterns fall back to re.search()
+LINEAR_SEARCHERS = {
+    LANGUAGE_PATTERNS['php']['function_regex']: make_php_function_searcher,
+    LANGUAGE_PATTERNS['php']['comment_regex']: make_doc_comment_searcher,
+}
+
+# Linear-time scanners for the stock file description patterns; customized patterns fall back to re.search()
+DESCRIPTION_SCANNERS = {
+    LANGUAGE_PATTERNS['php']['file_description_regex']: scan_php_description,
+    LANGUAGE_PATTERNS['javascript']['file_description_regex']: scan_javascript_description,
+}
+
+# Helper function to search a file from varying positions
+def make_searcher(pattern, content, deadline=None):
+    ### Return search(position, endpos) -> (group 1, start, end) of the first match of pattern in content[position:endpos], or None,
+    ### through the linear-time searcher of a stock pattern or else re.search(). The deadline is checked as the search goes.
+    searcher = LINEAR_SEARCHERS.get(pattern)
+    if searcher:
+        return searcher(content, deadline)
+    regex = re.compile(pattern)
+
+    def search(position, endpos):
+        check_deadline(deadline)
+        match = regex.search(content, position, endpos)
+        return (match.group(1), match.start(), match.end()) if match else None
+
+    return search
 
+# Helper function to detect minified or generated files
+def looks_minified(file_path, content, line_index):
+    ### Return True for *.min.* files and for files whose average line is longer than MINIFIED_LINE_LENGTH.
+    if '.min.' in os.path.basename(file_path):
+        return True
+    return len(content) >= MINIFIED_MIN_BYTES and len(content) > MINIFIED_LINE_LENGTH * (len(line_index) + 1)
+
+# Helper function to find the end of each class (matching braces)
+def find_class_ends(content, open_positions):
+    ### Return {open_position: end} for the given '{' positions in one pass over the braces of the file.
+    ### end is just past the matching '}', or len(content) if the brace is never closed.
+    wanted = set(open_positions)
+    ends = {}
+    stack = []  # Positions of the '{' braces that are still open.
+    for match in re.finditer(r'[{}]', content):
+        if match.group() == '{':
+            stack.append(match.start())
+        elif stack:
+            open_position = stack.pop()
+            if open_position in wanted:
+                ends[open_position] = match.end()
+    return {position: ends.get(position, len(content)) for position in open_positions}
+
+# Helper function to scan a range of a file for consecutive matches
+def scan_matches(next_match, start, end, known_matches=(), known_index=None):
+    ### Return the (..., start, end) tuples next_match() finds in content[start:end], as if that slice were scanned on its own.
+    ### Once a match lines up with one in known_matches (a scan of the whole file, indexed by start in known_index),
+    ### the following ones are reused instead of rescanned.
+    known_index = known_index or {}
+    matches = []
+    position = start
+    while True:
+        match = next_match(position, end)
+        if match is None:
+            return matches
+        matches.append(match)
+        position = match[-1]
+        index = known_index.get(match[-2])
+        if index is not None and known_matches[index][-1] == position:
+            index += 1
+            while index < len(known_matches) and known_matches[index][-1] <= end:
+                matches.append(known_matches[index])
+                position = known_matches[index][-1]
+                index += 1
+
+# Helper function to extract PHP classes and functions
+def extract_php_definitions(content, patterns, line_index, deadline=None):
+    ### Extract PHP classes (with their methods) and standalone functions from one scan of the file.
+    ### Methods are the functions found in each class's range; class ranges come from a single brace-matching pass.
+    ### The deadline is checked as the searches go, raising ExtractionTimeout once it has passed.
+    search_function = make_searcher(patterns['function_regex'], content, deadline)
+    search_comment = make_searcher(patterns['comment_regex'], content, deadline)
+    terminators = [m.start() for m in re.finditer('(?=' + patterns['function_doc_terminator_regex'] + ')', content)] if '/***' in content else []
+
+    # Helper function to find the next function
+    def next_function(position, endpos):
+        ### Return (name, start, end) of the next function, consuming a /*** block right after its opening brace up to the next terminator.
+        match = search_function(position, endpos)
+        if not match:
+            return None
+        name, start, match_end = match
+        if content.startswith('/***', match_end, endpos):
+            index = bisect_left(terminators, match_end + 4)
+            if index < len(terminators):
+                terminator_end = content.index('\n', terminators[index]) + 1
+                if terminator_end <= endpos:
+                    match_end = terminator_end
+        return name, start, match_end
+
+    # Helper function to find the next function comment
+    def next_comment(position, endpos):
+        ### Return (comment, start, end) of the next function comment.
+        match = search_comment(position, endpos)
+        if not match:
+            return None
+        comment, start, end = match
+        return comment.strip() if comment else '', start, end
+
+    function_matches = scan_matches(next_function, 0, len(content))
+    comment_matches = scan_matches(next_comment, 0, len(content))
+    function_index = {start: index for index, (_, start, _) in enumerate(function_matches)}
+    comment_index = {start: index for index, (_, start, _) in enumerate(comment_matches)}
+
+    # Extract classes and their methods
+    class_matches = list(re.finditer(patterns['class_regex'], content))
+    class_ends = find_class_ends(content, [match.end() - 1 for match in class_matches]) if class_matches else {}
+    class_ranges = []
+    classes = []
+    for match in class_matches:
+        check_deadline(deadline)  # Unclosed classes each take every method after them, so this loop can outlast the searches.
+        class_start, class_end = match.start(), class_ends[match.end() - 1]
+        class_ranges.append((class_start, class_end))
+        methods = scan_matches(next_function, class_start, class_end, function_matches, function_index)
+        method_comments = scan_matches(next_comment, class_start, class_end, comment_matches, comment_index)
+        classes.append({
+            'name': match.group(1),
+            'functions': build_function_entries([(name, start) for name, start, _ in methods], [(comment, start) for comment, start, _ in method_comments], line_index, comment_after=True),
+            'comment': ''  # Class comments not currently extracted
+        })
+
+    # Keep only functions that are not within a class, sweeping the class ranges in order
+    standalone_functions = []
+    open_ranges = []  # Class ranges that started before the current function.
+    next_class = 0
+    for func_name, func_start, _ in function_matches:
+        while next_class < len(class_ranges) and class_ranges[next_class][0] <= func_start:
+            open_ranges.append(class_ranges[next_class])
+            next_class += 1
+        open_ranges = [class_range for class_range in open_ranges if class_range[1] > func_start]
+        if not open_ranges:
+            standalone_functions.append((func_name, func_start))
+    functions = build_function_entries(standalone_functions, [(comment, start) for comment, start, _ in comment_matches], line_index, comment_after=True)
+    return functions, classes
+
+# Helper function to read a source file as text
+def read_source_file(file_path, mmap_threshold=MMAP_THRESHOLD, max_bytes=MAX_FILE_BYTES):
+    ### Read a file as UTF-8 text with universal newlines, like open(file_path, 'r', encoding='utf-8').read(), and return (content, truncated).
+    ### Files of at least mmap_threshold bytes are decoded straight from a memory map instead of a buffered copy.
+    ### Files larger than max_bytes are cut after the last whole line within their first max_bytes bytes, with truncated=True.
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        truncated = max_bytes is not None and size > max_bytes
+        if truncated:
+            data = f.read(max_bytes)
+            content = data[:max(data.rfind(b'\n'), data.rfind(b'\r')) + 1].decode('utf-8')
+        elif size and size >= mmap_threshold:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = str(mapped, 'utf-8')
+        else:
+            content = f.read().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')  # Translate newlines the way text mode does.
+    return content, truncated
+
+# Helper function to extract functions and classes from a file
+def extract_functions(file_path, language, source=None):
+    ### Extract functions, classes, and file descriptions from a file based on the specified language.
+    ### source may hold the (content, truncated) pair read_source_file() already returned (for example from the prefetcher).
+    ### Files over MAX_FILE_BYTES are extracted from their first lines only, while minified files and files running past
+    ### MAX_FILE_SECONDS are skipped; such results carry a 'warning' for the caller to report.
+    if language not in LANGUAGE_PATTERNS:
+        return {'functions': [], 'classes': [], 'file_description': ''}
+
+    if source is None:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            source = read_source_file(file_path)
         except (IOError, UnicodeDecodeError):
             print(f"Warning: Could not read file '{file_path}'")
             return {'functions': [], 'classes': [], 'file_description': ''}
+    content, truncated = source
 
-        functions = []
-        classes = []
-        file_description = ''
-        patterns = language_patterns[language]
+    functions = []
+    classes = []
+    file_description = ''
+    patterns = LANGUAGE_PATTERNS[language]
+    line_index = build_line_index(content)  # Newline offsets shared by every line number lookup in this file.
+    if looks_minified(file_path, content, line_index):
+        return {'functions': [], 'classes': [], 'file_description': '', 'warning': 'skipped as minified or generated'}
+    deadline = time.monotonic() + MAX_FILE_SECONDS if MAX_FILE_SECONDS is not None else None
 
+    try:
         # Extract file description for PHP or JavaScript files
         if language in ['php', 'javascript']:
-            description_match = re.search(patterns['file_description_regex'], content, re.DOTALL)
-            if description_match:
-                file_description = description_match.group(1).strip()
+            description_scanner = DESCRIPTION_SCANNERS.get(patterns['file_description_regex'])
+            if description_scanner:
+                description = description_scanner(content, deadline)
+            else:
+                description_match = re.search(patterns['file_description_regex'], content, re.DOTALL)
+                description = description_match.group(1) if description_match else None
+            if description:
+                file_description = description.strip()
 
         if language == 'php':
-            # Extract classes
-            class_matches = re.finditer(patterns['class_regex'], content)
-            class_ranges = []
-            for match in class_matches:
-                class_name = match.group(1)
-                class_start = match.start()
-                class_end = find_class_end(content, match.end())
-                class_content = content[match.start():class_end]
-                class_ranges.append((class_start, class_end))
-                
-                # Extract methods within this class
-                class_functions = []
-                function_matches = re.finditer(patterns['function_regex'], class_content)
-                comment_matches = re.finditer(patterns['comment_regex'], class_content)
-                
-                # Collect comments and functions
-                comment_list = [(m.group(1).strip() if m.group(1) else '', m.start()) for m in comment_matches]
-                function_list = [(m.group(1), m.start()) for m in function_matches]
-                
-                # Match comments to functions (comments after function start)
-                for func_name, func_start in function_list:
-                    closest_comment = ''
-                    for comment, comment_start in comment_list:
-                        if comment_start > func_start and (not closest_comment or comment_start < closest_comment[1]):
-                            closest_comment = (comment, comment_start)
-                    line_number = content[:func_start].count('\n') + 1
-                    class_functions.append({
-                        'name': func_name,
-                        'comment': closest_comment[0] if closest_comment else '',
-                        'line': line_number
-                    })
-                
-                classes.append({
-                    'name': class_name,
-                    'functions': class_functions,
-                    'comment': ''  # Class comments not currently extracted
-                })
-
-            # Extract all functions (standalone and methods)
-            function_matches = re.finditer(patterns['function_regex'], content)
-            comment_matches = re.finditer(patterns['comment_regex'], content)
-            
-            comment_list = [(m.group(1).strip() if m.group(1) else '', m.start()) for m in comment_matches]
-            function_list = [(m.group(1), m.start()) for m in function_matches]
-            
-            for func_name, func_start in function_list:
-                # Check if function is within a class
-                is_class_method = False
-                for class_start, class_end in class_ranges:
-                    if class_start <= func_start < class_end:
-                        is_class_method = True
-                        break
-                if not is_class_method:
-                    closest_comment = ''
-                    for comment, comment_start in comment_list:
-                        if comment_start > func_start and (not closest_comment or comment_start < closest_comment[1]):
-                            closest_comment = (comment, comment_start)
-                    line_number = content[:func_start].count('\n') + 1
-                    functions.append({
-                        'name': func_name,
-                        'comment': closest_comment[0] if closest_comment else '',
-                        'line': line_number
-                    })
+            functions, classes = extract_php_definitions(content, patterns, line_index, deadline)
 
         else:
-            # Non-PHP languages (Python, JavaScript)
-            function_matches = re.finditer(patterns['function_regex'], content)
-            comment_matches = re.finditer(patterns['comment_regex'], content)
-
-            comment_list = [(m.group(1).strip(), m.start()) for m in comment_matches]
-            function_list = []
-            for match in function_matches:
-                func_name = next((g for g in match.groups() if g), None)
-                if func_name:
-                    function_list.append((func_name, match.start()))
-
-            for func_name, func_start in function_list:
-                closest_comment = ''
-                for comment, comment_start in comment_list:
-                    if comment_start < func_start and (not closest_comment or comment_start > closest_comment[1]):
-                        closest_comment = (comment, comment_start)
-                line_number = content[:func_start].count('\n') + 1
-                functions.append({
-                    'name': func_name,
-                    'comment': closest_comment[0] if closest_comment else '',
-                    'line': line_number
-                })
-
-        return {'functions': functions, 'classes': classes, 'file_description': file_description}
-
-    # Walk through the directory tree.
-    for dirpath, dirnames, filenames in os.walk(project_dir, topdown=True):
-        depth = os.path.relpath(dirpath, project_dir).count(os.sep)  # Calculate the directory depth.
+            # Non-PHP languages (Python, JavaScript), through the linear-time scanners of the stock patterns
+            function_scanner = LINEAR_SCANNERS.get(patterns['function_regex'])
+            comment_scanner = LINEAR_SCANNERS.get(patterns['comment_regex'])
+            if comment_scanner:
+                comment_list = comment_scanner(content, deadline)
+            else:
+                comment_list = [(m.group(1).strip(), m.start()) for m in re.finditer(patterns['comment_regex'], content)]
+            if function_scanner:
+                function_list = function_scanner(content, deadline)
+            else:
+                function_list = []
+                for match in re.finditer(patterns['function_regex'], content):
+                    func_name = next((g for g in match.groups() if g), None)
+                    if func_name:
+                        function_list.append((func_name, match.start()))
+
+            functions = build_function_entries(function_list, comment_list, line_index, comment_after=False)
+    except ExtractionTimeout:
+        return {'functions': [], 'classes': [], 'file_description': '', 'warning': f'skipped after exceeding the time budget of {MAX_FILE_SECONDS:g}s'}
+
+    result = {'functions': functions, 'classes': classes, 'file_description': file_description}
+    if truncated:
+        result['warning'] = f'truncated to the whole lines within its first {MAX_FILE_BYTES} bytes'
+    return result
+
+# Helper function to extract a file while timing it
+def extract_functions_timed(file_path, language, source=None):
+    ### Return (result, stats) for a file, where stats is (bytes_read, read_wall, read_cpu, parse_wall, parse_cpu).
+    ### The read is only timed when the source was not prefetched.
+    read_wall = read_cpu = 0.0
+    if source is None and language in LANGUAGE_PATTERNS:
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            source = read_source_file(file_path)
+        except (IOError, UnicodeDecodeError):
+            pass  # extract_functions() reports the error.
+        read_wall, read_cpu = time.perf_counter() - wall, time.process_time() - cpu
+    try:
+        bytes_read = os.path.getsize(file_path) if source is not None else 0
+    except OSError:
+        bytes_read = 0
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = extract_functions(file_path, language, source)
+    return result, (bytes_read, read_wall, read_cpu, time.perf_counter() - wall, time.process_time() - cpu)
+
+# Helper function to extract a chunk of files inside a worker process
+def extract_functions_chunk(jobs, timed=False):
+    ### Extract functions and classes for a chunk of (file_path, language) jobs.
+    ### With timed=True each result is a (result, stats) pair from extract_functions_timed().
+    if timed:
+        return [extract_functions_timed(file_path, language) for file_path, language in jobs]
+    return [extract_functions(file_path, language) for file_path, language in jobs]
+
+# Helper function to read a file for the prefetcher
+def prefetch_source_file(file_path):
+    ### Return the (content, truncated) pair of a file, or None when it cannot be read so extract_functions() reports the error itself.
+    try:
+        return read_source_file(file_path)
+    except (IOError, UnicodeDecodeError):
+        return None
+
+# Helper function to find how many bytes prefetching a file will hold
+def prefetch_charge(file_path):
+    ### Return the size of a file from os.stat, capped at MAX_FILE_BYTES since larger files are truncated, or 0 when it cannot be stat'ed.
+    try:
+        size = os.stat(file_path).st_size
+    except OSError:
+        return 0  # The read fails too, and extract_functions() reports it.
+    return min(size, MAX_FILE_BYTES) if MAX_FILE_BYTES is not None else size
+
+# Helper function to read the files of upcoming jobs ahead of extraction
+def iter_prefetched_contents(entries, threads, max_bytes=PREFETCH_BYTES):
+    ### Yield (job, ready result or None, source or None) for (job, ready result or None) entries, in order, with sources from read_source_file().
+    ### Files of jobs without a ready result are read on a thread pool while earlier jobs are being parsed.
+    ### Each read is charged its file size (prefetch_charge()) when it is submitted and released when its job is yielded, so reads
+    ### in flight and finished reads waiting to be parsed never hold more than max_bytes together; a file larger than max_bytes
+    ### is only read once nothing else is held. Reading ahead also stops while too many entries are queued.
+    entries = iter(entries)
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        pending = deque()  # (job, ready result or None, read future or None, bytes charged) entries waiting to be yielded, oldest first.
+        charged_bytes = 0  # Bytes charged for the reads in pending.
+        waiting = None  # (job, ready result or None, bytes to charge) of the next entry, held back until the budget has room for it.
+        while True:
+            while len(pending) < threads * 16:
+                if waiting is None:
+                    entry = next(entries, None)
+                    if entry is None:
+                        break
+                    job, result = entry
+                    waiting = (job, result, prefetch_charge(job[0]) if result is None else 0)
+                job, result, charge = waiting
+                if pending and charged_bytes + charge > max_bytes:
+                    break  # Wait until earlier jobs are yielded.
+                pending.append((job, result, executor.submit(prefetch_source_file, job[0]) if result is None else None, charge))
+                charged_bytes += charge
+                waiting = None
+            if not pending:
+                return
+            job, result, future, charge = pending.popleft()
+            charged_bytes -= charge
+            yield job, result, future.result() if future is not None else None
+
+# Helper function to run extraction serially or across a process pool
+def iter_extraction_results(jobs, workers=1, chunk_size=EXTRACTION_CHUNK_SIZE, lookup=None, prefetch_threads=PREFETCH_THREADS, prefetch_bytes=PREFETCH_BYTES, record=None):
+    ### Yield (job, result) pairs for (file_path, language, ...) jobs in the same order the jobs were given.
+    ### Jobs are pulled lazily, so the jobs iterable can be fed by a walk that is still in progress.
+    ### lookup(job) may return a ready result (for example from the extraction cache) so the job skips extraction.
+    ### record(job, result, stats) is called for every extracted job with the stats of extract_functions_timed().
+    ### When serial, prefetch_threads > 0 reads upcoming files on a thread pool while the current one is parsed;
+    ### worker processes already overlap their reads with each other.
+    if workers is None or workers <= 1:
+        # Helper function to extract a job in this process
+        def extract(job, source=None):
+            ### Extract a job, timing it when a record callback was given.
+            if record is None:
+                return extract_functions(job[0], job[1], source)
+            result, stats = extract_functions_timed(job[0], job[1], source)
+            record(job, result, stats)
+            return result
+
+        entries = ((job, lookup(job) if lookup else None) for job in jobs)
+        if not prefetch_threads:
+            for job, result in entries:
+                yield job, result if result is not None else extract(job)
+            return
+        for job, result, source in iter_prefetched_contents(entries, prefetch_threads, prefetch_bytes):
+            yield job, result if result is not None else extract(job, source)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()  # (entries, future) chunks waiting to be yielded, oldest first.
+        entries = []  # (job, ready result or None) pairs of the chunk being filled.
+        to_extract = []  # Jobs of the chunk being filled that still need extracting.
+        for job in jobs:
+            result = lookup(job) if lookup else None
+            entries.append((job, result))
+            if result is None:
+                to_extract.append(job[:2])
+            if len(to_extract) >= chunk_size or len(entries) >= chunk_size * 4:
+                pending.append((entries, executor.submit(extract_functions_chunk, to_extract, record is not None) if to_extract else None))
+                entries, to_extract = [], []
+                while len(pending) > workers * 2:  # Bound the number of chunks in flight.
+                    yield from iter_chunk_results(*pending.popleft(), record)
+        if entries:
+            pending.append((entries, executor.submit(extract_functions_chunk, to_extract, record is not None) if to_extract else None))
+        while pending:
+            yield from iter_chunk_results(*pending.popleft(), record)
+
+# Helper function to merge a finished chunk with its ready results
+def iter_chunk_results(entries, future, record=None):
+    ### Yield (job, result) pairs of a chunk, taking extracted results from the future in order.
+    ### With a record callback the extracted results are (result, stats) pairs, and record(job, result, stats) is called for each.
+    extracted = iter(future.result()) if future is not None else iter(())
+    for job, result in entries:
+        if result is None:
+            result = next(extracted)
+            if record is not None:
+                result, stats = result
+                record(job, result, stats)
+        yield job, result
+
+# Helper function to walk the project tree with os.scandir
+def walk_project(project_dir, max_depth, should_prune_directory, start=None):
+    ### Yield (dirpath, relative_path, depth, dirnames, filenames) in the same order as os.walk(topdown=True) with sorted dirnames.
+    ### Directories rejected by should_prune_directory or past max_depth are never listed, and DirEntry type information avoids extra stat calls.
+    ### start=(dirpath, relative_path, depth) walks only the subtree of a directory already reached by a previous walk.
+    stack = [start or (project_dir, '.', 0)]  # Directories still to be listed, next one on top.
+    while stack:
+        dirpath, relative_path, depth = stack.pop()
         if max_depth is not None and depth >= max_depth:
-            continue  # Skip processing if the current depth exceeds the maximum allowed.
+            continue  # Only reachable for the root directory; children are pruned before they are pushed.
+        try:
+            with os.scandir(dirpath) as iterator:
+                entries = list(iterator)
+        except OSError:
+            continue  # Unreadable directories are skipped, as os.walk does.
 
-        dirnames[:] = [d for d in dirnames if not should_ignore_directory(d) and not is_special_directory(d)]
+        dirnames = []
+        filenames = []
+        symlinked_dirs = set()  # Symlinked directories are listed but not descended into, as os.walk does.
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                filenames.append(entry.name)
+            elif not should_prune_directory(entry.name):
+                dirnames.append(entry.name)
+                try:
+                    if entry.is_symlink():
+                        symlinked_dirs.add(entry.name)
+                except OSError:
+                    symlinked_dirs.add(entry.name)
         dirnames.sort()  # Sort the directory names.
 
-        relative_path = os.path.relpath(dirpath, project_dir)  # Get the relative path from the root directory.
-        current_dir_name = os.path.basename(dirpath)  # Get the current directory name.
+        yield dirpath, relative_path, depth, dirnames, filenames
 
-        if should_ignore_directory(current_dir_name):
-            continue
+        child_depth = depth + 1 if relative_path != '.' else 0  # Top-level directories share the root's depth.
+        if max_depth is not None and child_depth >= max_depth:
+            continue  # Stop descending at the depth limit.
+        for dirname in reversed(dirnames):
+            if dirname not in symlinked_dirs:
+                child_relative_path = os.path.join(relative_path, dirname) if relative_path != '.' else dirname
+                stack.append((os.path.join(dirpath, dirname), child_relative_path, child_depth))
 
-        indent = '│   ' * depth  # Create the indent for the current depth.
-        subindent = '│   ' * (depth + 1)  # Create the subindent for subdirectories.
-
-        if return_folders_only:  # Check if only folder names should be returned.
-            if relative_path != '.':
-                tree.append(f"{indent}├── {current_dir_name}/")  # Add the directory to the tree.
-            continue  # Skip the rest of the logic for files if we only want folders.
-
-        # Identify unique files based on the patterns.
-        pattern_dict = {}  # Dictionary to hold the first and last file matching each pattern.
-        files_of_interest = set()  # Set to hold files that match the patterns.
-
-        for file in filenames:  # Iterate through files in the current directory.
-            if not file.startswith('.') and not should_ignore_file(file):  # Exclude hidden and ignored files.
-                if include_all_files or any(file.endswith(ext) for ext in extensions_to_include):  # Include files based on extensions.
-                    unique_found = False
-                    for pattern in compiled_patterns:
-                        match = pattern.match(file)
-                        if match:
-                            key = pattern.pattern
-                            if key not in pattern_dict:
-                                pattern_dict[key] = {"first": file, "last": file}
-                            else:
-                                pattern_dict[key]["last"] = file
-                            unique_found = True
-                            break
-                    if not unique_found:
-                        files_of_interest.add(file)
-
-                    # Extract functions and classes from the file if it matches a language's extension
-                    file_path = os.path.join(dirpath, file)
-                    for lang in processed_languages:
-                        if any(file.endswith(ext) for ext in language_patterns[lang]['extensions']):
-                            data = extract_functions(file_path, lang)
-                            relative_file_path = os.path.join(relative_path, file) if relative_path != '.' else file
-                            functions_data.append({
-                                'file': relative_file_path,
-                                'language': lang,
-                                'functions': data['functions'],
-                                'classes': data['classes'],
-                                'file_description': data['file_description']
-                            })
-
-        for files in pattern_dict.values():  # Add identified files to interest set.
-            files_of_interest.add(files["first"])
-            files_of_interest.add(files["last"])
-
-        # Add directory line for folder to tree.
-        if relative_path != '.':
-            tree.append(f"{indent}├── {current_dir_name}/")
+# Helper function to find the top-level subtree of a directory
+def top_level_subtree(relative_path):
+    ### Return the top-level directory a relative directory path is in, or '' for the root directory.
+    return '' if relative_path == '.' else relative_path.split(os.sep, 1)[0]
 
-        # Append files of interest with correct connector
-        sorted_files_of_interest = sorted(files_of_interest)  # Sort files of interest.
-        for i, filename in enumerate(sorted_files_of_interest):  # Add files to tree.
-            is_last_file = (i == len(sorted_files_of_interest) - 1)  # Check if last file.
-            has_subdirectories = bool(dirnames)  # Check for subdirectories.
-            connector = "└──" if is_last_file and not has_subdirectories else "├──"
-            tree.append(f"{subindent}{connector} {filename}")
+# Helper function to assign a top-level subtree to a shard
+def shard_of(subtree, shard_count):
+    ### Return the shard a top-level subtree belongs to: the root ('') is always in shard 0, and top-level directories are
+    ### spread by a CRC32 of their name, which is the same on every machine and Python version.
+    return zlib.crc32(subtree.encode('utf-8')) % shard_count if subtree else 0
 
-        # Add break line if necessary.
-        if not dirnames and sorted_files_of_interest and sorted_files_of_interest[-1].endswith('.py'):
-            tree.append(indent + '│')  # Add break line.
+# Helper function to name the extraction cache of a shard
+def shard_cache_file(cache_file, shard_index, shard_count):
+    ### Return the extraction cache of one shard: cache_file with .shard_K_of_N before its extension. Each shard evicts the
+    ### entries it did not see, and holds the cache's write lock for its whole run, so shards cannot share one cache file.
+    root, extension = os.path.splitext(cache_file)
+    return f"{root}.shard_{shard_index}_of_{shard_count}{extension}"
 
-    # Clean up trailing connector lines.
-    while tree and (tree[-1].strip() == "│" or tree[-1].strip() == ""):
-        tree.pop()  # Remove trailing connector lines.
+# Helper function to walk the subtrees of one shard
+def walk_shard(project_dir, max_depth, should_prune_directory, shard_index, shard_count):
+    ### Yield the walk_project() listings of a shard: the root directory for shard 0, then the subtrees of the top-level
+    ### directories assigned to the shard. Other subtrees are never listed, but the root is always listed in full so its
+    ### connectors match a single run.
+    root = next(walk_project(project_dir, max_depth, should_prune_directory), None)
+    if root is None:
+        return
+    if shard_index == 0:
+        yield root
+    for dirname in root[3]:
+        if shard_of(dirname, shard_count) == shard_index and not os.path.islink(os.path.join(project_dir, dirname)):
+            yield from walk_project(project_dir, max_depth, should_prune_directory, (os.path.join(project_dir, dirname), dirname, 0))
 
-    # Save the project structure to a file if requested.
-    if export_structure:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("\n".join(tree))  # Write the tree representation to the file.
-        print(f"Project structure has been saved to {output_file}")  # Print success message.
+# Helper function to run a git command in the project directory
+def run_git(project_dir, arguments):
+    ### Return the output of a git command run in project_dir, or None after printing a warning when it fails.
+    try:
+        completed = subprocess.run(['git', '-C', project_dir] + arguments, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    except (OSError, subprocess.CalledProcessError) as error:
+        detail = error.stderr.decode('utf-8', 'replace').strip() if isinstance(error, subprocess.CalledProcessError) else str(error)
+        print(f"Warning: 'git {' '.join(arguments)}' failed in '{project_dir}': {detail}")
+        return None
+    return completed.stdout
 
-    # Save the functions and classes to functions.txt if requested
-    if export_functions:
-        with open(functions_file, 'w', encoding='utf-8') as f:
-            for entry in functions_data:
-                language = entry['language']
-
-                if entry['language'] == 'php':
-                    language = 'php'
-                elif entry['language'] == 'python':
-                    language = 'python'
-                elif entry['language'] == 'javascript':
-                    language = 'javascript'
-
-                f.write(f"File: {entry['file']} ({language})\n")
-                total_classes = len(entry['classes'])
-                total_methods = sum(len(cls['functions']) for cls in entry['classes'])
-                total_functions = len(entry['functions'])
-
-                if total_classes == 0 and total_methods == 0 and total_functions == 0 and not entry['file_description']:
-                    f.write("No functions, classes, or file description found\n")
-                    continue
+# Helper function to list the files tracked by git
+def list_git_files(project_dir):
+    ### Return (relative_path, mode) of every file in the git index under project_dir, or None when git cannot list them.
+    output = run_git(project_dir, ['ls-files', '-z', '--stage'])
+    if output is None:
+        return None
+    entries = []
+    for line in output.split(b'\0'):
+        if line:
+            metadata, path = line.split(b'\t', 1)  # "<mode> <object> <stage>\t<path>"
+            entries.append((os.fsdecode(path), metadata.split(b' ', 1)[0].decode('ascii')))
+    return entries
 
-                if total_classes > 0:
-                    f.write(f" Total Classes: {total_classes}")
-                if total_methods > 0:
-                    f.write(f" Total Methods: {total_methods}")
-                if total_functions > 0:
-                    f.write(f" Total Functions: {total_functions}")
-                if entry['file_description']:
-                    f.write(f"\n File Description: {entry['file_description']}")
-                if total_classes > 0 or total_methods > 0 or total_functions > 0 or total_classes == 0 and total_methods == 0 and total_functions == 0 and entry['file_description']:
-                    f.write("\n")
-
-                # Write classes
-                for cls in entry['classes']:
-                    f.write(f"  Class: {cls['name']}\n")
-                    for func in cls['functions']:
-                        f.write(f"    Function: {func['name']}")
-                        if func['comment']:
-                            cleaned_comment = re.sub(r'^\/\*\*\*|\*\*\*\/$', '', func['comment'].strip()).strip()
-                            f.write(f"\n    - Function Description: {cleaned_comment}")
-                        f.write("\n")
-                        
-                # Write standalone functions
-                for func in entry['functions']:
-                    f.write(f"  Function: {func['name']} (Line {func['line']})")
-                    if func['comment']:
-                        cleaned_comment = re.sub(r'^\/\*\*\*|\*\*\*\/$', '', func['comment'].strip()).strip()
-                        f.write(f"\n  - Function Description: {cleaned_comment}")
-                    f.write("\n")
-                f.write("\n")
-        print(f"Function and class information has been saved to {functions_file}")  # Print success message.
-
-    # Save combined structure and functions to combined file if requested
-    if export_combined:
+# Helper function to list the files changed since a git revision
+def list_git_changes(project_dir, revision):
+    ### Return the set of paths, relative to project_dir, that differ between revision and the working tree, or None when git cannot tell.
+    output = run_git(project_dir, ['diff', '--name-only', '--relative', '-z', revision, '--'])
+    if output is None:
+        return None
+    return {os.path.normpath(os.fsdecode(path)) for path in output.split(b'\0') if path}
+
+# Helper function to resolve a git revision to a commit
+def resolve_git_commit(project_dir, revision):
+    ### Return the full hash of the commit revision names, or None when git cannot resolve it.
+    output = run_git(project_dir, ['rev-parse', '--verify', f'{revision}^{{commit}}'])
+    return output.decode('ascii').strip() if output is not None else None
+
+# Helper function to walk the files tracked by git
+def walk_git_index(project_dir, max_depth, should_prune_directory, entries):
+    ### Yield (dirpath, relative_path, depth, dirnames, filenames) like walk_project() for the (relative_path, mode) entries of list_git_files().
+    ### Only the directories holding tracked files exist, and files are listed in index (sorted) order. Symlinks to directories and
+    ### submodules are listed as directories without being descended into, like symlinked directories in walk_project().
+    root = ({}, [])  # (subdirectories, filenames) of a directory; subdirectories that are not descended into map to None.
+    for path, mode in entries:
+        parts = path.split('/')
+        node = root
+        for part in parts[:-1]:
+            node = node[0].setdefault(part, ({}, []))
+        if mode == '160000' or (mode == '120000' and os.path.isdir(os.path.join(project_dir, path))):
+            node[0][parts[-1]] = None
+        else:
+            node[1].append(parts[-1])
+
+    stack = [(project_dir, '.', 0, root)]  # Directories still to be yielded, next one on top.
+    while stack:
+        dirpath, relative_path, depth, node = stack.pop()
+        if max_depth is not None and depth >= max_depth:
+            continue  # Only reachable for the root directory; children are pruned before they are pushed.
+        dirnames = sorted(name for name in node[0] if not should_prune_directory(name))
+
+        yield dirpath, relative_path, depth, dirnames, list(node[1])
+
+        child_depth = depth + 1 if relative_path != '.' else 0  # Top-level directories share the root's depth.
+        if max_depth is not None and child_depth >= max_depth:
+            continue  # Stop descending at the depth limit.
+        for dirname in reversed(dirnames):
+            if node[0][dirname] is not None:
+                child_relative_path = os.path.join(relative_path, dirname) if relative_path != '.' else dirname
+                stack.append((os.path.join(dirpath, dirname), child_relative_path, child_depth, node[0][dirname]))
+
+# Matcher that tries a list of regexes in order
+class RegexList:
+    ### Stand-in for a merged alternation when the patterns cannot be combined into one regex.
+    __slots__ = ('patterns',)
+
+    def __init__(self, pattern_strings):
+        self.patterns = [re.compile(pattern_str) for pattern_str in pattern_strings]
+
+    def match(self, name):
+        for pattern in self.patterns:
+            match = pattern.match(name)
+            if match:
+                return match
+        return None
+
+# Helper function to compile a list of regexes into one alternation
+def compile_alternation(pattern_strings, named=False):
+    ### Return one compiled regex that matches where any of the patterns match (tried in order), or None for an empty list.
+    ### With named=True each pattern is wrapped in a group named p<index> so the matching pattern can be told apart,
+    ### and None is returned if the patterns cannot be combined; otherwise a RegexList is returned in that case.
+    if not pattern_strings:
+        return None
+    if named and any(re.search(r'\\[1-9]|\(\?P[<=]', pattern_str) for pattern_str in pattern_strings):
+        return None  # Numbered backreferences and named groups would clash with the wrapping groups.
+    wrapped = [f"(?P<p{index}>{pattern_str})" if named else f"(?:{pattern_str})" for index, pattern_str in enumerate(pattern_strings)]
+    try:
+        return re.compile("|".join(wrapped))
+    except re.error:
+        return None if named else RegexList(pattern_strings)  # For example, patterns with global inline flags.
+
+# Helper function to check if an ignore entry contains wildcards
+def has_wildcards(pattern):
+    ### Check if the pattern uses fnmatch wildcards; anything else is compared as a plain name.
+    return any(char in pattern for char in '*?[')
+
+# Helper function to check if a file extension is a plain ".ext" suffix
+def is_simple_extension(extension):
+    ### Check if the extension can be compared against the text from a file name's last dot.
+    return len(extension) > 1 and extension.startswith('.') and extension.count('.') == 1
+
+# Matcher for directory and file names
+class NameMatcher:
+    ### Classify directory and file names against the ignore, special, grouping and extension settings, all compiled once.
+    ### Literal names and suffixes are set lookups; wildcard and regex patterns are merged into single alternation regexes.
+    __slots__ = ('ignore_dir_names', 'ignore_dir_regex', 'prune_regex', 'ignore_file_names', 'ignore_file_regex',
+                 'group_patterns', 'group_regex', 'compiled_group_patterns', 'include_all_files', 'extensions',
+                 'extension_suffixes', 'language_extensions', 'languages_by_suffix')
+
+    def __init__(self, ignore_dirs, ignore_files, special_dir_patterns, patterns, extensions_to_include, languages, include_all_files):
+        # Ignore entries without wildcards are plain names; the rest are merged into one regex.
+        self.ignore_dir_names = {ignore for ignore in ignore_dirs if not has_wildcards(ignore)}
+        ignore_dir_wildcards = [fnmatch.translate(ignore) for ignore in ignore_dirs if has_wildcards(ignore)]
+        self.ignore_dir_regex = compile_alternation(ignore_dir_wildcards)
+        self.prune_regex = compile_alternation(ignore_dir_wildcards + list(special_dir_patterns))
+        self.ignore_file_names = {ignore for ignore in ignore_files if not has_wildcards(ignore)}
+        self.ignore_file_regex = compile_alternation([fnmatch.translate(ignore) for ignore in ignore_files if has_wildcards(ignore)])
+
+        # Grouping patterns are tried in order; the first one that matches names the group.
+        self.group_patterns = list(patterns)
+        self.group_regex = compile_alternation(self.group_patterns, named=True)
+        self.compiled_group_patterns = [re.compile(pattern_str) for pattern_str in self.group_patterns]
+
+        # Extensions are set lookups on the text from the last dot when they are all plain suffixes.
+        self.include_all_files = include_all_files
+        self.extensions = tuple(extensions_to_include)
+        self.extension_suffixes = set(self.extensions) if all(is_simple_extension(ext) for ext in self.extensions) else None
+        self.language_extensions = [(lang, LANGUAGE_PATTERNS[lang]['extensions']) for lang in languages]
+        self.languages_by_suffix = None
+        if all(is_simple_extension(ext) for _, exts in self.language_extensions for ext in exts):
+            self.languages_by_suffix = {}
+            for lang, exts in self.language_extensions:
+                for ext in dict.fromkeys(exts):
+                    self.languages_by_suffix[ext] = self.languages_by_suffix.get(ext, ()) + (lang,)
+
+    def is_ignored_directory(self, name):
+        ### Check if the directory should be ignored based on patterns.
+        return name in self.ignore_dir_names or bool(self.ignore_dir_regex and self.ignore_dir_regex.match(name))
+
+    def should_prune_directory(self, name):
+        ### Check if the walker should skip the directory: it is ignored or matches a special pattern.
+        return name in self.ignore_dir_names or bool(self.prune_regex and self.prune_regex.match(name))
+
+    def classify_file(self, name):
+        ### Return None if the file is excluded, otherwise (matching grouping pattern or None, languages to extract).
+        if name.startswith('.') or name in self.ignore_file_names or (self.ignore_file_regex and self.ignore_file_regex.match(name)):
+            return None
+        dot = name.rfind('.')
+        suffix = name[dot:] if dot >= 0 else ''
+        if not self.include_all_files:
+            if self.extension_suffixes is not None:
+                if suffix not in self.extension_suffixes:
+                    return None
+            elif not name.endswith(self.extensions):
+                return None
+
+        group = None
+        if self.group_regex is not None:
+            match = self.group_regex.match(name)
+            if match:
+                group = self.group_patterns[int(match.lastgroup[1:])]
+        else:
+            group = next((pattern.pattern for pattern in self.compiled_group_patterns if pattern.match(name)), None)
+
+        if self.languages_by_suffix is not None:
+            languages = self.languages_by_suffix.get(suffix, ())
+        else:
+            languages = tuple(lang for lang, exts in self.language_extensions if name.endswith(exts))
+        return group, languages
+
+# Helper function to compute the signature that invalidates the extraction cache
+def extraction_cache_signature():
+    ### Return a hash of the generator version, language patterns and per-file budgets; cached results are only valid for the same signature.
+    ### The budgets decide whether a result is truncated, skipped or complete, so results cached under other budgets cannot be reused.
+    budgets = [MAX_FILE_BYTES, MAX_FILE_SECONDS, MINIFIED_LINE_LENGTH, MINIFIED_MIN_BYTES]
+    payload = json.dumps([GENERATOR_VERSION, EXTRACTOR_REVISION, LANGUAGE_PATTERNS, budgets], sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+# Helper function to hash the contents of a file
+def hash_file_contents(file_path):
+    ### Return a fast content hash of the file.
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Helper function to connect to an extraction cache file
+def connect_extraction_cache(cache_file):
+    ### Return a connection to cache_file with the cache tables created, or raise sqlite3.DatabaseError when the file is not
+    ### an SQLite database or holds tables other than those of the cache.
+    connection = sqlite3.connect(cache_file)
+    try:
+        columns = {'meta': ['key', 'value'], 'files': ['path', 'language', 'mtime_ns', 'size', 'content_hash', 'result']}
+        for (table,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+            if [column for (column,) in connection.execute("SELECT name FROM pragma_table_info(?)", (table,))] != columns.get(table):
+                raise sqlite3.DatabaseError(f"unexpected table '{table}'")
+        connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        connection.execute("CREATE TABLE IF NOT EXISTS files (path TEXT, language TEXT, mtime_ns INTEGER, size INTEGER, content_hash TEXT, result TEXT, PRIMARY KEY (path, language))")
+    except sqlite3.DatabaseError:
+        connection.close()
+        raise
+    return connection
+
+# Helper function to open the extraction cache
+def open_extraction_cache(cache_file):
+    ### Open (or create) the extraction cache, clearing it when the generator version, language patterns or per-file budgets changed.
+    ### A file that is not an extraction cache (corrupt, or another database) is replaced by an empty cache.
+    cache_dir = os.path.dirname(cache_file)
+    if cache_dir and not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    try:
+        connection = connect_extraction_cache(cache_file)
+    except sqlite3.DatabaseError as error:
+        print(f"Warning: Replacing '{cache_file}', which is not an extraction cache: {error}")
+        os.remove(cache_file)
+        connection = connect_extraction_cache(cache_file)
+    signature = extraction_cache_signature()
+    row = connection.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+    if row is None or row[0] != signature:
+        connection.execute("DELETE FROM files")
+        connection.execute("DELETE FROM meta WHERE key = 'commit'")
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('signature', ?)", (signature,))
+        connection.commit()
+    return connection
+
+# Helper function to read the commit the extraction cache was filled at
+def read_cache_commit(connection):
+    ### Return the commit whose contents every cached result of a tracked file matches, or None when no such commit is known.
+    row = connection.execute("SELECT value FROM meta WHERE key = 'commit'").fetchone()
+    return row[0] if row is not None else None
+
+# Helper function to record the commit the extraction cache was filled at
+def write_cache_commit(connection, commit):
+    ### Record commit as the one the cached results of tracked files match, or forget it when commit is None.
+    if commit is None:
+        connection.execute("DELETE FROM meta WHERE key = 'commit'")
+    else:
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('commit', ?)", (commit,))
+
+# Helper function to look up a file in the extraction cache
+def lookup_cached_result(connection, file_path, language, relative_file_path, trust_cached=False):
+    ### Return (result, key) for a file; result is None on a miss and key holds the (mtime_ns, size, content_hash) to store.
+    ### trust_cached=True is for tracked files git reports as unchanged since the commit the cache was filled at: a cached
+    ### result of the same size is reused without hashing the file, even when its mtime changed (as after a checkout).
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None, None
+    row = connection.execute("SELECT mtime_ns, size, content_hash, result FROM files WHERE path = ? AND language = ?", (relative_file_path, language)).fetchone()
+    if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+        return json.loads(row[3]), None  # Unchanged mtime and size: trust the cached result without reading the file.
+    if row is not None and trust_cached and row[1] == stat.st_size:
+        connection.execute("UPDATE files SET mtime_ns = ? WHERE path = ? AND language = ?", (stat.st_mtime_ns, relative_file_path, language))
+        return json.loads(row[3]), None  # Contents git vouches for: refresh the mtime and reuse the result.
+    try:
+        content_hash = hash_file_contents(file_path)
+    except OSError:
+        return None, None
+    if row is not None and row[2] == content_hash:
+        connection.execute("UPDATE files SET mtime_ns = ?, size = ? WHERE path = ? AND language = ?", (stat.st_mtime_ns, stat.st_size, relative_file_path, language))
+        return json.loads(row[3]), None  # Touched but identical content: refresh the stat key and reuse the result.
+    return None, (stat.st_mtime_ns, stat.st_size, content_hash)
+
+# Helper function to run extraction through the extraction cache
+def iter_cached_extraction_results(jobs, connection, cache_stats, workers=1, prefetch_threads=PREFETCH_THREADS, prefetch_bytes=PREFETCH_BYTES, record=None, trusted_paths=None):
+    ### Yield (job, result) pairs like iter_extraction_results(), skipping extraction for files whose cached result is still valid.
+    ### Cached results of files in trusted_paths (relative paths) are reused when their size matches (see lookup_cached_result());
+    ### all other files are checked by modification time, size and content hash.
+    ### Entries for files not seen during the run are evicted once all jobs have been yielded.
+    miss_keys = {}  # Jobs that missed the cache, mapped to the (mtime_ns, size, content_hash) to store with their result.
+    seen_keys = set()
+
+    # Helper function to look a job up in the cache
+    def lookup(job):
+        ### Return the cached result of a job, or None after recording its cache key.
+        seen_keys.add((job[2], job[1]))
+        result, key = lookup_cached_result(connection, job[0], job[1], job[2], trusted_paths is not None and job[2] in trusted_paths)
+        if result is None:
+            miss_keys[job] = key
+        return result
+
+    for job, result in iter_extraction_results(jobs, workers, lookup=lookup, prefetch_threads=prefetch_threads, prefetch_bytes=prefetch_bytes, record=record):
+        if job in miss_keys:
+            cache_stats['misses'] += 1
+            key = miss_keys.pop(job)
+            if key is not None and 'warning' not in result:  # Budget warnings depend on the settings, so they are reported afresh every run.
+                connection.execute("INSERT OR REPLACE INTO files (path, language, mtime_ns, size, content_hash, result) VALUES (?, ?, ?, ?, ?, ?)", (job[2], job[1], key[0], key[1], key[2], json.dumps(result)))
+            elif key is not None:  # Drop the result of the previous contents, which a trusted lookup would otherwise reuse.
+                connection.execute("DELETE FROM files WHERE path = ? AND language = ?", (job[2], job[1]))
+        else:
+            cache_stats['hits'] += 1
+        yield job, result
+    cache_stats['evicted'] = evict_stale_cache_entries(connection, seen_keys)
+
+# Helper function to evict cache entries for files that no longer exist
+def evict_stale_cache_entries(connection, seen_keys):
+    ### Delete cache entries whose (path, language) was not seen during this run and return how many were removed.
+    stale_keys = [key for key in connection.execute("SELECT path, language FROM files") if key not in seen_keys]
+    connection.executemany("DELETE FROM files WHERE path = ? AND language = ?", stale_keys)
+    return len(stale_keys)
+
+# Helper function to clean up a function comment for output
+def clean_comment(comment):
+    ### Strip the /*** and ***/ markers from a function comment.
+    return re.sub(r'^\/\*\*\*|\*\*\*\/$', '', comment.strip()).strip()
+
+# Helper function to format a file entry for functions.txt
+def format_functions_entry(entry):
+    ### Return the functions.txt text of one file entry.
+    parts = [f"File: {entry['file']} ({entry['language']})\n"]
+    total_classes = len(entry['classes'])
+    total_methods = sum(len(cls['functions']) for cls in entry['classes'])
+    total_functions = len(entry['functions'])
+
+    if total_classes == 0 and total_methods == 0 and total_functions == 0 and not entry['file_description']:
+        parts.append("No functions, classes, or file description found\n")
+        return "".join(parts)
+
+    if total_classes > 0:
+        parts.append(f" Total Classes: {total_classes}")
+    if total_methods > 0:
+        parts.append(f" Total Methods: {total_methods}")
+    if total_functions > 0:
+        parts.append(f" Total Functions: {total_functions}")
+    if entry['file_description']:
+        parts.append(f"\n File Description: {entry['file_description']}")
+    parts.append("\n")
+
+    # Write classes
+    for cls in entry['classes']:
+        parts.append(f"  Class: {cls['name']}\n")
+        for func in cls['functions']:
+            parts.append(f"    Function: {func['name']}")
+            if func['comment']:
+                parts.append(f"\n    - Function Description: {clean_comment(func['comment'])}")
+            parts.append("\n")
+
+    # Write standalone functions
+    for func in entry['functions']:
+        parts.append(f"  Function: {func['name']} (Line {func['line']})")
+        if func['comment']:
+            parts.append(f"\n  - Function Description: {clean_comment(func['comment'])}")
+        parts.append("\n")
+    parts.append("\n")
+    return "".join(parts)
+
+# Helper function to format a file entry for combined_structure.txt
+def format_combined_entry(entry):
+    ### Return the combined_structure.txt text of one file entry.
+    parts = [f"  File: {entry['file']} ({entry['language']})"]
+    total_classes = len(entry['classes'])
+    total_methods = sum(len(cls['functions']) for cls in entry['classes'])
+    total_functions = len(entry['functions'])
+
+    if total_classes == 0 and total_methods == 0 and total_functions == 0 and not entry['file_description']:
+        parts.append(" No functions or classes found\n")
+        return "".join(parts)
+
+    if total_classes > 0:
+        parts.append(f" Total Classes: {total_classes}")
+    if total_methods > 0:
+        parts.append(f" Total Methods: {total_methods}")
+    if total_functions > 0:
+        parts.append(f" Total Functions: {total_functions}")
+    if entry['file_description']:
+        parts.append(f"\n  - File Description: {entry['file_description']}")
+    parts.append("\n")
+
+    # Write classes
+    for cls in entry['classes']:
+        parts.append(f"    Class: {cls['name']}\n")
+        for func in cls['functions']:
+            parts.append(f"      Function: {func['name']}")
+            if func['comment']:
+                parts.append(f"\n      - Function Description: {clean_comment(func['comment'])}")
+            parts.append("\n")
+
+    # Write standalone functions
+    for func in entry['functions']:
+        parts.append(f"    Function: {func['name']} (Line {func['line']})")
+        if func['comment']:
+            parts.append(f"\n    - Function Description: {clean_comment(func['comment'])}")
+        parts.append("\n")
+    parts.append("\n")
+    return "".join(parts)
+
+# Helper function to open an output file for an atomic rewrite
+def open_output_file(output_file, binary=False):
+    ### Open a temporary file next to output_file; replace_output_file() moves it into place once it is complete.
+    if binary:
+        return open(f"{output_file}.tmp", 'wb', buffering=WRITE_BUFFER_SIZE)
+    return open(f"{output_file}.tmp", 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+
+# Helper function to finish an atomic rewrite
+def replace_output_file(file, output_file):
+    ### Close a file opened by open_output_file() and atomically replace output_file with it, so readers never see a partial file.
+    file.close()
+    os.replace(f"{output_file}.tmp", output_file)
+
+# Base class for output writers
+class OutputWriter:
+    ### Receive tree lines, the end of the tree, and file entries as they are produced; subclasses write the ones they need.
+    def write_tree_line(self, line):
+        pass
+
+    def end_tree(self):
+        pass
+
+    def write_entry(self, entry):
+        pass
+
+    def close(self):
+        pass
+
+# Writer for project_structure.txt
+class StructureWriter(OutputWriter):
+    ### Stream the tree to the project structure file.
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self.file = open_output_file(output_file)
+        self.separator = ""  # Lines are joined with newlines, without a trailing one.
+
+    def write_tree_line(self, line):
+        self.file.write(self.separator + line)
+        self.separator = "\n"
+
+    def close(self):
+        replace_output_file(self.file, self.output_file)
+        print(f"Project structure has been saved to {self.output_file}")  # Print success message.
+
+# Writer for functions.txt
+class FunctionsWriter(OutputWriter):
+    ### Stream file entries to the functions file.
+    def __init__(self, functions_file):
+        self.functions_file = functions_file
+        self.file = open_output_file(functions_file)
+
+    def write_entry(self, entry):
+        self.file.write(format_functions_entry(entry))
+
+    def close(self):
+        replace_output_file(self.file, self.functions_file)
+        print(f"Function and class information has been saved to {self.functions_file}")  # Print success message.
+
+# Writer for combined_structure.txt
+class CombinedWriter(OutputWriter):
+    ### Stream the tree and file entries to the combined file.
+    ### Entries that arrive while the tree is still being written are spooled, so extraction never waits for the walk to finish.
+    def __init__(self, combined_file):
         if not os.path.exists(DOCUMENTATION_DIR):
             os.makedirs(DOCUMENTATION_DIR)
-        with open(combined_file, 'w', encoding='utf-8') as f:
-            f.write("Project Structure:\n")
-            for line in tree:
-                f.write(f"  {line}\n")
-            f.write("\nFile Structure:\n")
-            for entry in functions_data:
-                language = entry['language']
-                f.write(f"  File: {entry['file']} ({language})")
-                total_classes = len(entry['classes'])
-                total_methods = sum(len(cls['functions']) for cls in entry['classes'])
-                total_functions = len(entry['functions'])
-
-                if total_classes == 0 and total_methods == 0 and total_functions == 0 and not entry['file_description']:
-                    f.write(" No functions or classes found\n")
+        self.combined_file = combined_file
+        self.file = open_output_file(combined_file)
+        self.file.write("Project Structure:\n")
+        self.spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+', encoding='utf-8')
+
+    def write_tree_line(self, line):
+        self.file.write(f"  {line}\n")
+
+    def end_tree(self):
+        self.file.write("\nFile Structure:\n")
+        self.spool.seek(0)
+        shutil.copyfileobj(self.spool, self.file)
+        self.spool.close()
+        self.spool = None
+
+    def write_entry(self, entry):
+        (self.spool or self.file).write(format_combined_entry(entry))
+
+    def close(self):
+        replace_output_file(self.file, self.combined_file)
+        print(f"Combined structure and function information has been saved to {self.combined_file}")
+
+# Writer for functions.jsonl
+class JsonLinesWriter(OutputWriter):
+    ### Stream file entries as JSON Lines, one record per file.
+    def __init__(self, jsonl_file):
+        self.jsonl_file = jsonl_file
+        self.file = open_output_file(jsonl_file)
+
+    def write_entry(self, entry):
+        self.file.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+    def close(self):
+        replace_output_file(self.file, self.jsonl_file)
+        print(f"JSON Lines function information has been saved to {self.jsonl_file}")  # Print success message.
+
+# Writer for functions.bin
+class BinaryWriter(OutputWriter):
+    ### Stream file entries to the indexed binary format read by BinaryExportReader.
+    ### Layout: header, one compact JSON record per file, the file paths, an index sorted by path, and a footer locating the index.
+    def __init__(self, binary_file):
+        self.binary_file = binary_file
+        self.file = open_output_file(binary_file, binary=True)
+        self.file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0))
+        self.offset = BINARY_HEADER.size
+        self.records = []  # (path, record offset, record length) of every record written so far.
+
+    def write_entry(self, entry):
+        record = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.file.write(record)
+        self.records.append((entry['file'].encode('utf-8'), self.offset, len(record)))
+        self.offset += len(record)
+
+    def close(self):
+        self.records.sort(key=lambda record: record[0])  # Stable, so records of the same path keep their order.
+        path_offsets = []
+        for path, _, _ in self.records:
+            path_offsets.append(self.offset)
+            self.file.write(path)
+            self.offset += len(path)
+        index_offset = self.offset
+        for path_offset, (path, record_offset, record_length) in zip(path_offsets, self.records):
+            self.file.write(BINARY_INDEX_ENTRY.pack(path_offset, len(path), record_offset, record_length))
+        self.file.write(BINARY_FOOTER.pack(index_offset, len(self.records), BINARY_MAGIC))
+        replace_output_file(self.file, self.binary_file)
+        print(f"Binary function information has been saved to {self.binary_file}")  # Print success message.
+
+# Reader for functions.bin
+class BinaryExportReader:
+    ### Memory-map a binary export and look up single files without loading the other records.
+    ### Raises ValueError for files that are not a complete binary export of this layout version.
+    def __init__(self, binary_file):
+        error = ValueError(f"'{binary_file}' is not a version {BINARY_VERSION} binary export")
+        with open(binary_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < BINARY_HEADER.size + BINARY_FOOTER.size:
+                raise error  # Too short for a header and a footer (and empty files cannot be memory-mapped).
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _ = BINARY_HEADER.unpack_from(self.data, 0)
+        self.index_offset, self.count, footer_magic = BINARY_FOOTER.unpack_from(self.data, len(self.data) - BINARY_FOOTER.size)
+        index_end = self.index_offset + self.count * BINARY_INDEX_ENTRY.size
+        if magic != BINARY_MAGIC or footer_magic != BINARY_MAGIC or version != BINARY_VERSION or not BINARY_HEADER.size <= self.index_offset <= index_end <= len(self.data) - BINARY_FOOTER.size:
+            self.data.close()
+            raise error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def _index_entry(self, position):
+        return BINARY_INDEX_ENTRY.unpack_from(self.data, self.index_offset + position * BINARY_INDEX_ENTRY.size)
+
+    def _path(self, position):
+        path_offset, path_length, _, _ = self._index_entry(position)
+        return self.data[path_offset:path_offset + path_length]
+
+    def _record(self, position):
+        _, _, record_offset, record_length = self._index_entry(position)
+        return json.loads(self.data[record_offset:record_offset + record_length])
+
+    def files(self):
+        ### Return the relative paths in the export, sorted.
+        return [self._path(position).decode('utf-8') for position in range(self.count)]
+
+    def get(self, relative_file_path):
+        ### Return the entries (one per language) recorded for a file, found by binary search over the sorted index.
+        path = relative_file_path.encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._path(middle) < path:
+                low = middle + 1
+            else:
+                high = middle
+        entries = []
+        while low < self.count and self._path(low) == path:
+            entries.append(self._record(low))
+            low += 1
+        return entries
+
+    def close(self):
+        self.data.close()
+
+# Writer for the partial results of a shard
+class ShardWriter(OutputWriter):
+    ### Write the partial results of a shard run as JSON Lines for merge_shards(): a header, then the raw tree lines of
+    ### every directory, then the file entries, each record tagged with its top-level subtree.
+    ### Tree lines are recorded before TreeLineEmitter sees them, since whether a trailing connector line is dropped
+    ### depends on what the other shards add after it.
+    def __init__(self, shard_file, root_name, shard_index, shard_count):
+        self.shard_file = shard_file
+        self.header = {'root': root_name, 'shard': shard_index, 'shards': shard_count, 'directories': 0}
+        self.directories = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+', encoding='utf-8')
+        self.entries = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+', encoding='utf-8')
+
+    def write_directory(self, subtree, tree_lines):
+        ### Record the tree lines render_directory() returned for a directory of the subtree.
+        self.directories.write(json.dumps({'subtree': subtree, 'tree_lines': tree_lines}, ensure_ascii=False) + "\n")
+        self.header['directories'] += 1
+
+    def write_entry(self, entry):
+        subtree = top_level_subtree(os.path.dirname(entry['file']) or '.')
+        self.entries.write(json.dumps({'subtree': subtree, 'entry': entry}, ensure_ascii=False) + "\n")
+
+    def close(self):
+        shard_dir = os.path.dirname(self.shard_file)
+        if shard_dir and not os.path.exists(shard_dir):
+            os.makedirs(shard_dir)
+        file = open_output_file(self.shard_file)
+        file.write(json.dumps(self.header, ensure_ascii=False) + "\n")
+        for spool in (self.directories, self.entries):
+            spool.seek(0)
+            shutil.copyfileobj(spool, file)
+            spool.close()
+        replace_output_file(file, self.shard_file)
+        print(f"Shard {self.header['shard']} of {self.header['shards']} has been saved to {self.shard_file}")  # Print success message.
+
+# Helper function to read one section of a shard file
+def iter_shard_records(shard_file, section):
+    ### Yield the 'directories' or 'entries' records of a file written by ShardWriter, in order.
+    with open(shard_file, encoding='utf-8') as f:
+        directory_count = json.loads(f.readline())['directories']
+        for index, line in enumerate(f):
+            if index < directory_count:
+                if section == 'directories':
+                    yield json.loads(line)
+            elif section == 'entries':
+                yield json.loads(line)
+            else:
+                return
+
+# Record returned by symbol index lookups
+class Symbol:
+    ### One function, class or method: its name, kind, file, line (None when unknown, as for classes) and class (methods only).
+    __slots__ = ('name', 'kind', 'file', 'line', 'class_name')
+
+    def __init__(self, name, kind, file, line, class_name):
+        self.name = name
+        self.kind = kind
+        self.file = file
+        self.line = line
+        self.class_name = class_name
+
+    def __eq__(self, other):
+        return isinstance(other, Symbol) and all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self):
+        return f"Symbol({self.name!r}, {self.kind!r}, {self.file!r}, {self.line!r}, {self.class_name!r})"
+
+# Index of the symbols of a run
+class SymbolIndex:
+    ### Map function, class and method names to where they are defined, with exact, prefix and case-insensitive lookups.
+    ### Symbols are stored column-wise in arrays of small integers, and every distinct name and path is stored once, so
+    ### millions of symbols stay compact; lookups materialize Symbol records only for the symbols they return.
+    ### Methods directly follow their class, so a class's methods are the run of symbols whose parent is the class.
+    NO_PARENT = 0xFFFFFFFF  # Parent of functions and classes.
+
+    def __init__(self):
+        self.names = []  # Distinct names, sorted once the index is frozen.
+        self.files = []  # Distinct relative file paths, in walk order.
+        self.kinds = array('B')  # Per symbol: position in SYMBOL_KINDS.
+        self.name_ids = array('I')  # Per symbol: position in names.
+        self.file_ids = array('I')  # Per symbol: position in files.
+        self.lines = array('I')  # Per symbol: line number, 0 when unknown.
+        self.parents = array('I')  # Per symbol: symbol of its class, or NO_PARENT.
+        self.by_name = None  # Symbols sorted by name (then walk order) once frozen.
+        self.name_starts = None  # Position in by_name of the first symbol of every name once frozen, plus the total.
+        self.folded = None  # (sorted casefolded names, their name ids) built by the first case-insensitive lookup.
+        self.name_lookup = None  # Name -> position in names, while symbols are being added.
+        self.file_lookup = None  # Path -> position in files, while symbols are being added.
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __iter__(self):
+        ### Yield every symbol in walk order.
+        return (self._symbol(symbol_id) for symbol_id in range(len(self.kinds)))
+
+    def _intern(self, table, lookup, value):
+        position = lookup.get(value)
+        if position is None:
+            position = lookup[value] = len(table)
+            table.append(value)
+        return position
+
+    def _add(self, name, kind, file_id, line, parent):
+        self.kinds.append(kind)
+        self.name_ids.append(self._intern(self.names, self.name_lookup, name))
+        self.file_ids.append(file_id)
+        self.lines.append(line)
+        self.parents.append(parent)
+        return len(self.kinds) - 1
+
+    def add_entry(self, entry):
+        ### Add the functions, classes and methods of a file entry.
+        if self.name_lookup is None:
+            self.name_lookup = {name: position for position, name in enumerate(self.names)}
+            self.file_lookup = {path: position for position, path in enumerate(self.files)}
+        self.by_name = self.name_starts = self.folded = None
+        file_id = self._intern(self.files, self.file_lookup, entry['file'])
+        for function in entry['functions']:
+            self._add(function['name'], 0, file_id, function['line'], self.NO_PARENT)
+        for class_info in entry['classes']:
+            class_id = self._add(class_info['name'], 1, file_id, 0, self.NO_PARENT)
+            for method in class_info['functions']:
+                self._add(method['name'], 2, file_id, method['line'], class_id)
+
+    def freeze(self):
+        ### Sort the names and build the by-name order used by lookups; called by them when symbols were added since.
+        if self.by_name is not None:
+            return
+        order = sorted(range(len(self.names)), key=self.names.__getitem__)
+        ranks = array('I', bytes(4 * len(order)))  # Old name id -> sorted position.
+        for rank, name_id in enumerate(order):
+            ranks[name_id] = rank
+        self.names = [self.names[name_id] for name_id in order]
+        self.name_ids = array('I', [ranks[name_id] for name_id in self.name_ids])
+        self.by_name = array('I', sorted(range(len(self.name_ids)), key=self.name_ids.__getitem__))
+        counts = [0] * (len(self.names) + 1)
+        for name_id in self.name_ids:
+            counts[name_id + 1] += 1
+        for position in range(len(self.names)):
+            counts[position + 1] += counts[position]
+        self.name_starts = array('I', counts)
+        self.name_lookup = self.file_lookup = None
+
+    def _symbol(self, symbol_id):
+        parent = self.parents[symbol_id]
+        return Symbol(
+            self.names[self.name_ids[symbol_id]],
+            SYMBOL_KINDS[self.kinds[symbol_id]],
+            self.files[self.file_ids[symbol_id]],
+            self.lines[symbol_id] or None,
+            self.names[self.name_ids[parent]] if parent != self.NO_PARENT else None
+        )
+
+    def _matching_name_ids(self, name, prefix, ignore_case):
+        ### Return the ids of the names equal to name, or starting with it, by binary search over the sorted names.
+        self.freeze()
+        if ignore_case:
+            if self.folded is None:
+                order = sorted(range(len(self.names)), key=lambda name_id: self.names[name_id].casefold())
+                self.folded = ([self.names[name_id].casefold() for name_id in order], order)
+            names, name_ids = self.folded
+            name = name.casefold()
+        else:
+            names, name_ids = self.names, None
+        low = bisect_left(names, name)
+        if prefix:
+            high = bisect_right(names, name, low, key=lambda item: item[:len(name)])
+        else:
+            high = bisect_right(names, name, low)
+        return name_ids[low:high] if name_ids is not None else range(low, high)
+
+    def find(self, name, prefix=False, ignore_case=False):
+        ### Return the symbols named name (starting with it when prefix=True, ignoring case when ignore_case=True),
+        ### grouped by name and in walk order within a name.
+        symbols = []
+        for name_id in self._matching_name_ids(name, prefix, ignore_case):
+            for position in range(self.name_starts[name_id], self.name_starts[name_id + 1]):
+                symbols.append(self._symbol(self.by_name[position]))
+        return symbols
+
+    def methods(self, class_name):
+        ### Return the methods of every class named class_name, in walk order.
+        methods = []
+        for name_id in self._matching_name_ids(class_name, False, False):
+            for position in range(self.name_starts[name_id], self.name_starts[name_id + 1]):
+                class_id = self.by_name[position]
+                if self.kinds[class_id] != 1:
                     continue
+                symbol_id = class_id + 1
+                while symbol_id < len(self.parents) and self.parents[symbol_id] == class_id:
+                    methods.append(self._symbol(symbol_id))
+                    symbol_id += 1
+        return methods
+
+    def save(self, symbols_file):
+        ### Save the frozen index: a header, then length-prefixed sections holding the names and paths joined by NUL bytes and
+        ### every column as little-endian integers.
+        self.freeze()
+        file = open_output_file(symbols_file, binary=True)
+        file.write(SYMBOLS_HEADER.pack(SYMBOLS_MAGIC, SYMBOLS_VERSION, 0))
+        sections = ['\0'.join(self.names).encode('utf-8'), '\0'.join(self.files).encode('utf-8')]
+        for column in (self.kinds, self.name_ids, self.file_ids, self.lines, self.parents, self.by_name, self.name_starts):
+            if sys.byteorder != 'little':
+                column = array(column.typecode, column)
+                column.byteswap()
+            sections.append(column.tobytes())
+        for section in sections:
+            file.write(SYMBOLS_SECTION.pack(len(section)))
+            file.write(section)
+        replace_output_file(file, symbols_file)
+
+    @classmethod
+    def load(cls, symbols_file):
+        ### Load an index saved by save(), ready for lookups.
+        with open(symbols_file, 'rb') as f:
+            data = f.read()
+        magic, version, _ = SYMBOLS_HEADER.unpack_from(data, 0) if len(data) >= SYMBOLS_HEADER.size else (None, None, None)
+        if magic != SYMBOLS_MAGIC or version != SYMBOLS_VERSION:
+            raise ValueError(f"'{symbols_file}' is not a version {SYMBOLS_VERSION} symbol index")
+        sections = []
+        offset = SYMBOLS_HEADER.size
+        view = memoryview(data)
+        while offset < len(data):
+            (length,) = SYMBOLS_SECTION.unpack_from(data, offset)
+            offset += SYMBOLS_SECTION.size
+            sections.append(view[offset:offset + length])
+            offset += length
+        index = cls()
+        index.names = str(sections[0], 'utf-8').split('\0') if len(sections[0]) else []
+        index.files = str(sections[1], 'utf-8').split('\0') if len(sections[1]) else []
+        columns = []
+        for typecode, section in zip('BIIIIII', sections[2:]):
+            column = array(typecode)
+            column.frombytes(section)
+            if sys.byteorder != 'little':
+                column.byteswap()
+            columns.append(column)
+        index.kinds, index.name_ids, index.file_ids, index.lines, index.parents, index.by_name, index.name_starts = columns
+        return index
+
+# Writer that collects file entries into a symbol index
+class SymbolIndexWriter(OutputWriter):
+    ### Add every file entry to a SymbolIndex, and save it when closed if a symbols_file is given.
+    def __init__(self, symbols, symbols_file=None):
+        self.symbols = symbols
+        self.symbols_file = symbols_file
+
+    def write_entry(self, entry):
+        self.symbols.add_entry(entry)
+
+    def close(self):
+        self.symbols.freeze()
+        if self.symbols_file:
+            self.symbols.save(self.symbols_file)
+            print(f"Symbol index has been saved to {self.symbols_file}")  # Print success message.
+
+# Profiler for instrumented runs
+class RunProfiler:
+    ### Collect wall and CPU time per phase and per language, run counters and the slowest files of a profiled run.
+    ### Phase times are exclusive: time spent in a nested phase is not counted again in the phase around it.
+    def __init__(self, top_files=PROFILE_TOP_FILES, stats=False):
+        self.top_files = top_files
+        self.phases = {}  # Phase name -> [wall seconds, CPU seconds, calls].
+        self.languages = {}  # Language -> per-language totals of the extracted files.
+        self.counters = {'directories': 0, 'files_listed': 0, 'jobs': 0, 'files_extracted': 0, 'bytes_read': 0, 'functions': 0, 'classes': 0, 'methods': 0}
+        self.slowest_files = []  # Min-heap of (wall seconds, relative path, language, bytes) of the slowest files.
+        self.stack = []  # [phase name, wall start, CPU start] of the phases currently entered, innermost last.
+        self.cprofile = cProfile.Profile() if stats else None
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        self.started = (time.perf_counter(), time.process_time())
+
+    def enter(self, phase):
+        ### Start timing a phase, pausing the phase it is nested in.
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self.stack:
+            self._charge(self.stack[-1], wall, cpu, 0)
+        self.stack.append([phase, wall, cpu])
+
+    def leave(self):
+        ### Stop timing the innermost phase and resume the phase around it.
+        wall, cpu = time.perf_counter(), time.process_time()
+        self._charge(self.stack.pop(), wall, cpu, 1)
+        if self.stack:
+            self.stack[-1][1:] = [wall, cpu]
+
+    def _charge(self, frame, wall, cpu, calls):
+        totals = self.phases.setdefault(frame[0], [0.0, 0.0, 0])
+        totals[0] += wall - frame[1]
+        totals[1] += cpu - frame[2]
+        totals[2] += calls
+
+    def time_iterator(self, phase, iterable):
+        ### Yield the items of iterable, timing the work done to produce each one as phase.
+        iterator = iter(iterable)
+        while True:
+            self.enter(phase)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.leave()
+            yield item
+
+    def record_file(self, job, result, stats):
+        ### Add the stats of an extracted file, as returned by extract_functions_timed(), to the per-language totals.
+        bytes_read, read_wall, read_cpu, parse_wall, parse_cpu = stats
+        _, language, relative_file_path = job
+        functions = len(result['functions'])
+        classes = len(result['classes'])
+        methods = sum(len(class_info['functions']) for class_info in result['classes'])
+        totals = self.languages.setdefault(language, {'files': 0, 'bytes': 0, 'functions': 0, 'classes': 0, 'methods': 0, 'read_wall': 0.0, 'read_cpu': 0.0, 'parse_wall': 0.0, 'parse_cpu': 0.0})
+        for key, value in (('files', 1), ('bytes', bytes_read), ('functions', functions), ('classes', classes), ('methods', methods), ('read_wall', read_wall), ('read_cpu', read_cpu), ('parse_wall', parse_wall), ('parse_cpu', parse_cpu)):
+            totals[key] += value
+        self.counters['files_extracted'] += 1
+        self.counters['bytes_read'] += bytes_read
+        slow_file = (read_wall + parse_wall, relative_file_path, language, bytes_read)
+        if len(self.slowest_files) < self.top_files:
+            heapq.heappush(self.slowest_files, slow_file)
+        elif self.top_files:
+            heapq.heappushpop(self.slowest_files, slow_file)
+
+    def record_entry(self, entry):
+        ### Count the functions and classes of a written entry, including entries served from the cache.
+        self.counters['jobs'] += 1
+        self.counters['functions'] += len(entry['functions'])
+        self.counters['classes'] += len(entry['classes'])
+        self.counters['methods'] += sum(len(class_info['functions']) for class_info in entry['classes'])
+
+    def report(self, settings):
+        ### Return the report as a JSON-serializable dictionary.
+        total_wall = time.perf_counter() - self.started[0]
+        total_cpu = time.process_time() - self.started[1]
+        phases = {phase: {'wall': wall, 'cpu': cpu, 'calls': calls} for phase, (wall, cpu, calls) in sorted(self.phases.items())}
+        phases['other'] = {'wall': total_wall - sum(wall for wall, _, _ in self.phases.values()), 'cpu': total_cpu - sum(cpu for _, cpu, _ in self.phases.values()), 'calls': 1}
+        return {
+            'generator_version': GENERATOR_VERSION,
+            'settings': settings,
+            'total': {'wall': total_wall, 'cpu': total_cpu},
+            'phases': phases,
+            'languages': {language: self.languages[language] for language in sorted(self.languages)},
+            'counters': self.counters,
+            'slowest_files': [{'file': path, 'language': language, 'wall': wall, 'bytes': size} for wall, path, language, size in sorted(self.slowest_files, reverse=True)],
+        }
+
+    def save(self, settings, report_file, stats_file=None):
+        ### Write the JSON report and, when cProfile was enabled, dump its statistics.
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        for output_file in (report_file, stats_file if self.cprofile is not None else None):
+            output_dir = os.path.dirname(output_file) if output_file else ''
+            if output_dir and not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(self.report(settings), f, indent=2)
+        print(f"Profile report has been saved to {report_file}")  # Print success message.
+        if self.cprofile is not None:
+            self.cprofile.dump_stats(stats_file)
+            print(f"Profile statistics have been saved to {stats_file}")  # Print success message.
+
+# Writer wrapper for profiled runs
+class ProfiledWriter(OutputWriter):
+    ### Time every call made to a wrapped writer as the 'write' phase of a RunProfiler.
+    def __init__(self, writer, profiler):
+        self.writer = writer
+        self.profiler = profiler
+
+    def write_tree_line(self, line):
+        self.profiler.enter('write')
+        self.writer.write_tree_line(line)
+        self.profiler.leave()
+
+    def end_tree(self):
+        self.profiler.enter('write')
+        self.writer.end_tree()
+        self.profiler.leave()
+
+    def write_entry(self, entry):
+        self.profiler.enter('write')
+        self.writer.write_entry(entry)
+        self.profiler.leave()
+
+    def close(self):
+        self.profiler.enter('write')
+        self.writer.close()
+        self.profiler.leave()
+
+# Helper function to render one directory of the tree
+def render_directory(dirpath, relative_path, depth, dirnames, filenames, matcher, return_folders_only):
+    ### Return (tree_lines, jobs) for a directory listed by walk_project(), where jobs are its (file_path, language, relative_file_path) extraction jobs.
+    current_dir_name = os.path.basename(dirpath)  # Get the current directory name.
+    if matcher.is_ignored_directory(current_dir_name):
+        return [], []
+
+    tree_lines = []
+    indent = '│   ' * depth  # Create the indent for the current depth.
+    subindent = '│   ' * (depth + 1)  # Create the subindent for subdirectories.
+
+    if return_folders_only:  # Check if only folder names should be returned.
+        if relative_path != '.':
+            tree_lines.append(f"{indent}├── {current_dir_name}/")  # Add the directory to the tree.
+        return tree_lines, []  # Skip the rest of the logic for files if we only want folders.
+
+    # Identify unique files based on the patterns.
+    jobs = []  # Extraction jobs of this directory.
+    pattern_dict = {}  # Dictionary to hold the first and last file matching each pattern.
+    files_of_interest = set()  # Set to hold files that match the patterns.
+
+    for file in filenames:  # Iterate through files in the current directory.
+        classification = matcher.classify_file(file)  # Hidden, ignored and excluded files are None.
+        if classification is None:
+            continue
+        key, file_languages = classification
+        if key is not None:
+            if key not in pattern_dict:
+                pattern_dict[key] = {"first": file, "last": file}
+            else:
+                pattern_dict[key]["last"] = file
+        else:
+            files_of_interest.add(file)
+
+        # Extract functions and classes from the file if it matches a language's extension
+        for lang in file_languages:
+            relative_file_path = os.path.join(relative_path, file) if relative_path != '.' else file
+            jobs.append((os.path.join(dirpath, file), lang, relative_file_path))
+
+    for files in pattern_dict.values():  # Add identified files to interest set.
+        files_of_interest.add(files["first"])
+        files_of_interest.add(files["last"])
+
+    # Add directory line for folder to tree.
+    if relative_path != '.':
+        tree_lines.append(f"{indent}├── {current_dir_name}/")
+
+    # Append files of interest with correct connector
+    sorted_files_of_interest = sorted(files_of_interest)  # Sort files of interest.
+    for i, filename in enumerate(sorted_files_of_interest):  # Add files to tree.
+        is_last_file = (i == len(sorted_files_of_interest) - 1)  # Check if last file.
+        has_subdirectories = bool(dirnames)  # Check for subdirectories.
+        connector = "└──" if is_last_file and not has_subdirectories else "├──"
+        tree_lines.append(f"{subindent}{connector} {filename}")
+
+    # Add break line if necessary.
+    if not dirnames and sorted_files_of_interest and sorted_files_of_interest[-1].endswith('.py'):
+        tree_lines.append(indent + '│')  # Add break line.
+
+    return tree_lines, jobs
+
+# Emitter of tree lines
+class TreeLineEmitter:
+    ### Send tree lines to the writers, holding back connector lines so trailing ones can be dropped.
+    def __init__(self, writers):
+        self.writers = writers
+        self.pending_connector_lines = []  # Trailing connector lines, only written once a real line follows them.
+
+    def emit(self, line):
+        ### Write a tree line, holding back connector lines so trailing ones can be dropped.
+        if line.strip() == "│" or line.strip() == "":
+            self.pending_connector_lines.append(line)
+            return
+        for pending_line in self.pending_connector_lines + [line]:
+            for writer in self.writers:
+                writer.write_tree_line(pending_line)
+        self.pending_connector_lines.clear()
+
+    def end(self):
+        ### Drop trailing connector lines and close the tree section of every writer.
+        self.pending_connector_lines.clear()
+        for writer in self.writers:
+            writer.end_tree()
+
+# Watcher that keeps the outputs up to date
+class ProjectWatcher:
+    ### Keep the rendered tree and the extraction results of a project in memory, and rewrite the outputs when files change.
+    ### Changes are found by polling: a directory whose mtime changed is listed and rendered again, and a file whose
+    ### mtime or size changed is extracted again. Everything else is reused from memory.
+    def __init__(self, project_dir, max_depth, matcher, return_folders_only, open_writers, extract):
+        self.project_dir = project_dir
+        self.max_depth = max_depth
+        self.matcher = matcher
+        self.return_folders_only = return_folders_only
+        self.open_writers = open_writers  # Returns a fresh list of writers for every rewrite.
+        self.extract = extract  # Yields (job, result) pairs for an iterable of jobs, in order.
+        self.directories = {}  # Relative path -> record of a walked directory.
+        self.results = {}  # Job -> extraction result.
+        self.file_stats = {}  # File path -> (mtime_ns, size) when it was last extracted.
+
+    def _stat_key(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _add_directory(self, dirpath, relative_path, depth, dirnames, filenames):
+        ### Render a listed directory and store its record; return the jobs that need extracting.
+        stat_key = self._stat_key(dirpath)
+        tree_lines, jobs = render_directory(dirpath, relative_path, depth, dirnames, filenames, self.matcher, self.return_folders_only)
+        self.directories[relative_path] = {'dirpath': dirpath, 'depth': depth, 'mtime_ns': stat_key and stat_key[0], 'dirnames': dirnames, 'children': [], 'tree_lines': tree_lines, 'jobs': jobs}
+        return [job for job in jobs if job not in self.results]
+
+    def _walk(self, start=None):
+        ### Walk the project, or the subtree of start=(dirpath, relative_path, depth), and return the jobs that need extracting.
+        walked = []
+        to_extract = []
+        for dirpath, relative_path, depth, dirnames, filenames in walk_project(self.project_dir, self.max_depth, self.matcher.should_prune_directory, start):
+            to_extract.extend(self._add_directory(dirpath, relative_path, depth, dirnames, filenames))
+            walked.append(relative_path)
+        for relative_path in walked:  # Link each directory to the subdirectories the walk descended into.
+            record = self.directories[relative_path]
+            record['children'] = [name for name in record['dirnames'] if self._child_path(relative_path, name) in self.directories]
+        return to_extract
+
+    def _child_path(self, relative_path, name):
+        return os.path.join(relative_path, name) if relative_path != '.' else name
+
+    def _remove_subtree(self, relative_path):
+        ### Forget a directory, its subdirectories and their extraction results.
+        record = self.directories.pop(relative_path)
+        for job in record['jobs']:
+            self.results.pop(job, None)
+            self.file_stats.pop(job[0], None)
+        for name in record['children']:
+            self._remove_subtree(self._child_path(relative_path, name))
+
+    def _relist(self, relative_path):
+        ### List and render a changed directory again, walk its new subdirectories and forget removed ones.
+        ### Returns the jobs that need extracting.
+        record = self.directories[relative_path]
+        listing = next(walk_project(self.project_dir, None, self.matcher.should_prune_directory, (record['dirpath'], relative_path, record['depth'])), None)
+        if listing is None:  # The directory is gone; its parent's listing drops it.
+            self._remove_subtree(relative_path)
+            return []
+        old_jobs = set(record['jobs'])
+        to_extract = self._add_directory(*listing)
+        new_record = self.directories[relative_path]
+        for job in old_jobs.difference(new_record['jobs']):
+            self.results.pop(job, None)
+            self.file_stats.pop(job[0], None)
+        child_depth = record['depth'] + 1 if relative_path != '.' else 0  # Top-level directories share the root's depth.
+        children = []
+        for name in new_record['dirnames']:
+            child_path = self._child_path(relative_path, name)
+            if name in record['children']:
+                children.append(name)
+            elif (self.max_depth is None or child_depth < self.max_depth) and not os.path.islink(os.path.join(record['dirpath'], name)):
+                to_extract.extend(self._walk((os.path.join(record['dirpath'], name), child_path, child_depth)))
+                children.append(name)
+        for name in record['children']:
+            if name not in new_record['dirnames']:
+                self._remove_subtree(self._child_path(relative_path, name))
+        new_record['children'] = children
+        return to_extract
+
+    def _iter_directories(self):
+        ### Yield (relative_path, record) of every directory in walk order.
+        stack = ['.'] if '.' in self.directories else []
+        while stack:
+            relative_path = stack.pop()
+            record = self.directories[relative_path]
+            yield relative_path, record
+            stack.extend(self._child_path(relative_path, name) for name in reversed(record['children']))
+
+    def _extract(self, jobs):
+        for job in jobs:
+            self.file_stats[job[0]] = self._stat_key(job[0])  # Taken before reading, so a save during extraction is seen by the next poll.
+        for job, result in self.extract(jobs):
+            self.results[job] = result
+
+    def full_pass(self):
+        ### Walk and extract the whole project.
+        self.directories.clear()
+        self.results.clear()
+        self.file_stats.clear()
+        self._extract(self._walk())
+
+    def poll(self):
+        ### Apply the changes made since the last poll and return the number of changed directories and files.
+        changed_directories = []
+        for relative_path, record in self._iter_directories():
+            stat_key = self._stat_key(record['dirpath'])
+            if stat_key is None or stat_key[0] != record['mtime_ns']:
+                changed_directories.append(relative_path)
+        to_extract = []
+        for relative_path in changed_directories:  # Parents come first, so removed subtrees are skipped.
+            if relative_path in self.directories:
+                to_extract.extend(self._relist(relative_path))
+        changed_files = {file_path for file_path, stat_key in self.file_stats.items() if self._stat_key(file_path) != stat_key}
+        if changed_files:
+            for _, record in self._iter_directories():
+                to_extract.extend(job for job in record['jobs'] if job[0] in changed_files)
+        if to_extract:
+            self._extract(to_extract)
+        return len(changed_directories), len(changed_files)
+
+    def write_outputs(self):
+        ### Rewrite every output from the records in memory.
+        writers = self.open_writers()
+        emitter = TreeLineEmitter(writers)
+        emitter.emit(os.path.basename(os.path.normpath(self.project_dir)) + "/")  # Start the tree with the root directory.
+        records = [record for _, record in self._iter_directories()]
+        for record in records:
+            for line in record['tree_lines']:
+                emitter.emit(line)
+        emitter.end()
+        for record in records:
+            for job in record['jobs']:
+                data = self.results[job]
+                entry = {
+                    'file': job[2],
+                    'language': job[1],
+                    'functions': data['functions'],
+                    'classes': data['classes'],
+                    'file_description': data['file_description']
+                }
+                for writer in writers:
+                    writer.write_entry(entry)
+        for writer in writers:
+            writer.close()
+
+    def run(self, interval=WATCH_INTERVAL, debounce=WATCH_DEBOUNCE):
+        ### Run a full pass, write the outputs, then poll every interval seconds until interrupted.
+        ### Outputs are rewritten once no further change was seen for debounce seconds.
+        self.full_pass()
+        self.write_outputs()
+        print(f"Watching {self.project_dir} for changes (Ctrl+C to stop)")
+        last_change = None  # Time of the last change not yet written.
+        try:
+            while True:
+                time.sleep(interval if last_change is None else min(interval, debounce))
+                changed_directories, changed_files = self.poll()
+                if changed_directories or changed_files:
+                    print(f"Detected changes: {changed_directories} directories, {changed_files} files")
+                    last_change = time.monotonic()
+                elif last_change is not None and time.monotonic() - last_change >= debounce:
+                    self.write_outputs()
+                    last_change = None
+        except KeyboardInterrupt:
+            if last_change is not None:
+                self.write_outputs()  # Do not lose changes seen just before stopping.
+
+# Helper function to open the writers of the enabled outputs
+def open_output_writers(symbols, output_file, functions_file, combined_file, export_structure, export_functions, export_combined, export_jsonl, jsonl_file, export_binary, binary_file, export_symbols, symbols_file):
+    ### Return a writer collecting the entries into symbols (unless symbols is None), followed by the writers of the enabled outputs.
+    writers = [SymbolIndexWriter(symbols, symbols_file if export_symbols else None)] if symbols is not None else []
+    if export_structure:
+        writers.append(StructureWriter(output_file))
+    if export_functions:
+        writers.append(FunctionsWriter(functions_file))
+    if export_combined:
+        writers.append(CombinedWriter(combined_file))
+    if export_jsonl:
+        writers.append(JsonLinesWriter(jsonl_file))
+    if export_binary:
+        writers.append(BinaryWriter(binary_file))
+    return writers
+
+# Result of a generate_project_structure() run
+class GenerationResult:
+    ### The output files a run wrote, its extraction cache counters (None without the cache), and the SymbolIndex of every
+    ### function, class and method it extracted (in watch mode, those of the last rewrite; None when it was not built).
+    __slots__ = ('outputs', 'cache_stats', 'symbols')
+
+    def __init__(self, outputs, cache_stats=None, symbols=None):
+        self.outputs = outputs
+        self.cache_stats = cache_stats
+        self.symbols = symbols
+
+    def __repr__(self):
+        return f"GenerationResult(outputs={self.outputs!r}, cache_stats={self.cache_stats!r}, symbols={len(self.symbols) if self.symbols is not None else None})"
+
+def generate_project_structure(project_dir,ignore_dirs,ignore_files,extensions_to_include,patterns,special_dir_patterns,languages,output_file,functions_file,combined_file,export_structure,export_functions,export_combined,return_folders_only,max_depth,include_all_files,workers=WORKERS,prefetch_threads=PREFETCH_THREADS,prefetch_bytes=PREFETCH_BYTES,use_cache=USE_CACHE,cache_file=CACHE_FILE,export_jsonl=EXPORT_JSONL,jsonl_file=JSONL_FILE,export_binary=EXPORT_BINARY,binary_file=BINARY_FILE,export_symbols=EXPORT_SYMBOLS,symbols_file=SYMBOLS_FILE,symbol_index=SYMBOL_INDEX,profile=PROFILE,profile_file=PROFILE_FILE,profile_stats=PROFILE_STATS,profile_stats_file=PROFILE_STATS_FILE,profile_top_files=PROFILE_TOP_FILES,file_source=FILE_SOURCE,since=SINCE_REVISION,shard=SHARD,shard_file=SHARD_FILE,watch=WATCH,watch_interval=WATCH_INTERVAL,watch_debounce=WATCH_DEBOUNCE):
+    ### Generate the project structure, extract functions/classes, and save to specified output files.
+    ### With watch=True the outputs are kept up to date until interrupted; caching and profiling only apply to single runs.
+    ### file_source='git' enumerates the files tracked in the git index instead of walking the file system (watch mode always walks).
+    ### since=<revision> only extracts files changed since that revision again and takes the others from the extraction cache.
+    ### shard=(index, count) only processes the subtrees of that shard and writes them to shard_file for merge_shards() (not in watch mode),
+    ### with an extraction cache of its own next to cache_file.
+    ### Returns a GenerationResult whose symbol index answers where functions, classes and methods are defined. Unlike the
+    ### streamed outputs, the index grows with the number of definitions; symbol_index=False leaves it out (unless export_symbols saves it).
+    profiler = RunProfiler(profile_top_files, profile_stats) if profile and not watch else None  # Only profiled runs pay for timers.
+
+    # Validate provided languages and filter based on extensions_to_include
+    valid_languages = LANGUAGE_PATTERNS.keys()
+    processed_languages = []
+    for lang in languages:
+        if lang not in valid_languages:
+            print(f"Warning: Language '{lang}' is not supported. Supported languages: {', '.join(valid_languages)}")
+        elif any(ext in extensions_to_include for ext in LANGUAGE_PATTERNS[lang]['extensions']):
+            processed_languages.append(lang)
+        else:
+            print(f"Warning: Language '{lang}' skipped as its extensions are not in extensions_to_include")
+
+    # Compile the ignore, special, grouping and extension settings into one matcher.
+    matcher = NameMatcher(ignore_dirs, ignore_files, special_dir_patterns, patterns, extensions_to_include, processed_languages, include_all_files)
+
+    outputs = [path for enabled, path in ((export_structure, output_file), (export_functions, functions_file), (export_combined, combined_file), (export_jsonl, jsonl_file), (export_binary, binary_file), (export_symbols, symbols_file)) if enabled]
+    shard_writer = None
+    if shard and not watch:
+        shard_file = shard_file.format(index=shard[0], count=shard[1])
+        shard_writer = ShardWriter(shard_file, os.path.basename(os.path.normpath(project_dir)), shard[0], shard[1])
+        cache_file = shard_cache_file(cache_file, shard[0], shard[1])
+        outputs = [shard_file]
+    result = GenerationResult(outputs)
+
+    # Helper function to set up the output writers.
+    def open_writers():
+        ### Return the writers of the enabled outputs; each one streams what it needs as the walk and extraction progress.
+        ### A fresh symbol index is collected on every call and becomes the one of the result.
+        ### A shard run only writes its shard file.
+        result.symbols = SymbolIndex() if symbol_index or export_symbols else None
+        if shard_writer:
+            writers = [SymbolIndexWriter(result.symbols), shard_writer] if result.symbols is not None else [shard_writer]
+        else:
+            writers = open_output_writers(result.symbols, output_file, functions_file, combined_file, export_structure, export_functions, export_combined, export_jsonl, jsonl_file, export_binary, binary_file, export_symbols, symbols_file)
+        if profiler:
+            writers = [ProfiledWriter(writer, profiler) for writer in writers]
+        return writers
+
+    # Keep the outputs up to date until interrupted.
+    if watch:
+        # Helper function to extract the jobs of changed files.
+        def extract_jobs(jobs):
+            return iter_extraction_results(jobs, workers, prefetch_threads=prefetch_threads, prefetch_bytes=prefetch_bytes)
+
+        ProjectWatcher(project_dir, max_depth, matcher, return_folders_only, open_writers, extract_jobs).run(watch_interval, watch_debounce)
+        return result
+
+    # List the tracked files, falling back to a file system walk when git is unavailable.
+    git_entries = None
+    if file_source == 'git':
+        git_entries = list_git_files(project_dir)
+        if git_entries is None:
+            print("Warning: Walking the file system instead of the git index")
+
+    # Find the tracked files not changed since the given revision. If the extraction cache was filled at that commit, their
+    # cached results are reused without hashing them; otherwise every file is checked as in a plain cached run.
+    # Untracked and git-ignored files are never trusted, since git diff does not report changes to them.
+    trusted_paths = None
+    since_commit = None  # Commit the given revision resolves to.
+    filled_commit = None  # Commit the tracked files match once this run has filled the cache, if they match HEAD.
+    if since:
+        changed_paths = list_git_changes(project_dir, since)
+        since_commit = resolve_git_commit(project_dir, since)
+        tracked_entries = git_entries if git_entries is not None else list_git_files(project_dir)
+        if changed_paths is None or since_commit is None or tracked_entries is None:
+            print("Warning: Checking every file against the extraction cache instead")
+        else:
+            trusted_paths = {os.path.normpath(path) for path, mode in tracked_entries} - changed_paths
+            head_commit = resolve_git_commit(project_dir, 'HEAD')
+            head_changes = changed_paths if head_commit == since_commit else list_git_changes(project_dir, 'HEAD')
+            if head_commit is not None and head_changes == set():
+                filled_commit = head_commit
+        use_cache = True  # Previous results live in the extraction cache.
+
+    writers = open_writers()
+    emitter = TreeLineEmitter(writers)
+
+    # Helper function to walk the tree and produce extraction jobs.
+    def iter_walk_jobs():
+        ### Walk through the directory tree, writing each directory's tree lines and then yielding its (file_path, language, relative_file_path) jobs.
+        if not shard_writer:
+            emitter.emit(os.path.basename(os.path.normpath(project_dir)) + "/")  # Start the tree with the root directory.
+        if git_entries is not None:
+            listing = walk_git_index(project_dir, max_depth, matcher.should_prune_directory, git_entries)
+            if shard_writer:
+                listing = (item for item in listing if shard_of(top_level_subtree(item[1]), shard[1]) == shard[0])
+        elif shard_writer:
+            listing = walk_shard(project_dir, max_depth, matcher.should_prune_directory, shard[0], shard[1])
+        else:
+            listing = walk_project(project_dir, max_depth, matcher.should_prune_directory)
+        for dirpath, relative_path, depth, dirnames, filenames in listing:
+            if profiler:
+                profiler.counters['directories'] += 1
+                profiler.counters['files_listed'] += len(filenames)
+            tree_lines, directory_jobs = render_directory(dirpath, relative_path, depth, dirnames, filenames, matcher, return_folders_only)
+            if shard_writer:
+                shard_writer.write_directory(top_level_subtree(relative_path), tree_lines)
+            else:
+                for line in tree_lines:
+                    emitter.emit(line)
+            yield from directory_jobs  # Jobs are yielded once the directory's tree lines are written.
+
+        # Clean up trailing connector lines.
+        if not shard_writer:
+            emitter.end()
+
+    # Extract functions and classes, serially or in a process pool, keeping the walk order.
+    walk_jobs = profiler.time_iterator('walk', iter_walk_jobs()) if profiler else iter_walk_jobs()
+    record = profiler.record_file if profiler else None
+    if use_cache:
+        cache_connection = open_extraction_cache(cache_file)
+        if trusted_paths is not None and read_cache_commit(cache_connection) != since_commit:
+            trusted_paths = None  # Filled at another commit (or with uncommitted changes): check every file.
+        cache_stats = result.cache_stats = {'hits': 0, 'misses': 0, 'evicted': 0}
+        extraction_results = iter_cached_extraction_results(walk_jobs, cache_connection, cache_stats, workers, prefetch_threads, prefetch_bytes, record, trusted_paths)
+    else:
+        extraction_results = iter_extraction_results(walk_jobs, workers, prefetch_threads=prefetch_threads, prefetch_bytes=prefetch_bytes, record=record)
+    if profiler:
+        extraction_results = profiler.time_iterator('extract', extraction_results)
+    for (file_path, lang, relative_file_path), data in extraction_results:
+        if 'warning' in data:
+            print(f"Warning: '{relative_file_path}' {data['warning']}")
+        entry = {
+            'file': relative_file_path,
+            'language': lang,
+            'functions': data['functions'],
+            'classes': data['classes'],
+            'file_description': data['file_description']
+        }
+        if profiler:
+            profiler.record_entry(entry)
+        for writer in writers:
+            writer.write_entry(entry)
+
+    # Report the extraction cache hit/miss counters.
+    if use_cache:
+        write_cache_commit(cache_connection, filled_commit)
+        cache_connection.commit()
+        cache_connection.close()
+        print(f"Extraction cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['evicted']} evicted ({cache_file})")
+
+    # Close the output files.
+    for writer in writers:
+        writer.close()
+
+    # Save the profiling report.
+    if profiler:
+        settings = {'workers': workers, 'prefetch_threads': prefetch_threads, 'use_cache': use_cache, 'max_depth': max_depth, 'languages': processed_languages}
+        if use_cache:
+            settings['cache'] = cache_stats
+        profiler.save(settings, profile_file, profile_stats_file)
+
+    return result
+
+# Helper function to merge the partial results of shard runs
+def merge_shards(shard_files, output_file, functions_file, combined_file, export_structure, export_functions, export_combined, export_jsonl=EXPORT_JSONL, jsonl_file=JSONL_FILE, export_binary=EXPORT_BINARY, binary_file=BINARY_FILE, export_symbols=EXPORT_SYMBOLS, symbols_file=SYMBOLS_FILE, symbol_index=SYMBOL_INDEX):
+    ### Combine the shard files of one run into the outputs a single run would write, and return a GenerationResult
+    ### (with a symbol index when symbol_index or export_symbols is set).
+    ### Every shard holds whole top-level subtrees in walk order, so a k-way merge on the subtree (the root, '', sorts
+    ### first, then the top-level directories in the sorted order the walk lists them) restores the walk order of both the
+    ### tree lines and the file entries; they are streamed through the same emitter and writers as a single run.
+    headers = []
+    for shard_file in shard_files:
+        with open(shard_file, encoding='utf-8') as f:
+            headers.append(json.loads(f.readline()))
+    shard_counts = {header['shards'] for header in headers}
+    roots = {header['root'] for header in headers}
+    if len(shard_counts) != 1 or len(roots) != 1 or sorted(header['shard'] for header in headers) != list(range(next(iter(shard_counts)))):
+        raise ValueError("Shard files must hold every shard of the same run exactly once")
+
+    outputs = [path for enabled, path in ((export_structure, output_file), (export_functions, functions_file), (export_combined, combined_file), (export_jsonl, jsonl_file), (export_binary, binary_file), (export_symbols, symbols_file)) if enabled]
+    result = GenerationResult(outputs, symbols=SymbolIndex() if symbol_index or export_symbols else None)
+    writers = open_output_writers(result.symbols, output_file, functions_file, combined_file, export_structure, export_functions, export_combined, export_jsonl, jsonl_file, export_binary, binary_file, export_symbols, symbols_file)
+    emitter = TreeLineEmitter(writers)
+    emitter.emit(roots.pop() + "/")  # Start the tree with the root directory.
+    for record in heapq.merge(*(iter_shard_records(shard_file, 'directories') for shard_file in shard_files), key=lambda record: record['subtree']):
+        for line in record['tree_lines']:
+            emitter.emit(line)
+    emitter.end()
+    for record in heapq.merge(*(iter_shard_records(shard_file, 'entries') for shard_file in shard_files), key=lambda record: record['subtree']):
+        for writer in writers:
+            writer.write_entry(record['entry'])
+    for writer in writers:
+        writer.close()
+    return result
+
+# Helper function to parse a --shard value
+def parse_shard(value):
+    ### Parse 'K/N' into (K, N) with 0 <= K < N.
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected K/N, got '{value}'")
+    if not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"expected K/N with 0 <= K < N, got '{value}'")
+    return index, count
 
-                if total_classes > 0:
-                    f.write(f" Total Classes: {total_classes}")
-                if total_methods > 0:
-                    f.write(f" Total Methods: {total_methods}")
-                if total_functions > 0:
-                    f.write(f" Total Functions: {total_functions}")
-                if entry['file_description']:
-                    f.write(f"\n  - File Description: {entry['file_description']}")
-                if total_classes > 0 or total_methods > 0 or total_functions > 0 or total_classes == 0 and total_methods == 0 and total_functions == 0 and entry['file_description']:
-                    f.write("\n")
-
-                # Write classes
-                for cls in entry['classes']:
-                    f.write(f"    Class: {cls['name']}\n")
-                    for func in cls['functions']:
-                        f.write(f"      Function: {func['name']}")
-                        if func['comment']:
-                            cleaned_comment = re.sub(r'^\/\*\*\*|\*\*\*\/$', '', func['comment'].strip()).strip()
-                            f.write(f"\n      - Function Description: {cleaned_comment}")
-                        f.write("\n")
-                        
-                # Write standalone functions
-                for func in entry['functions']:
-                    f.write(f"    Function: {func['name']} (Line {func['line']})")
-                    if func['comment']:
-                        cleaned_comment = re.sub(r'^\/\*\*\*|\*\*\*\/$', '', func['comment'].strip()).strip()
-                        f.write(f"\n    - Function Description: {cleaned_comment}")
-                    f.write("\n")
-                f.write("\n")
-        print(f"Combined structure and function information has been saved to {combined_file}")
+# Helper function to parse command line options
+def parse_arguments():
+    ### Parse command line options that override the configuration settings.
+    parser = argparse.ArgumentParser(description='Generate the project structure and function/class documentation.')
+    parser.add_argument('--workers', type=int, default=WORKERS, help='Number of worker processes used for function and class extraction (default: %(default)s).')
+    parser.add_argument('--prefetch', type=int, default=PREFETCH_THREADS, help='Number of threads reading upcoming files ahead of extraction, useful on network file systems (default: %(default)s).')
+    parser.add_argument('--prefetch-bytes', type=int, default=PREFETCH_BYTES, help='Budget, in bytes, of file contents read ahead of extraction (default: %(default)s).')
+    parser.add_argument('--source', choices=['walk', 'git'], default=FILE_SOURCE, help='Enumerate files by walking the file system or from the git index (default: %(default)s).')
+    parser.add_argument('--since', metavar='REV', default=SINCE_REVISION, help='Only extract files changed since this git revision again, reusing cached results for the rest (enables the cache).')
+    parser.add_argument('--shard', metavar='K/N', type=parse_shard, default=SHARD, help='Only process the root (shard 0) and the top-level directories hashed to shard K of N, writing partial results for --merge.')
+    parser.add_argument('--shard-file', default=SHARD_FILE, help='Output file path of the partial results of --shard; {index} and {count} are replaced (default: %(default)s).')
+    parser.add_argument('--merge', metavar='SHARD_FILE', nargs='+', help='Merge the partial results of every shard into the configured outputs instead of generating them.')
+    parser.add_argument('--watch', action=argparse.BooleanOptionalAction, default=WATCH, help='Keep running and rewrite the outputs whenever files change (default: %(default)s).')
+    parser.add_argument('--watch-interval', type=float, default=WATCH_INTERVAL, help='Seconds between two polls for changes (default: %(default)s).')
+    parser.add_argument('--watch-debounce', type=float, default=WATCH_DEBOUNCE, help='Seconds without further changes before the outputs are rewritten (default: %(default)s).')
+    parser.add_argument('--profile', action=argparse.BooleanOptionalAction, default=PROFILE, help=f'Save per-phase and per-language timings and counters to {PROFILE_FILE} (default: %(default)s).')
+    parser.add_argument('--profile-stats', action=argparse.BooleanOptionalAction, default=PROFILE_STATS, help=f'With --profile, also dump cProfile statistics to {PROFILE_STATS_FILE} (default: %(default)s).')
+    parser.add_argument('--profile-top', type=int, default=PROFILE_TOP_FILES, help='Number of slowest files listed in the profiling report (default: %(default)s).')
+    parser.add_argument('--jsonl', action=argparse.BooleanOptionalAction, default=EXPORT_JSONL, help=f'Export functions and classes as JSON Lines to {JSONL_FILE} (default: %(default)s).')
+    parser.add_argument('--binary', action=argparse.BooleanOptionalAction, default=EXPORT_BINARY, help=f'Export functions and classes in the indexed binary format to {BINARY_FILE} (default: %(default)s).')
+    parser.add_argument('--symbols', action=argparse.BooleanOptionalAction, default=EXPORT_SYMBOLS, help=f'Save the symbol index of functions, classes and methods to {SYMBOLS_FILE} (default: %(default)s).')
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction, default=USE_CACHE, help='Reuse cached extraction results for unchanged files (default: %(default)s).')
+    return parser.parse_args()
 
 # Entry point of the script.
 if __name__ == '__main__':
+    args = parse_arguments()
+    if args.merge:
+        merge_shards(
+            args.merge,
+            output_file=OUTPUT_FILE,
+            functions_file=FUNCTIONS_FILE,
+            combined_file=COMBINED_FILE,
+            export_structure=EXPORT_STRUCTURE,
+            export_functions=EXPORT_FUNCTIONS,
+            export_combined=EXPORT_COMBINED,
+            export_jsonl=args.jsonl,
+            export_binary=args.binary,
+            export_symbols=args.symbols,
+            symbol_index=False  # Only built when --symbols saves it; nothing else reads it.
+        )  # Merge the shards into the outputs.
+        raise SystemExit
     generate_project_structure(
         project_dir=PROJECT_DIR,
         ignore_dirs=IGNORE_DIRS,
@@ -418,5 +2460,23 @@ if __name__ == '__main__':
         export_combined=EXPORT_COMBINED,
         return_folders_only=RETURN_FOLDERS_ONLY,
         max_depth=MAX_DEPTH,
-        include_all_files=INCLUDE_ALL_FILES
+        include_all_files=INCLUDE_ALL_FILES,
+        workers=args.workers,
+        prefetch_threads=args.prefetch,
+        prefetch_bytes=args.prefetch_bytes,
+        use_cache=args.cache,
+        export_jsonl=args.jsonl,
+        export_binary=args.binary,
+        export_symbols=args.symbols,
+        symbol_index=False,  # Only built when --symbols saves it; nothing else reads it.
+        profile=args.profile,
+        profile_stats=args.profile_stats,
+        profile_top_files=args.profile_top,
+        file_source=args.source,
+        since=args.since,
+        shard=args.shard,
+        shard_file=args.shard_file,
+        watch=args.watch,
+        watch_interval=args.watch_interval,
+        watch_debounce=args.watch_debounce
     )  # Generate the project structure.
\ No newline at end of file
@@ -0,0 +1,47 @@
+import os  # Import os module for interacting with the operating system.
+import sys  # Import sys module for the import path.
+import contextlib  # Import contextlib module for silencing the generator's progress output.
+import io  # Import io module for the discarded progress output.
+import pytest  # Import pytest for the shared fixtures.
+
+# The generator and the benchmark modules are scripts at the top of the repository, not an installed package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Fixture that runs the generator on a project with every output written to a documentation directory
+@pytest.fixture
+def generate(monkeypatch):
+    ### Return a function generate(project_dir, docs_dir, **options) that runs generate_project_structure with the default
+    ### filters and the Python, PHP and JavaScript extractors, writing every output below docs_dir, and returns its GenerationResult.
+    import project_structure_generator as psg
+
+    def run(project_dir, docs_dir, **options):
+        monkeypatch.setattr(psg, 'DOCUMENTATION_DIR', str(docs_dir))  # The combined writer creates DOCUMENTATION_DIR.
+        settings = dict(
+            project_dir=str(project_dir),
+            ignore_dirs=psg.IGNORE_DIRS,
+            ignore_files=psg.IGNORE_FILES,
+            extensions_to_include=('.py', '.php', '.js'),
+            patterns=psg.PATTERNS,
+            special_dir_patterns=psg.SPECIAL_DIR_PATTERNS,
+            languages=['python', 'php', 'javascript'],
+            output_file=os.path.join(docs_dir, 'project_structure.txt'),
+            functions_file=os.path.join(docs_dir, 'functions.txt'),
+            combined_file=os.path.join(docs_dir, 'combined_structure.txt'),
+            export_structure=True,
+            export_functions=True,
+            export_combined=False,
+            return_folders_only=False,
+            max_depth=None,
+            include_all_files=False,
+            jsonl_file=os.path.join(docs_dir, 'functions.jsonl'),
+            binary_file=os.path.join(docs_dir, 'functions.bin'),
+            symbols_file=os.path.join(docs_dir, 'symbols.idx'),
+            cache_file=os.path.join(docs_dir, '.extraction_cache.sqlite'),
+            shard_file=os.path.join(docs_dir, 'shard_{index}_of_{count}.jsonl'),
+        )
+        settings.update(options)
+        os.makedirs(docs_dir, exist_ok=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return psg.generate_project_structure(**settings)
+
+    return run
@@ -0,0 +1,32 @@
+<?php
+/**
+ * Description: Keeps track of the items in a shopping cart.
+ * File: basic_class.php
+ */
+
+class Cart {
+    private $items = [];
+
+    public function add($item) {
+        /*** Add an item to the cart ***/
+        $this->items[] = $item;
+    }
+
+    public function count() {
+        /*** Number of items in the cart ***/
+        return count($this->items);
+    }
+
+    public function clear() {
+        $this->items = [];
+    }
+}
+
+function cart_total($cart) {
+    /*** Sum of the prices in a cart ***/
+    $total = 0;
+    foreach ($cart->items as $item) {
+        $total += $item->price;
+    }
+    return $total;
+}
@@ -0,0 +1,40 @@
+<?php
+/**
+ * Description: Functions whose comments span several lines
+ *     and one that is never closed.
+ * File: comments.php
+ */
+
+function multi_line() {
+    /*** First line
+         second line ***/
+    return 1;
+}
+
+function no_comment() {
+    return 2;
+}
+
+function trailing_text() {
+    /*** Comment ***/ return 3;
+}
+
+function stars_without_newline() { /*** Inline ***/ return 4; }
+
+class Commented {
+    public function documented() {
+        /***
+         * Block style
+         ***/
+        return 5;
+    }
+
+    public function undocumented() {
+        return 6;
+    }
+}
+
+function never_closed() {
+    /*** This comment has no end
+    return 7;
+}
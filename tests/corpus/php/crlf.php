@@ -0,0 +1,17 @@
+<?php
+/**
+ * Description: Windows line endings.
+ * File: crlf.php
+ */
+
+class Crlf {
+    public function first() {
+        /*** First method ***/
+        return 1;
+    }
+}
+
+function standalone() {
+    /*** Standalone ***/
+    return 2;
+}
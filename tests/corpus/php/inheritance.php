@@ -0,0 +1,33 @@
+<?php
+
+/**
+ * Base repository.
+ */
+abstract class Repository extends Model implements Countable, IteratorAggregate {
+    protected static function table() {
+        /*** Table the repository reads from ***/
+        return 'items';
+    }
+
+    abstract public function find($id);
+
+    private function connection() {
+        return Database::connect();
+    }
+}
+
+class UserRepository extends Repository {
+    public function find($id) {
+        /*** Find a user by id ***/
+        return $this->query("SELECT * FROM users WHERE id = ?", [$id]);
+    }
+}
+
+class Plain
+{
+    function legacyStyle()
+    {
+        /*** Brace on the next line ***/
+        return true;
+    }
+}
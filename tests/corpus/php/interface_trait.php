@@ -0,0 +1,20 @@
+<?php
+interface Shape {
+    public function area();
+}
+
+trait Named {
+    public function name() {
+        /*** Name of the shape ***/
+        return static::class;
+    }
+}
+
+class Square implements Shape {
+    use Named;
+
+    public function area() {
+        /*** Area of the square ***/
+        return $this->side * $this->side;
+    }
+}
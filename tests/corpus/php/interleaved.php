@@ -0,0 +1,33 @@
+<?php
+function first() {
+    /*** Before any class ***/
+    return 1;
+}
+
+class Alpha {
+    public function one() {
+        return 1;
+    }
+}
+
+if (!function_exists('second')) {
+    function second() {
+        /*** Declared inside an if block ***/
+        return 2;
+    }
+}
+
+$callback = function ($value) use ($factor) {
+    return $value * $factor;
+};
+
+class Beta extends Alpha {
+    public function two() {
+        /*** Method of the second class ***/
+        return 2;
+    }
+}
+
+function third() {
+    return array_map(function ($x) { return $x; }, [1, 2, 3]);
+}
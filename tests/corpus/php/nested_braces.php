@@ -0,0 +1,24 @@
+<?php
+class Renderer {
+    public function render($rows) {
+        /*** Render rows as a table ***/
+        $html = '';
+        foreach ($rows as $row) {
+            if ($row) {
+                $html .= "<tr>{$row['name']}</tr>";
+            } else {
+                $html .= '<tr></tr>';
+            }
+        }
+        return $html;
+    }
+
+    public function template() {
+        return '{{ content }}';
+    }
+}
+
+function after_renderer() {
+    /*** Defined after a class full of braces ***/
+    return new Renderer();
+}
@@ -0,0 +1,12 @@
+<?php
+/**
+ * Description: A template without classes or functions.
+ * File: no_definitions.php
+ */
+?>
+<html>
+  <body>
+    <?php echo $title; ?>
+    <p>The word function appears here, and so does class.</p>
+  </body>
+</html>
@@ -0,0 +1,29 @@
+<?php
+class Types {
+    public static function make(): self {
+        /*** Static factory with a return type ***/
+        return new self();
+    }
+
+    private function parse($value): int|string {
+        return $value;
+    }
+
+    protected function nullable(): ?string {
+        /*** Nullable return types are not matched ***/
+        return null;
+    }
+
+    final public function locked() {
+        return true;
+    }
+
+    public function &reference() {
+        return $this->value;
+    }
+}
+
+function with_union(int $a, string $b): int | float {
+    /*** Union type with spaces ***/
+    return $a;
+}
@@ -0,0 +1,15 @@
+<?php
+function before() {
+    /*** Before the broken class ***/
+    return 0;
+}
+
+class Broken {
+    public function inside() {
+        /*** Inside a class that is never closed ***/
+        return 1;
+    }
+
+function swallowed() {
+    return 2;
+}
@@ -0,0 +1,118 @@
+import re  # Import re module for the stock regexes the scanners must agree with.
+import time  # Import time module for the timing assertions.
+import random  # Import random module for the generated equivalence cases.
+import pytest  # Import pytest for parametrized tests.
+import project_structure_generator as psg  # Import the generator under test.
+
+PATTERNS = psg.LANGUAGE_PATTERNS
+TIME_LIMIT = 5.0  # Seconds any adversarial file may take; the regexes took 90 to 165 seconds on the biggest of them.
+
+# Inputs on which the stock regexes backtrack quadratically, keyed by file name (the extension selects the language)
+ADVERSARIAL_INPUTS = {
+    'repeated_description_heads.js': '/**\n * a\n * File: x\n' * 20000,  # 400 KB of description heads without @version.
+    'description_heads_without_description.js': '/**\n * a\n * File: x\n * @version 1\n' * 10000,
+    'blank_lines.php': '<?php\n' + '\n' * 60000,
+    'space_lines.php': '<?php\n' + ' \n' * 40000,
+    'unclosed_arguments.php': '<?php\n' + 'function f(\n' * 20000,
+    'unclosed_doc_comments.php': '<?php\n' + 'function f() { /*** doc\n' * 20000,
+    'dangling_modifiers.php': '<?php\n' + 'public static \n' * 20000,
+    'description_without_file.php': '<?php\n/**\n * Description: x\n' + ' * a\n' * 40000,
+    'unclosed_classes.php': '<?php\n' + 'class A {\nfunction f(\n' * 5000,
+    'unreachable_functions.php': '<?php\n' + 'class A {\nx function f() {}\n' * 5000,
+    'comment_runs.py': '#\n' * 100000 + 'def f(\n' * 20000,
+    'comment_runs.js': '//\n' * 100000 + '/* a */\n' * 20000 + 'function f(\n' * 20000,
+    'minified.min.js': 'function f(){return 1};' * 20000,
+}
+LANGUAGES = {'.js': 'javascript', '.php': 'php', '.py': 'python'}
+
+# Helper function to extract an in-memory file
+def extract(file_name, content):
+    ### Return the extract_functions() result of content as if read from file_name.
+    return psg.extract_functions(file_name, LANGUAGES[file_name[file_name.rindex('.'):]], (content, False))
+
+# Test that every adversarial input is extracted well within the time limit, without relying on the time budget
+@pytest.mark.parametrize('file_name', sorted(ADVERSARIAL_INPUTS))
+def test_adversarial_input_is_fast(file_name, monkeypatch):
+    monkeypatch.setattr(psg, 'MAX_FILE_SECONDS', None)
+    started = time.perf_counter()
+    result = extract(file_name, ADVERSARIAL_INPUTS[file_name])
+    assert time.perf_counter() - started < TIME_LIMIT
+    assert 'exceeding the time budget' not in result.get('warning', '')
+
+# Test that MAX_FILE_SECONDS stops a file whose output alone outlasts the budget
+def test_time_budget_stops_nested_classes(monkeypatch):
+    monkeypatch.setattr(psg, 'MAX_FILE_SECONDS', 0.5)
+    content = '<?php\n' + 'class A {\n' * 3000 + 'function f() {}\n' * 3000  # Every unclosed class holds all 3000 methods.
+    started = time.perf_counter()
+    result = extract('nested_classes.php', content)
+    assert time.perf_counter() - started < TIME_LIMIT
+    assert result['warning'] == 'skipped after exceeding the time budget of 0.5s'
+
+SEPARATORS = ['\n', '\n', '\n', ' \n', '\n ', '\n\n', '', ' ', '\t', '\n\t', '\xa0']
+JAVASCRIPT_DESCRIPTION = ['/**', ' * a', ' * File: x', ' * @version 1', ' * @description foo bar ', ' */']
+JAVASCRIPT_LINES = ['/**', ' * a', ' * File: x', ' *File:', '* @version', ' * @description', ' * @description\n */', ' */', '*/', '', '*', 'x', '/** * File:']
+PHP_DESCRIPTION = ['<?php', '/**', ' * Description: foo bar ', ' * File: x', ' */']
+PHP_LINES = ['<?php', '/**', ' * Description:', ' *Description:x', ' * Description:\n * File: y', '* File:', ' */', '*/', '', '*', 'x', '<?php /**']
+PHP_FUNCTION_LINES = [
+    'function foo($a) {', 'function foo($a)', 'public static function bar(): int|string {', 'private function', 'protected', 'public',
+    'static', 'function', 'static function', 'publicfunction f(){', 'function g(', ')', '{', '}', ': int', '| x', '/***', '***/',
+    '/*** doc ***/', 'x', '(', 'functionx(', 'function  h ( $b ) : ?int {',
+]
+
+# Helper function to generate a file from lines
+def generate_lines(rng, lines, count):
+    ### Join count lines picked from lines with random separators.
+    return ''.join(rng.choice(lines) + rng.choice(SEPARATORS) for _ in range(count))
+
+# Helper function to generate a near-miss file description
+def generate_description(rng, description, lines):
+    ### Return the lines of a file description (repeated at times) with a few lines inserted, removed or duplicated.
+    generated = list(description) * rng.choice([1, 1, 2])
+    for _ in range(rng.randint(0, 4)):
+        index = rng.randrange(len(generated) + 1)
+        operation = rng.random()
+        if operation < 0.4:
+            generated.insert(index, rng.choice(lines))
+        elif generated:
+            index = min(index, len(generated) - 1)
+            if operation < 0.7:
+                del generated[index]
+            else:
+                generated.insert(index, generated[index])
+    return ''.join(line + rng.choice(SEPARATORS) for line in generated)
+
+# Test that the description scanners return the group of the stock regexes
+@pytest.mark.parametrize('language, scanner, description, lines', [
+    ('javascript', psg.scan_javascript_description, JAVASCRIPT_DESCRIPTION, JAVASCRIPT_LINES),
+    ('php', psg.scan_php_description, PHP_DESCRIPTION, PHP_LINES),
+])
+def test_description_scanner_matches_regex(language, scanner, description, lines):
+    rng = random.Random(14)
+    regex = re.compile(PATTERNS[language]['file_description_regex'], re.DOTALL)
+    found = 0
+    for _ in range(5000):
+        content = generate_description(rng, description, lines) if rng.random() < 0.8 else generate_lines(rng, lines, rng.randint(0, 14))
+        match = regex.search(content)
+        assert scanner(content) == (match.group(1) if match else None), repr(content)
+        found += match is not None
+    assert found > 250  # Enough of the cases match for the comparison to mean something.
+
+# Test that the PHP searchers return the matches of the stock regexes from any position and end position
+@pytest.mark.parametrize('key, make_searcher', [
+    ('function_regex', psg.make_php_function_searcher),
+    ('comment_regex', psg.make_doc_comment_searcher),
+])
+def test_php_searcher_matches_regex(key, make_searcher):
+    rng = random.Random(14)
+    regex = re.compile(PATTERNS['php'][key])
+    found = 0
+    for _ in range(3000):
+        content = generate_lines(rng, PHP_FUNCTION_LINES, rng.randint(0, 14))
+        search = make_searcher(content)
+        for _ in range(4):
+            position = 0 if rng.random() < 0.5 else rng.randint(0, len(content))
+            endpos = len(content) if rng.random() < 0.5 else rng.randint(position, len(content))
+            match = regex.search(content, position, endpos)
+            assert search(position, endpos) == ((match.group(1), match.start(), match.end()) if match else None), (repr(content), position, endpos)
+            found += match is not None
+    assert found > 100
@@ -0,0 +1,78 @@
+import os  # Import os module for interacting with the operating system.
+import json  # Import json module for reading the JSON Lines export the binary export is compared with.
+import mmap  # Import mmap module for tracking the memory maps the reader opens.
+import pytest  # Import pytest for the expected errors.
+import project_structure_generator as psg  # Import the generator under test.
+from project_structure_generator import BinaryExportReader  # Import the reader under test.
+
+# Helper function to write a project and export it
+def export_project(tmp_path, generate):
+    ### Write a small project, run the generator with the JSON Lines and binary exports, and return (binary file, JSON Lines records).
+    project_dir = tmp_path / 'project'
+    for directory, name in (('', 'main'), ('src', 'tools'), ('src', 'Users'), (os.path.join('src', 'b'), 'deep'), ('web', 'app')):
+        (project_dir / directory).mkdir(parents=True, exist_ok=True)
+        if name == 'Users':
+            (project_dir / directory / f'{name}.php').write_text('<?php\nclass Users {\n    public function index() {\n    }\n}\n', encoding='utf-8')
+        else:
+            (project_dir / directory / f'{name}.py').write_text(f'def {name}_function():\n    pass\n', encoding='utf-8')
+            (project_dir / directory / f'{name}.js').write_text(f'function {name}Function() {{\n}}\n', encoding='utf-8')
+    docs_dir = tmp_path / 'docs'
+    generate(project_dir, docs_dir, export_jsonl=True, export_binary=True, symbol_index=False)
+    with open(docs_dir / 'functions.jsonl', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    return str(docs_dir / 'functions.bin'), records
+
+# Test that files() lists every exported path once, sorted, and len() counts one record per file and language
+def test_files_and_len(tmp_path, generate):
+    binary_file, records = export_project(tmp_path, generate)
+    with BinaryExportReader(binary_file) as reader:
+        assert len(reader) == len(records) == 9
+        assert reader.files() == sorted(record['file'] for record in records)
+
+# Test that get() returns the records of a path in walk order, and nothing for paths that are not exported
+def test_get(tmp_path, generate):
+    binary_file, records = export_project(tmp_path, generate)
+    with BinaryExportReader(binary_file) as reader:
+        for path in {record['file'] for record in records}:
+            assert reader.get(path) == [record for record in records if record['file'] == path]
+        assert [record['functions'][0]['name'] for record in reader.get(os.path.join('src', 'tools.py'))] == ['tools_function']
+        assert reader.get(os.path.join('src', 'Users.php'))[0]['classes'][0]['name'] == 'Users'
+        for path in ('missing.py', '', 'a', 'zzz', os.path.join('src', 'tools'), os.path.join('src', 'tools.pyc')):
+            assert reader.get(path) == []
+
+# Test that an export of a project without source files opens and finds nothing
+def test_empty_export(tmp_path, generate):
+    (tmp_path / 'project').mkdir()
+    generate(tmp_path / 'project', tmp_path / 'docs', export_binary=True, symbol_index=False)
+    with BinaryExportReader(str(tmp_path / 'docs' / 'functions.bin')) as reader:
+        assert len(reader) == 0 and reader.files() == [] and reader.get('main.py') == []
+
+# Test that empty, short, truncated, foreign and newer files are rejected with ValueError and their memory maps closed
+@pytest.mark.parametrize('corrupt', [
+    lambda data: b'',
+    lambda data: data[:3],
+    lambda data: data[:psg.BINARY_HEADER.size + psg.BINARY_FOOTER.size - 1],
+    lambda data: data[:len(data) // 2],
+    lambda data: data[:-1],
+    lambda data: data[:psg.BINARY_HEADER.size] + data[-psg.BINARY_FOOTER.size:],  # Header and footer of a file whose index is missing.
+    lambda data: b'not a binary export at all, but long enough',
+    lambda data: psg.BINARY_HEADER.pack(psg.BINARY_MAGIC, psg.BINARY_VERSION + 1, 0) + data[psg.BINARY_HEADER.size:],
+], ids=['empty', 'three_bytes', 'shorter_than_header_and_footer', 'half', 'last_byte_missing', 'index_missing', 'foreign', 'newer_version'])
+def test_invalid_files_are_rejected(tmp_path, generate, monkeypatch, corrupt):
+    binary_file, _ = export_project(tmp_path, generate)
+    with open(binary_file, 'rb') as f:
+        data = f.read()
+    with open(binary_file, 'wb') as f:
+        f.write(corrupt(data))
+
+    maps = []
+
+    # Memory map that records itself, to check the reader closes it
+    class TrackedMap(mmap.mmap):
+        def __init__(self, *args, **kwargs):
+            maps.append(self)
+
+    monkeypatch.setattr(psg.mmap, 'mmap', TrackedMap)
+    with pytest.raises(ValueError, match='is not a version 1 binary export'):
+        BinaryExportReader(binary_file)
+    assert all(mapped.closed for mapped in maps)
@@ -0,0 +1,130 @@
+import os  # Import os module for interacting with the operating system.
+import sqlite3  # Import sqlite3 module for inspecting the cache.
+import pytest  # Import pytest for parametrized tests.
+import project_structure_generator as psg  # Import the generator under test.
+
+FILES = {
+    'main.py': 'def main():\n    pass\n',
+    os.path.join('src', 'tools.py'): '# Loads\ndef load(path):\n    pass\n',
+    os.path.join('src', 'Users.php'): '<?php\nclass Users {\n    public function index() {\n    }\n}\n',
+    os.path.join('web', 'app.js'): 'function start() {\n}\n',
+}
+OUTPUT_NAMES = ['project_structure.txt', 'functions.txt']
+
+# Helper function to write the cached project
+def write_project(project_dir):
+    ### Write FILES under project_dir.
+    for path, contents in FILES.items():
+        (project_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (project_dir / path).write_text(contents, encoding='utf-8')
+
+# Helper function to read the cache rows
+def cache_rows(docs_dir):
+    ### Return path -> (mtime_ns, size) of every entry in the extraction cache of docs_dir.
+    connection = sqlite3.connect(str(docs_dir / '.extraction_cache.sqlite'))
+    try:
+        return {path: (mtime_ns, size) for path, mtime_ns, size in connection.execute("SELECT path, mtime_ns, size FROM files")}
+    finally:
+        connection.close()
+
+# Helper function to run the generator with the cache and compare with an uncached run
+def run_cached(generate, tmp_path, name):
+    ### Run the generator with the cache into tmp_path/docs, assert its outputs match an uncached run into tmp_path/name,
+    ### and return the cache counters.
+    result = generate(tmp_path / 'project', tmp_path / 'docs', use_cache=True)
+    generate(tmp_path / 'project', tmp_path / name)
+    for output_name in OUTPUT_NAMES:
+        assert (tmp_path / 'docs' / output_name).read_bytes() == (tmp_path / name / output_name).read_bytes(), output_name
+    return result.cache_stats
+
+# Test that a second run reuses every cached result
+def test_unchanged_files_hit(tmp_path, generate):
+    write_project(tmp_path / 'project')
+    assert run_cached(generate, tmp_path, 'fresh_0') == {'hits': 0, 'misses': 4, 'evicted': 0}
+    assert run_cached(generate, tmp_path, 'fresh_1') == {'hits': 4, 'misses': 0, 'evicted': 0}
+    assert sorted(cache_rows(tmp_path / 'docs')) == sorted(FILES)
+
+# Test that changing the generator version, the extractor revision, a language pattern or a per-file budget discards every entry
+@pytest.mark.parametrize('change', [
+    lambda monkeypatch: monkeypatch.setattr(psg, 'GENERATOR_VERSION', psg.GENERATOR_VERSION + '.1'),
+    lambda monkeypatch: monkeypatch.setattr(psg, 'EXTRACTOR_REVISION', psg.EXTRACTOR_REVISION + 1),
+    lambda monkeypatch: monkeypatch.setitem(psg.LANGUAGE_PATTERNS['python'], 'function_regex', '(?:)' + psg.LANGUAGE_PATTERNS['python']['function_regex']),
+    lambda monkeypatch: monkeypatch.setattr(psg, 'MAX_FILE_BYTES', psg.MAX_FILE_BYTES * 2),
+    lambda monkeypatch: monkeypatch.setattr(psg, 'MAX_FILE_BYTES', None),
+    lambda monkeypatch: monkeypatch.setattr(psg, 'MAX_FILE_SECONDS', psg.MAX_FILE_SECONDS * 2),
+    lambda monkeypatch: monkeypatch.setattr(psg, 'MINIFIED_LINE_LENGTH', psg.MINIFIED_LINE_LENGTH * 2),
+    lambda monkeypatch: monkeypatch.setattr(psg, 'MINIFIED_MIN_BYTES', psg.MINIFIED_MIN_BYTES * 2),
+], ids=['generator_version', 'extractor_revision', 'pattern', 'max_file_bytes', 'no_max_file_bytes', 'max_file_seconds', 'minified_line_length', 'minified_min_bytes'])
+def test_signature_change_discards_entries(tmp_path, generate, monkeypatch, change):
+    write_project(tmp_path / 'project')
+    run_cached(generate, tmp_path, 'fresh_0')
+    change(monkeypatch)
+    assert run_cached(generate, tmp_path, 'fresh_1') == {'hits': 0, 'misses': 4, 'evicted': 0}
+    assert run_cached(generate, tmp_path, 'fresh_2') == {'hits': 4, 'misses': 0, 'evicted': 0}
+
+# Test that a touched file with the same contents is hashed once, reuses its result and has its stored stat updated
+def test_touched_file_takes_hash_path(tmp_path, generate, monkeypatch):
+    write_project(tmp_path / 'project')
+    run_cached(generate, tmp_path, 'fresh_0')
+    touched = tmp_path / 'project' / 'main.py'
+    stat = os.stat(touched)
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    hashed = []
+    hash_file_contents = psg.hash_file_contents
+    monkeypatch.setattr(psg, 'hash_file_contents', lambda file_path: hashed.append(file_path) or hash_file_contents(file_path))
+    assert run_cached(generate, tmp_path, 'fresh_1') == {'hits': 4, 'misses': 0, 'evicted': 0}
+    assert hashed == [str(touched)]
+    assert cache_rows(tmp_path / 'docs')['main.py'] == (stat.st_mtime_ns + 10 ** 9, stat.st_size)
+
+    hashed.clear()
+    assert run_cached(generate, tmp_path, 'fresh_2') == {'hits': 4, 'misses': 0, 'evicted': 0}
+    assert hashed == []  # The refreshed stat matches again.
+
+# Test that a changed file is extracted again, even when its size and modification time barely change
+def test_changed_file_misses(tmp_path, generate):
+    write_project(tmp_path / 'project')
+    run_cached(generate, tmp_path, 'fresh_0')
+    changed = tmp_path / 'project' / 'src' / 'tools.py'
+    changed.write_text('# Saves\ndef save_all(path):\n    pass\n', encoding='utf-8')
+    assert run_cached(generate, tmp_path, 'fresh_1') == {'hits': 3, 'misses': 1, 'evicted': 0}
+    assert 'save_all' in (tmp_path / 'docs' / 'functions.txt').read_text(encoding='utf-8')
+
+    stat = os.stat(changed)
+    changed.write_text('# Loads\ndef load_all(path):\n    pass\n', encoding='utf-8')  # Same size, one nanosecond later.
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert run_cached(generate, tmp_path, 'fresh_2') == {'hits': 3, 'misses': 1, 'evicted': 0}
+
+# Test that entries of deleted and renamed files are evicted
+def test_deleted_files_are_evicted(tmp_path, generate):
+    write_project(tmp_path / 'project')
+    run_cached(generate, tmp_path, 'fresh_0')
+    os.remove(tmp_path / 'project' / 'main.py')
+    os.rename(tmp_path / 'project' / 'web' / 'app.js', tmp_path / 'project' / 'web' / 'page.js')
+    assert run_cached(generate, tmp_path, 'fresh_1') == {'hits': 2, 'misses': 1, 'evicted': 2}
+    assert sorted(cache_rows(tmp_path / 'docs')) == sorted([os.path.join('src', 'tools.py'), os.path.join('src', 'Users.php'), os.path.join('web', 'page.js')])
+    assert run_cached(generate, tmp_path, 'fresh_2') == {'hits': 3, 'misses': 0, 'evicted': 0}
+
+# Helper function to write a file that is not an SQLite database
+def write_corrupt_cache(cache_file):
+    ### Fill cache_file with text.
+    with open(cache_file, 'wb') as f:
+        f.write(b'This is not an SQLite database. ' * 64)
+
+# Helper function to write an SQLite database of another tool
+def write_foreign_cache(cache_file):
+    ### Create cache_file with a files table of different columns.
+    connection = sqlite3.connect(cache_file)
+    connection.execute("CREATE TABLE files (path TEXT PRIMARY KEY, data BLOB)")
+    connection.execute("INSERT INTO files VALUES ('main.py', x'00')")
+    connection.commit()
+    connection.close()
+
+# Test that a corrupt or foreign cache file is replaced by a working cache
+@pytest.mark.parametrize('write_cache', [write_corrupt_cache, write_foreign_cache], ids=['corrupt', 'foreign'])
+def test_invalid_cache_file_is_replaced(tmp_path, generate, write_cache):
+    write_project(tmp_path / 'project')
+    (tmp_path / 'docs').mkdir()
+    write_cache(str(tmp_path / 'docs' / '.extraction_cache.sqlite'))
+    assert run_cached(generate, tmp_path, 'fresh_0') == {'hits': 0, 'misses': 4, 'evicted': 0}
+    assert run_cached(generate, tmp_path, 'fresh_1') == {'hits': 4, 'misses': 0, 'evicted': 0}
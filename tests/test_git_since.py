@@ -0,0 +1,106 @@
+import os  # Import os module for interacting with the operating system.
+import shutil  # Import shutil module for finding git.
+import subprocess  # Import subprocess module for setting up the git repository.
+import pytest  # Import pytest for skipping without git.
+import project_structure_generator as psg  # Import the generator under test.
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git is not installed')
+
+# Helper function to run git in the test repository
+def git(project_dir, *args):
+    ### Run a git command in project_dir with a throwaway identity, failing the test when it fails.
+    subprocess.run(['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com', *args], cwd=project_dir, check=True, capture_output=True)
+
+# Helper function to write a Python file with the given functions
+def write_functions(file_path, *names):
+    ### Overwrite file_path with one empty function per name.
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(''.join(f'def {name}():\n    pass\n\n' for name in names))
+
+# Helper function to set up a committed repository with tracked, untracked and git-ignored files
+def make_repository(tmp_path):
+    ### Return the project directory of a repository with committed tracked.py and unchanged.py, an untracked untracked.py
+    ### and a git-ignored ignored.py.
+    project_dir = tmp_path / 'project'
+    project_dir.mkdir()
+    git(project_dir, 'init', '-q')
+    write_functions(project_dir / 'tracked.py', 'tracked_old')
+    write_functions(project_dir / 'unchanged.py', 'unchanged')
+    (project_dir / '.gitignore').write_text('ignored.py\n', encoding='utf-8')
+    git(project_dir, 'add', 'tracked.py', 'unchanged.py', '.gitignore')
+    git(project_dir, 'commit', '-q', '-m', 'Initial commit')
+    write_functions(project_dir / 'untracked.py', 'untracked_old')
+    write_functions(project_dir / 'ignored.py', 'ignored_old')
+    return project_dir
+
+# Test that --since re-checks untracked and git-ignored files, which git diff never reports, against the cache
+def test_since_checks_untracked_and_ignored_files(tmp_path, generate):
+    project_dir = make_repository(tmp_path)
+    docs_dir = tmp_path / 'docs'
+    generate(project_dir, docs_dir, since='HEAD')  # Fills the extraction cache.
+
+    write_functions(project_dir / 'untracked.py', 'untracked_old', 'untracked_new')
+    write_functions(project_dir / 'ignored.py', 'ignored_old', 'ignored_new')
+    result = generate(project_dir, docs_dir, since='HEAD')
+
+    functions = (docs_dir / 'functions.txt').read_text(encoding='utf-8')
+    assert 'untracked_new' in functions
+    assert 'ignored_new' in functions
+    assert result.cache_stats == {'hits': 2, 'misses': 2, 'evicted': 0}
+
+# Test that --since extracts tracked files changed since the revision again and matches a run without the cache
+def test_since_matches_uncached_run(tmp_path, generate):
+    project_dir = make_repository(tmp_path)
+    generate(project_dir, tmp_path / 'docs', since='HEAD')
+
+    write_functions(project_dir / 'tracked.py', 'tracked_old', 'tracked_new')
+    write_functions(project_dir / 'untracked.py', 'untracked_new')
+    result = generate(project_dir, tmp_path / 'docs', since='HEAD')
+    generate(project_dir, tmp_path / 'fresh')
+
+    for name in ('project_structure.txt', 'functions.txt'):
+        assert (tmp_path / 'docs' / name).read_bytes() == (tmp_path / 'fresh' / name).read_bytes()
+    assert 'tracked_new' in (tmp_path / 'docs' / 'functions.txt').read_text(encoding='utf-8')
+    assert result.cache_stats['misses'] == 2  # Only tracked.py and untracked.py are extracted again.
+
+# Test that --since does not trust results cached at another commit than the revision
+def test_since_after_new_commit(tmp_path, generate):
+    project_dir = make_repository(tmp_path)
+    generate(project_dir, tmp_path / 'docs', since='HEAD')  # Fills the extraction cache at the first commit.
+
+    write_functions(project_dir / 'tracked.py', 'tracked_old', 'tracked_new')
+    git(project_dir, 'commit', '-q', '-a', '-m', 'Add tracked_new')
+    result = generate(project_dir, tmp_path / 'docs', since='HEAD')
+
+    assert 'tracked_new' in (tmp_path / 'docs' / 'functions.txt').read_text(encoding='utf-8')
+    assert result.cache_stats == {'hits': 3, 'misses': 1, 'evicted': 0}
+
+# Test that results cached with uncommitted changes are not trusted once the changes are reverted
+def test_since_after_reverting_uncommitted_change(tmp_path, generate):
+    project_dir = make_repository(tmp_path)
+    write_functions(project_dir / 'tracked.py', 'tracked_xyz')  # Same size as the committed contents.
+    generate(project_dir, tmp_path / 'docs', since='HEAD')
+
+    git(project_dir, 'checkout', '--', 'tracked.py')
+    stat = os.stat(project_dir / 'tracked.py')
+    os.utime(project_dir / 'tracked.py', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))  # Not within the timestamp tick of the edit.
+    generate(project_dir, tmp_path / 'docs', since='HEAD')
+
+    functions = (tmp_path / 'docs' / 'functions.txt').read_text(encoding='utf-8')
+    assert 'tracked_old' in functions and 'tracked_xyz' not in functions
+
+# Test that --since reuses results cached at the revision for touched tracked files without hashing them
+def test_since_trusts_files_unchanged_since_cached_commit(tmp_path, generate, monkeypatch):
+    project_dir = make_repository(tmp_path)
+    generate(project_dir, tmp_path / 'docs', since='HEAD')
+
+    hashed = []
+    hash_file_contents = psg.hash_file_contents
+    monkeypatch.setattr(psg, 'hash_file_contents', lambda file_path: hashed.append(os.path.basename(file_path)) or hash_file_contents(file_path))
+    for name in ('tracked.py', 'unchanged.py', 'untracked.py'):
+        stat = os.stat(project_dir / name)
+        os.utime(project_dir / name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))  # Touched, as by a checkout.
+    result = generate(project_dir, tmp_path / 'docs', since='HEAD')
+
+    assert hashed == ['untracked.py']  # Untracked files are checked by their contents.
+    assert result.cache_stats == {'hits': 4, 'misses': 0, 'evicted': 0}
@@ -0,0 +1,45 @@
+import re  # Import re module for compiling the version 1.5 patterns.
+import random  # Import random module for the deterministic names.
+import pytest  # Import pytest for parametrized tests.
+import project_structure_generator as psg  # Import the generator under test.
+import benchmark_legacy as legacy  # Import the version 1.5 implementation the matcher must agree with.
+from benchmark_project_structure import synthetic_names  # Import the name generator of the matcher benchmark.
+
+NAME_COUNT = 150_000  # Names classified under every configuration.
+NAMES = synthetic_names(random.Random(1234), NAME_COUNT)  # The same names on every run.
+
+# Settings the matcher is checked under: the defaults (with .csv so PATTERNS group files), wildcards and odd extensions, and include_all_files
+CONFIGURATIONS = {
+    'defaults': (psg.IGNORE_DIRS, psg.IGNORE_FILES, psg.SPECIAL_DIR_PATTERNS, psg.PATTERNS, ('.py', '.js', '.php', '.css', '.csv'), ['python', 'php', 'javascript'], False),
+    'wildcards': (['node_*', '[Ll]ib*', 'venv', '*.app'], ['*.min.js', 'README.*', '?notes_*', '*.txt'], [r'run_\d+', r'cach(e|ed)'], [r'(\w+)_\1\.csv'] + psg.PATTERNS, ('.py', '.tar.gz', 'js', '.PY'), ['python', 'javascript'], False),
+    'include_all_files': (psg.IGNORE_DIRS, psg.IGNORE_FILES, psg.SPECIAL_DIR_PATTERNS, psg.PATTERNS, ('.php',), ['php'], True),
+}
+
+# Test that NameMatcher classifies every name the way the version 1.5 per-pattern checks did
+@pytest.mark.parametrize('configuration', CONFIGURATIONS)
+def test_matcher_matches_version_1_5(configuration):
+    ignore_dirs, ignore_files, special_dir_patterns, patterns, extensions, languages, include_all_files = CONFIGURATIONS[configuration]
+    matcher = psg.NameMatcher(ignore_dirs, ignore_files, special_dir_patterns, patterns, extensions, languages, include_all_files)
+    compiled_ignore_dir_patterns = legacy.legacy_compile_ignore_patterns(ignore_dirs)
+    compiled_ignore_file_patterns = legacy.legacy_compile_ignore_patterns(ignore_files)
+    compiled_special_patterns = [re.compile(pattern) for pattern in special_dir_patterns]
+    compiled_patterns = [re.compile(pattern_str) for pattern_str in patterns]
+    mismatches = []
+    for name in NAMES:
+        ignored = legacy.legacy_should_ignore_directory(name, compiled_ignore_dir_patterns)
+        pruned = ignored or legacy.legacy_is_special_directory(name, compiled_special_patterns)
+        classification = legacy.legacy_classify_file(name, compiled_ignore_file_patterns, extensions, include_all_files, compiled_patterns, languages)
+        if (matcher.is_ignored_directory(name), matcher.should_prune_directory(name), matcher.classify_file(name)) != (ignored, pruned, classification):
+            mismatches.append(name)
+    assert mismatches == []
+
+# Test that the names exercise every outcome, so the equivalence check above means something
+def test_names_cover_every_outcome():
+    matcher = psg.NameMatcher(*CONFIGURATIONS['defaults'])
+    classifications = [matcher.classify_file(name) for name in NAMES]
+    assert len(set(NAMES)) == NAME_COUNT
+    assert any(classification is None for classification in classifications)
+    assert any(classification and classification[0] for classification in classifications)
+    assert any(classification and classification[1] for classification in classifications)
+    assert any(matcher.is_ignored_directory(name) for name in NAMES)
+    assert any(matcher.should_prune_directory(name) and not matcher.is_ignored_directory(name) for name in NAMES)
@@ -0,0 +1,46 @@
+import pytest  # Import pytest for parametrized tests.
+import project_structure_generator as psg  # Import the generator under test.
+
+OUTPUT_NAMES = ['project_structure.txt', 'functions.txt', 'combined_structure.txt', 'functions.jsonl', 'functions.bin', 'symbols.idx']
+EXPORTS = dict(export_combined=True, export_jsonl=True, export_binary=True, export_symbols=True)
+
+# Helper function to write a project with several extraction chunks of files
+def write_project(project_dir):
+    ### Write Python, PHP and JavaScript files, with an unreadable file and files without definitions among them, spread over
+    ### nested directories, and return how many files are extracted.
+    count = 0
+    for package in range(6):
+        for module in range(15):
+            directory = project_dir / f'package_{package}' / ('nested' if module % 3 else '')
+            directory.mkdir(parents=True, exist_ok=True)
+            name = f'm{package}_{module}'
+            (directory / f'{name}.py').write_text(f'# Loads {name}\ndef load_{name}(path):\n    pass\n' * (module % 4), encoding='utf-8')
+            (directory / f'{name}.php').write_text(
+                f'<?php\n/**\n * Description: {name}\n * File: {name}.php\n */\nclass C_{name} {{\n    /*** Shows it ***/\n    public function show() {{\n    }}\n}}\n',
+                encoding='utf-8'
+            )
+            (directory / f'{name}.js').write_text(f'// Renders {name}\nfunction render_{name}() {{\n}}\n', encoding='utf-8')
+            count += 3
+    (project_dir / 'package_0' / 'broken.py').write_bytes(b'def broken():\n    \xff\n')  # Not UTF-8: extracted as empty.
+    return count + 1
+
+# Test that extraction across worker processes, with and without the cache and prefetching, writes the outputs of a serial run
+@pytest.mark.parametrize('options', [
+    dict(workers=2),
+    dict(workers=2, use_cache=True),
+    dict(workers=2, prefetch_threads=2),
+    dict(workers=1, prefetch_threads=2, use_cache=True),
+    dict(workers=2, prefetch_threads=2, use_cache=True),
+])
+def test_parallel_matches_serial_run(tmp_path, generate, options):
+    file_count = write_project(tmp_path / 'project')
+    assert file_count > 3 * psg.EXTRACTION_CHUNK_SIZE
+    generate(tmp_path / 'project', tmp_path / 'serial', workers=1, **EXPORTS)
+
+    for run in range(2 if options.get('use_cache') else 1):  # Cached runs fill the cache, then reuse it.
+        result = generate(tmp_path / 'project', tmp_path / 'parallel', **options, **EXPORTS)
+        for name in OUTPUT_NAMES:
+            assert (tmp_path / 'parallel' / name).read_bytes() == (tmp_path / 'serial' / name).read_bytes(), (run, name)
+        if options.get('use_cache'):
+            hits = file_count if run else 0  # The unreadable file's empty result is cached like any other.
+            assert result.cache_stats == {'hits': hits, 'misses': file_count - hits, 'evicted': 0}
@@ -0,0 +1,28 @@
+import os  # Import os module for interacting with the operating system.
+import glob  # Import glob module for listing the corpus files.
+import pytest  # Import pytest for parametrized tests.
+import project_structure_generator as psg  # Import the generator under test.
+import benchmark_legacy as legacy  # Import the version 1.5 implementation the extraction must agree with.
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus', 'php')  # PHP regression corpus.
+CORPUS_FILES = sorted(glob.glob(os.path.join(CORPUS_DIR, '*.php')))  # Every file of the corpus.
+
+# Test that the single-pass PHP extraction finds what version 1.5 found
+@pytest.mark.parametrize('file_path', CORPUS_FILES, ids=os.path.basename)
+def test_corpus_matches_version_1_5(file_path):
+    ### Method line numbers are left out: version 1.5 counted them from the start of the class, not the file.
+    expected = legacy.strip_method_lines(legacy.legacy_extract_functions(file_path, 'php'))
+    assert legacy.strip_method_lines(psg.extract_functions(file_path, 'php')) == expected
+
+# Test that method line numbers are counted like standalone function line numbers
+def test_method_lines_count_from_start_of_file():
+    ### Like standalone functions, methods report the line before their declaration, where their match starts.
+    result = psg.extract_functions(os.path.join(CORPUS_DIR, 'basic_class.php'), 'php')
+    assert [(func['name'], func['line']) for func in result['classes'][0]['functions']] == [('add', 9), ('count', 14), ('clear', 19)]
+    assert [(func['name'], func['line']) for func in result['functions']] == [('cart_total', 23)]
+
+# Test that a class that is never closed runs to the end of the file
+def test_unclosed_class_holds_the_rest_of_the_file():
+    result = psg.extract_functions(os.path.join(CORPUS_DIR, 'unclosed_class.php'), 'php')
+    assert [func['name'] for func in result['functions']] == ['before']
+    assert [(func['name'], func['line']) for func in result['classes'][0]['functions']] == [('inside', 7), ('swallowed', 11)]
@@ -0,0 +1,68 @@
+import os  # Import os module for interacting with the operating system.
+import time  # Import time module for the simulated latency.
+import threading  # Import threading module for recording reads from the prefetch threads.
+import project_structure_generator as psg  # Import the generator under test.
+
+LATENCY = 0.02  # Seconds every simulated read waits, like a round trip to a network file system.
+
+# Helper function to write the source files of a test
+def write_source_files(directory, count, size=0):
+    ### Write count Python files with one function each, padded with comment lines to about size bytes, and return their jobs.
+    jobs = []
+    for index in range(count):
+        file_path = os.path.join(directory, f'module_{index}.py')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(f'# Function number {index}\ndef function_{index}(value):\n    return value\n')
+            f.write(('#' * 79 + '\n') * (size // 80))
+        jobs.append((file_path, 'python', f'module_{index}.py'))
+    return jobs
+
+# Helper function to slow down every read of the generator
+def simulate_latency(monkeypatch, started=None):
+    ### Replace psg.read_source_file with a version that waits LATENCY seconds first, and record the size of every file
+    ### whose read has started in started, when given.
+    read_source_file = psg.read_source_file
+    lock = threading.Lock()
+
+    def slow_read_source_file(file_path, *args, **kwargs):
+        if started is not None:
+            with lock:
+                started.append(os.path.getsize(file_path))
+        time.sleep(LATENCY)
+        return read_source_file(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(psg, 'read_source_file', slow_read_source_file)
+
+# Test that prefetching overlaps slow reads with parsing and returns the same results
+def test_prefetch_overlaps_slow_reads(tmp_path, monkeypatch):
+    jobs = write_source_files(tmp_path, 40)
+    simulate_latency(monkeypatch)
+    started = time.perf_counter()
+    serial = list(psg.iter_extraction_results(iter(jobs), prefetch_threads=0))
+    serial_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    prefetched = list(psg.iter_extraction_results(iter(jobs), prefetch_threads=8))
+    prefetched_seconds = time.perf_counter() - started
+    assert prefetched == serial
+    assert [result['functions'][0]['name'] for _, result in serial] == [f'function_{index}' for index in range(40)]
+    assert serial_seconds >= 40 * LATENCY
+    assert prefetched_seconds < serial_seconds / 3  # Eight threads hide most of the latency.
+
+# Test that reads in flight and reads waiting to be parsed stay within the byte budget
+def test_prefetch_budget_counts_reads_in_flight(tmp_path, monkeypatch):
+    jobs = write_source_files(tmp_path, 30, size=10_000)
+    max_bytes = 25_000  # Room for two of the files at a time.
+    started = []
+    simulate_latency(monkeypatch, started)
+    yielded_bytes = 0
+    for job, _, source in psg.iter_prefetched_contents(((job, None) for job in jobs), threads=8, max_bytes=max_bytes):
+        yielded_bytes += os.path.getsize(job[0])
+        assert sum(started) - yielded_bytes <= max_bytes  # Reads started for jobs not yet yielded.
+        assert source is not None
+    assert len(started) == len(jobs)
+
+# Test that a file larger than the budget is still read
+def test_prefetch_reads_file_larger_than_budget(tmp_path):
+    jobs = write_source_files(tmp_path, 3, size=10_000)
+    results = list(psg.iter_extraction_results(iter(jobs), prefetch_threads=2, prefetch_bytes=1_000))
+    assert [result['functions'][0]['name'] for _, result in results] == ['function_0', 'function_1', 'function_2']
@@ -0,0 +1,88 @@
+import json  # Import json module for reading the profiling report.
+import pstats  # Import pstats module for reading the cProfile statistics.
+import pytest  # Import pytest for parametrized tests.
+
+# Source files of the profiled project: relative path -> (contents, functions, classes, methods)
+FILES = {
+    'main.py': ('def main():\n    pass\n\ndef helper():\n    pass\n', 2, 0, 0),
+    'src/tools.py': ('# Loads\ndef load(path):\n    pass\n', 1, 0, 0),
+    'src/Users.php': ('<?php\nfunction boot() {\n}\nclass Users {\n    public function index() {\n    }\n    public function show() {\n    }\n}\n', 1, 1, 2),
+    'src/nested/Orders.php': ('<?php\nclass Orders {\n    public function index() {\n    }\n}\n', 0, 1, 1),
+    'src/nested/app.js': ('function start() {\n}\nfunction stop() {\n}\n', 2, 0, 0),
+    'web/page.js': ('// Renders\nfunction render() {\n}\n', 1, 0, 0),
+    'web/notes.txt': ('Listed but not extracted.\n', 0, 0, 0),
+}
+LANGUAGES = {'.py': 'python', '.php': 'php', '.js': 'javascript'}
+
+# Helper function to write the profiled project
+def write_project(project_dir):
+    ### Write FILES under project_dir.
+    for path, (contents, _, _, _) in FILES.items():
+        (project_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (project_dir / path).write_text(contents, encoding='utf-8')
+
+# Helper function to compute the per-language totals the report should hold
+def expected_languages():
+    ### Return language -> {'files', 'bytes', 'functions', 'classes', 'methods'} of the source files in FILES.
+    languages = {}
+    for path, (contents, functions, classes, methods) in FILES.items():
+        language = LANGUAGES.get(path[path.rindex('.'):])
+        if language:
+            totals = languages.setdefault(language, {'files': 0, 'bytes': 0, 'functions': 0, 'classes': 0, 'methods': 0})
+            for key, value in (('files', 1), ('bytes', len(contents.encode('utf-8'))), ('functions', functions), ('classes', classes), ('methods', methods)):
+                totals[key] += value
+    return languages
+
+# Test that a profiled run reports its phases, counters, per-language totals and slowest files, serially and across workers
+@pytest.mark.parametrize('workers', [1, 2])
+def test_profile_report(tmp_path, generate, workers):
+    write_project(tmp_path / 'project')
+    profile_file = tmp_path / 'docs' / 'profile_report.json'
+    result = generate(tmp_path / 'project', tmp_path / 'docs', workers=workers, profile=True, profile_file=str(profile_file), profile_top_files=3)
+    assert str(profile_file) not in result.outputs
+    with open(profile_file, encoding='utf-8') as f:
+        report = json.load(f)
+
+    assert report['settings']['workers'] == workers
+    assert set(report['phases']) == {'walk', 'extract', 'write', 'other'}
+    assert report['phases']['walk']['calls'] == report['phases']['extract']['calls'] == 7  # One per job, and the last call that ends the iteration.
+    assert all(phase['wall'] >= 0 and phase['cpu'] >= 0 for name, phase in report['phases'].items() if name != 'other')
+
+    languages = expected_languages()
+    assert report['counters'] == {
+        'directories': 4,
+        'files_listed': len(FILES),
+        'jobs': 6,
+        'files_extracted': 6,
+        'bytes_read': sum(totals['bytes'] for totals in languages.values()),
+        'functions': sum(totals['functions'] for totals in languages.values()),
+        'classes': 2,
+        'methods': 3,
+    }
+    assert sorted(report['languages']) == ['javascript', 'php', 'python']
+    for language, totals in languages.items():
+        reported = report['languages'][language]
+        assert {key: reported[key] for key in totals} == totals
+        assert all(reported[key] >= 0 for key in ('read_wall', 'read_cpu', 'parse_wall', 'parse_cpu'))
+
+    slowest = report['slowest_files']
+    assert len(slowest) == 3  # Capped at profile_top_files.
+    assert [entry['wall'] for entry in slowest] == sorted((entry['wall'] for entry in slowest), reverse=True)
+    for entry in slowest:
+        path = entry['file'].replace('\\', '/')
+        assert entry['language'] == LANGUAGES[path[path.rindex('.'):]]
+        assert entry['bytes'] == len(FILES[path][0].encode('utf-8'))
+
+# Test that the slowest files list every extracted file when there are fewer than profile_top_files, and that cProfile statistics are saved
+def test_profile_statistics(tmp_path, generate):
+    write_project(tmp_path / 'project')
+    docs_dir = tmp_path / 'docs'
+    generate(
+        tmp_path / 'project', docs_dir, profile=True, profile_file=str(docs_dir / 'profile_report.json'), profile_stats=True,
+        profile_stats_file=str(docs_dir / 'profile.pstats'), profile_top_files=20
+    )
+    with open(docs_dir / 'profile_report.json', encoding='utf-8') as f:
+        report = json.load(f)
+    assert len(report['slowest_files']) == 6
+    stats = pstats.Stats(str(docs_dir / 'profile.pstats'))
+    assert any(function_name == 'extract_functions' for _, _, function_name in stats.stats)
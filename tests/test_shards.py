@@ -0,0 +1,134 @@
+import os  # Import os module for interacting with the operating system.
+import sys  # Import sys module for the interpreter that runs the shards.
+import json  # Import json module for passing settings to the shard processes.
+import subprocess  # Import subprocess module for running the shards as separate processes.
+import project_structure_generator as psg  # Import the generator under test.
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHARD_COUNT = 3
+TOP_LEVEL_DIRECTORIES = ['api', 'billing', 'core', 'frontend', 'jobs', 'reports', 'models', 'plugins', 'services']
+OUTPUT_NAMES = ['project_structure.txt', 'functions.txt', 'combined_structure.txt', 'functions.jsonl', 'functions.bin']
+
+# Script run by every generator process: argv[1] holds the project, output directory, shard and cache settings as JSON,
+# and the cache counters of the run are written to argv[2]
+RUNNER = '''
+import json, os, sys
+sys.path.insert(0, {repository_dir!r})
+import project_structure_generator as psg
+settings = json.loads(sys.argv[1])
+docs_dir = settings['docs_dir']
+os.makedirs(docs_dir, exist_ok=True)
+psg.DOCUMENTATION_DIR = docs_dir
+result = psg.generate_project_structure(
+    project_dir=settings['project_dir'], ignore_dirs=psg.IGNORE_DIRS, ignore_files=psg.IGNORE_FILES,
+    extensions_to_include=('.py', '.php', '.js'), patterns=psg.PATTERNS, special_dir_patterns=psg.SPECIAL_DIR_PATTERNS,
+    languages=['python', 'php', 'javascript'], output_file=os.path.join(docs_dir, 'project_structure.txt'),
+    functions_file=os.path.join(docs_dir, 'functions.txt'), combined_file=os.path.join(docs_dir, 'combined_structure.txt'),
+    export_structure=True, export_functions=True, export_combined=True, return_folders_only=False, max_depth=None,
+    include_all_files=False, export_jsonl=True, jsonl_file=os.path.join(docs_dir, 'functions.jsonl'), export_binary=True,
+    binary_file=os.path.join(docs_dir, 'functions.bin'), use_cache=settings['use_cache'],
+    cache_file=os.path.join(settings['cache_dir'], '.extraction_cache.sqlite'), symbol_index=False,
+    shard=tuple(settings['shard']) if settings['shard'] else None, shard_file=settings['shard_file'])
+with open(sys.argv[2], 'w') as f:
+    json.dump(result.cache_stats, f)
+'''.format(repository_dir=REPOSITORY_DIR)
+
+# Helper function to write the project the shards split
+def write_project(project_dir):
+    ### Write Python, PHP and JavaScript files at the root and in nested directories of every top-level directory, and
+    ### return how many source files there are.
+    count = 0
+    for top_index, top in enumerate([''] + TOP_LEVEL_DIRECTORIES):
+        for depth, directory in enumerate([top, os.path.join(top, 'nested'), os.path.join(top, 'nested', 'deeper')][:1 + top_index % 3]):
+            path = project_dir / directory
+            path.mkdir(parents=True, exist_ok=True)
+            name = f'{top or "root"}_{depth}'
+            (path / f'{name}.py').write_text(f'# Loads {name}\ndef load_{name}(path):\n    pass\n', encoding='utf-8')
+            (path / f'{name}.php').write_text(f'<?php\nclass Class_{name} {{\n    public function show() {{\n    }}\n}}\n', encoding='utf-8')
+            (path / f'{name}.js').write_text(f'function render_{name}() {{\n}}\n', encoding='utf-8')
+            (path / 'notes.txt').write_text('Not extracted.\n', encoding='utf-8')
+            count += 3
+    return count
+
+# Helper function to start one generator process
+def start_run(tmp_path, name, shard=None, use_cache=False):
+    ### Start a generator process writing its outputs to tmp_path/name and its cache to tmp_path/cache, and return
+    ### (process, path of its cache counters).
+    settings = {
+        'project_dir': str(tmp_path / 'project'),
+        'docs_dir': str(tmp_path / name),
+        'cache_dir': str(tmp_path / 'cache'),
+        'use_cache': use_cache,
+        'shard': shard,
+        'shard_file': str(tmp_path / 'shards' / 'shard_{index}_of_{count}.jsonl'),
+    }
+    stats_file = str(tmp_path / f'{name}.stats.json')
+    process = subprocess.Popen([sys.executable, '-c', RUNNER, json.dumps(settings), stats_file], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    return process, stats_file
+
+# Helper function to wait for generator processes
+def finish_runs(runs):
+    ### Wait for every (process, stats_file) of runs to succeed, and return their cache counters.
+    stats = []
+    for process, stats_file in runs:
+        _, errors = process.communicate()
+        assert process.returncode == 0, errors.decode()
+        with open(stats_file) as f:
+            stats.append(json.load(f))
+    return stats
+
+# Helper function to run every shard at the same time and merge them
+def run_shards(tmp_path, name, use_cache):
+    ### Run SHARD_COUNT shard processes concurrently, merge their shard files into tmp_path/name, and return their cache counters.
+    stats = finish_runs([start_run(tmp_path, f'{name}_shard_{index}', (index, SHARD_COUNT), use_cache) for index in range(SHARD_COUNT)])
+    docs_dir = tmp_path / name
+    docs_dir.mkdir()
+    shard_files = [str(tmp_path / 'shards' / f'shard_{index}_of_{SHARD_COUNT}.jsonl') for index in reversed(range(SHARD_COUNT))]
+    documentation_dir = psg.DOCUMENTATION_DIR
+    psg.DOCUMENTATION_DIR = str(docs_dir)  # The combined writer creates DOCUMENTATION_DIR.
+    try:
+        psg.merge_shards(
+            shard_files, str(docs_dir / 'project_structure.txt'), str(docs_dir / 'functions.txt'), str(docs_dir / 'combined_structure.txt'),
+            True, True, True, export_jsonl=True, jsonl_file=str(docs_dir / 'functions.jsonl'), export_binary=True,
+            binary_file=str(docs_dir / 'functions.bin'), symbol_index=False
+        )
+    finally:
+        psg.DOCUMENTATION_DIR = documentation_dir
+    return stats
+
+# Helper function to compare the outputs of two runs
+def assert_same_outputs(tmp_path, expected, actual):
+    ### Assert that every output of tmp_path/actual is byte-identical to the one of tmp_path/expected.
+    for name in OUTPUT_NAMES:
+        assert (tmp_path / actual / name).read_bytes() == (tmp_path / expected / name).read_bytes(), name
+
+# Test that the test project spreads over every shard
+def test_project_covers_every_shard():
+    assert {psg.shard_of(name, SHARD_COUNT) for name in TOP_LEVEL_DIRECTORIES} == set(range(SHARD_COUNT))
+
+# Test that shards run as separate processes at the same time merge into the outputs of a serial run
+def test_concurrent_shards_match_serial_run(tmp_path):
+    write_project(tmp_path / 'project')
+    finish_runs([start_run(tmp_path, 'serial')])
+    run_shards(tmp_path, 'merged', use_cache=False)
+    assert_same_outputs(tmp_path, 'serial', 'merged')
+
+# Test that cached shards running at the same time keep each other's cache entries, and still match a serial run
+def test_concurrent_cached_shards_keep_their_entries(tmp_path):
+    file_count = write_project(tmp_path / 'project')
+    finish_runs([start_run(tmp_path, 'serial')])
+
+    first = run_shards(tmp_path, 'first', use_cache=True)
+    assert sum(stats['misses'] for stats in first) == file_count
+    second = run_shards(tmp_path, 'second', use_cache=True)
+    assert [stats['misses'] for stats in second] == [0] * SHARD_COUNT
+    assert [stats['evicted'] for stats in second] == [0] * SHARD_COUNT
+    assert sum(stats['hits'] for stats in second) == file_count
+    assert_same_outputs(tmp_path, 'serial', 'first')
+    assert_same_outputs(tmp_path, 'serial', 'second')
+
+    # Removing a file evicts its entry from its own shard's cache only.
+    os.remove(tmp_path / 'project' / 'api' / 'api_0.py')
+    third = run_shards(tmp_path, 'third', use_cache=True)
+    assert sum(stats['evicted'] for stats in third) == 1
+    assert sum(stats['hits'] for stats in third) == file_count - 1
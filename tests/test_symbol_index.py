@@ -0,0 +1,140 @@
+import os  # Import os module for interacting with the operating system.
+import pytest  # Import pytest for the expected errors.
+import project_structure_generator as psg  # Import the generator under test.
+from project_structure_generator import Symbol, SymbolIndex  # Import the index and its records.
+
+# File entries shaped like the ones extract_functions() results are turned into
+ENTRIES = [
+    {'file': 'app/config.py', 'functions': [{'name': 'load_config', 'line': 3}, {'name': 'load_defaults', 'line': 9}], 'classes': []},
+    {'file': 'app/Users.php', 'functions': [{'name': 'helper', 'line': 40}], 'classes': [
+        {'name': 'UserController', 'functions': [{'name': 'index', 'line': 5}, {'name': 'load_config', 'line': 12}]},
+        {'name': 'EmptyController', 'functions': []},
+    ]},
+    {'file': 'lib/Legacy.php', 'functions': [{'name': 'Load_Config', 'line': 2}], 'classes': [
+        {'name': 'UserController', 'functions': [{'name': 'show', 'line': 8}]},
+    ]},
+]
+
+# Helper function to build the index of ENTRIES
+def build_index(entries=ENTRIES):
+    ### Return a SymbolIndex holding the given file entries.
+    index = SymbolIndex()
+    for entry in entries:
+        index.add_entry(entry)
+    return index
+
+# Test that exact lookups return every symbol of the name in walk order, and nothing for unknown names
+def test_find_exact():
+    index = build_index()
+    assert index.find('load_config') == [
+        Symbol('load_config', 'function', 'app/config.py', 3, None),
+        Symbol('load_config', 'method', 'app/Users.php', 12, 'UserController'),
+    ]
+    assert index.find('UserController') == [
+        Symbol('UserController', 'class', 'app/Users.php', None, None),
+        Symbol('UserController', 'class', 'lib/Legacy.php', None, None),
+    ]
+    assert index.find('load') == []
+    assert index.find('missing') == []
+
+# Test that prefix lookups group the symbols by name in sorted order
+def test_find_prefix():
+    index = build_index()
+    assert [(symbol.name, symbol.file) for symbol in index.find('load_', prefix=True)] == [
+        ('load_config', 'app/config.py'), ('load_config', 'app/Users.php'), ('load_defaults', 'app/config.py'),
+    ]
+    assert [symbol.name for symbol in index.find('load_defaults', prefix=True)] == ['load_defaults']
+    assert index.find('load_defaultsx', prefix=True) == []
+    assert len(index.find('', prefix=True)) == len(index) == 10
+
+# Test that case-insensitive lookups match names in any case, alone and with a prefix
+def test_find_ignore_case():
+    index = build_index()
+    assert [(symbol.name, symbol.file) for symbol in index.find('LOAD_CONFIG', ignore_case=True)] == [
+        ('Load_Config', 'lib/Legacy.php'), ('load_config', 'app/config.py'), ('load_config', 'app/Users.php'),
+    ]
+    assert [symbol.name for symbol in index.find('LOAD_', prefix=True, ignore_case=True)] == ['Load_Config', 'load_config', 'load_config', 'load_defaults']
+    assert index.find('LOAD_CONFIG') == []
+
+# Test that methods() returns the methods of every class of the name, and nothing for functions or empty classes
+def test_methods():
+    index = build_index()
+    assert index.methods('UserController') == [
+        Symbol('index', 'method', 'app/Users.php', 5, 'UserController'),
+        Symbol('load_config', 'method', 'app/Users.php', 12, 'UserController'),
+        Symbol('show', 'method', 'lib/Legacy.php', 8, 'UserController'),
+    ]
+    assert index.methods('EmptyController') == []
+    assert index.methods('helper') == []
+    assert index.methods('missing') == []
+
+# Test that entries added after a lookup are found by the next one
+def test_add_after_lookup():
+    index = build_index(ENTRIES[:1])
+    assert [symbol.file for symbol in index.find('load_config')] == ['app/config.py']
+    for entry in ENTRIES[1:]:
+        index.add_entry(entry)
+    assert [symbol.file for symbol in index.find('load_config')] == ['app/config.py', 'app/Users.php']
+    assert [symbol.name for symbol in index.methods('UserController')] == ['index', 'load_config', 'show']
+    assert len(index.find('load_config', ignore_case=True)) == 3
+
+# Test that a saved index loads with the same symbols and lookups
+def test_save_load_round_trip(tmp_path):
+    index = build_index()
+    symbols_file = str(tmp_path / 'symbols.idx')
+    index.save(symbols_file)
+    loaded = SymbolIndex.load(symbols_file)
+    assert list(loaded) == list(index)
+    for name in ('load_config', 'UserController', 'helper', 'missing'):
+        assert loaded.find(name) == index.find(name)
+    assert loaded.find('load_', prefix=True) == index.find('load_', prefix=True)
+    assert loaded.find('load_config', ignore_case=True) == index.find('load_config', ignore_case=True)
+    assert loaded.methods('UserController') == index.methods('UserController')
+
+# Test that an empty index round-trips, and that other files are rejected
+def test_load_empty_and_invalid(tmp_path):
+    symbols_file = str(tmp_path / 'symbols.idx')
+    SymbolIndex().save(symbols_file)
+    loaded = SymbolIndex.load(symbols_file)
+    assert len(loaded) == 0 and loaded.find('anything', prefix=True) == []
+    other_file = tmp_path / 'other.idx'
+    other_file.write_bytes(b'not a symbol index')
+    with pytest.raises(ValueError):
+        SymbolIndex.load(str(other_file))
+
+# Helper function to write a small project for the generator
+def write_project(project_dir):
+    ### Write a Python module and a PHP class under project_dir.
+    os.makedirs(project_dir / 'src')
+    (project_dir / 'src' / 'tools.py').write_text('def load_config(path):\n    pass\n', encoding='utf-8')
+    (project_dir / 'src' / 'Users.php').write_text('<?php\nclass UserController {\n    public function index() {\n    }\n}\n', encoding='utf-8')
+
+# Test that a run returns its outputs, cache counters and symbol index
+def test_generation_result(tmp_path, generate):
+    write_project(tmp_path / 'project')
+    docs_dir = tmp_path / 'docs'
+    result = generate(tmp_path / 'project', docs_dir)
+    assert isinstance(result, psg.GenerationResult)
+    assert result.outputs == [str(docs_dir / 'project_structure.txt'), str(docs_dir / 'functions.txt')]
+    assert result.cache_stats is None
+    assert result.symbols.find('load_config') == [Symbol('load_config', 'function', os.path.join('src', 'tools.py'), 1, None)]
+    assert [symbol.name for symbol in result.symbols.methods('UserController')] == ['index']
+    assert repr(result) == f"GenerationResult(outputs={result.outputs!r}, cache_stats=None, symbols=3)"
+
+    cached = generate(tmp_path / 'project', docs_dir, use_cache=True)
+    assert cached.cache_stats == {'hits': 0, 'misses': 2, 'evicted': 0}
+    assert list(cached.symbols) == list(result.symbols)
+    cached = generate(tmp_path / 'project', docs_dir, use_cache=True)
+    assert cached.cache_stats == {'hits': 2, 'misses': 0, 'evicted': 0}
+    assert list(cached.symbols) == list(result.symbols)  # Entries served from the cache are indexed too.
+
+# Test that symbol_index=False leaves the index out unless export_symbols saves it
+def test_generation_result_without_symbol_index(tmp_path, generate):
+    write_project(tmp_path / 'project')
+    docs_dir = tmp_path / 'docs'
+    assert generate(tmp_path / 'project', docs_dir, symbol_index=False).symbols is None
+
+    result = generate(tmp_path / 'project', docs_dir, symbol_index=False, export_symbols=True)
+    assert result.outputs[-1] == str(docs_dir / 'symbols.idx')
+    assert list(SymbolIndex.load(result.outputs[-1])) == list(result.symbols)
+    assert len(result.symbols) == 3
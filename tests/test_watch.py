@@ -0,0 +1,149 @@
+import os  # Import os module for interacting with the operating system.
+import shutil  # Import shutil module for removing directories.
+import itertools  # Import itertools module for the modification time counter.
+import pytest  # Import pytest for parametrized tests.
+import project_structure_generator as psg  # Import the generator under test.
+
+OUTPUT_NAMES = ['project_structure.txt', 'functions.txt', 'combined_structure.txt', 'functions.jsonl', 'functions.bin']
+EXPORTS = dict(export_combined=True, export_jsonl=True, export_binary=True, symbol_index=False)
+MTIME_BASE = 2_000_000_000 * 10 ** 9  # Modification times set by touch(), later than any the file system hands out during the test.
+mtime_counter = itertools.count(1)
+
+# Helper function to give a path a new modification time
+def touch(*paths):
+    ### Set a modification time no path had before, so changes within one file system timestamp tick are still seen.
+    for path in paths:
+        mtime_ns = MTIME_BASE + next(mtime_counter) * 10 ** 9
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+# Helper function to write a file and mark it and its directory as changed
+def write_file(path, text):
+    ### Write text to path, creating its directory, and touch both.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    touch(path, path.parent)
+
+# Helper function to write the watched project
+def write_project(project_dir):
+    ### Write Python, PHP and JavaScript files at the root and in nested directories.
+    write_file(project_dir / 'main.py', 'def main():\n    pass\n')
+    write_file(project_dir / 'app.js', 'function start() {\n}\n')
+    write_file(project_dir / 'src' / 'models.py', '# A model\ndef load_model(path):\n    pass\n')
+    write_file(project_dir / 'src' / 'Users.php', '<?php\nclass Users {\n    public function index() {\n    }\n}\n')
+    write_file(project_dir / 'src' / 'sub' / 'deep.js', 'function deep() {\n}\n')
+    write_file(project_dir / 'old' / 'legacy.php', '<?php\nfunction legacy() {\n}\n')
+    write_file(project_dir / 'web' / 'page.js', 'function page() {\n}\n')
+    write_file(project_dir / 'web' / 'notes.txt', 'Not extracted.\n')
+
+# Helper function to create a watcher writing the same outputs as the generate fixture
+def make_watcher(project_dir, docs_dir):
+    ### Return a ProjectWatcher for project_dir writing every output below docs_dir.
+    os.makedirs(docs_dir, exist_ok=True)
+    languages = ['python', 'php', 'javascript']
+    matcher = psg.NameMatcher(psg.IGNORE_DIRS, psg.IGNORE_FILES, psg.SPECIAL_DIR_PATTERNS, psg.PATTERNS, ('.py', '.php', '.js'), languages, False)
+
+    # Helper function to open the writers of every output
+    def open_writers():
+        return psg.open_output_writers(
+            None, str(docs_dir / 'project_structure.txt'), str(docs_dir / 'functions.txt'), str(docs_dir / 'combined_structure.txt'),
+            True, True, True, True, str(docs_dir / 'functions.jsonl'), True, str(docs_dir / 'functions.bin'), False, None
+        )
+
+    return psg.ProjectWatcher(str(project_dir), None, matcher, False, open_writers, psg.iter_extraction_results)
+
+# Helper function to compare watched outputs with a fresh run
+def assert_matches_fresh_run(generate, project_dir, watched_dir, fresh_dir):
+    ### Run the generator from scratch into fresh_dir and assert that every output in watched_dir is byte-identical.
+    generate(project_dir, fresh_dir, **EXPORTS)
+    for name in OUTPUT_NAMES:
+        assert (watched_dir / name).read_bytes() == (fresh_dir / name).read_bytes(), name
+
+# Test that polled changes to files and directories rewrite the outputs of a fresh run
+def test_poll_matches_fresh_run(tmp_path, generate, monkeypatch):
+    project_dir = tmp_path / 'project'
+    watched_dir = tmp_path / 'watched'
+    write_project(project_dir)
+    monkeypatch.setattr(psg, 'DOCUMENTATION_DIR', str(watched_dir))
+    watcher = make_watcher(project_dir, watched_dir)
+    watcher.full_pass()
+    watcher.write_outputs()
+    assert_matches_fresh_run(generate, project_dir, watched_dir, tmp_path / 'fresh_0')
+    assert watcher.poll() == (0, 0)
+
+    # Add and edit files, and add a directory tree.
+    write_file(project_dir / 'src' / 'new.py', 'def new():\n    pass\n')
+    write_file(project_dir / 'src' / 'models.py', '# A model\ndef load_model(path):\n    pass\n\ndef save_model(path):\n    pass\n')
+    write_file(project_dir / 'app.js', 'function begin() {\n}\n')  # Same size as before.
+    write_file(project_dir / 'extra' / 'nested' / 'tool.py', 'def tool():\n    pass\n')
+    touch(project_dir)
+    assert watcher.poll() == (2, 2)  # The root and src were listed again; models.py and app.js were extracted again.
+    watcher.write_outputs()
+    assert_matches_fresh_run(generate, project_dir, watched_dir, tmp_path / 'fresh_1')
+
+    # Delete and rename files and directories.
+    os.remove(project_dir / 'old' / 'legacy.php')
+    os.rename(project_dir / 'src' / 'Users.php', project_dir / 'src' / 'Accounts.php')
+    os.rename(project_dir / 'src' / 'sub', project_dir / 'src' / 'helpers')
+    shutil.rmtree(project_dir / 'web')
+    touch(project_dir, project_dir / 'src', project_dir / 'old')
+    watcher.poll()
+    watcher.write_outputs()
+    assert_matches_fresh_run(generate, project_dir, watched_dir, tmp_path / 'fresh_2')
+    assert 'web' not in watcher.directories and os.path.join('src', 'sub') not in watcher.directories
+    assert os.path.join('src', 'helpers') in watcher.directories
+
+    # Empty a directory and fill it again.
+    os.remove(project_dir / 'src' / 'helpers' / 'deep.js')
+    touch(project_dir / 'src' / 'helpers')
+    watcher.poll()
+    write_file(project_dir / 'src' / 'helpers' / 'deep.js', 'function deeper() {\n}\n')
+    watcher.poll()
+    watcher.write_outputs()
+    assert_matches_fresh_run(generate, project_dir, watched_dir, tmp_path / 'fresh_3')
+    assert watcher.poll() == (0, 0)
+
+# Test that run() rewrites the outputs once per burst of changes, after debounce seconds without further changes, waiting
+# the interval between idle polls and at most the debounce while changes are pending; edits are made during the 1st, 2nd
+# and 6th sleep, and the 7th sleep is interrupted
+@pytest.mark.parametrize('interval, debounce, expected_sleeps, expected_write_times', [
+    (1.0, 2.5, [1.0] * 7, [0.0, 5.0, 7.0]),  # Quiet polls within the debounce do not rewrite.
+    (5.0, 2.0, [5.0, 2.0, 2.0, 5.0, 5.0, 5.0, 2.0], [0.0, 9.0, 26.0]),
+])
+def test_run_debounces_rewrites(tmp_path, generate, monkeypatch, interval, debounce, expected_sleeps, expected_write_times):
+    project_dir = tmp_path / 'project'
+    write_project(project_dir)
+    clock = [0.0]
+    sleeps = []
+    writes = []  # (clock, functions.txt) of every rewrite.
+    edits = {
+        1: lambda: write_file(project_dir / 'main.py', 'def main():\n    pass\n\ndef first():\n    pass\n'),
+        2: lambda: write_file(project_dir / 'src' / 'models.py', '# A model\ndef second(path):\n    pass\n'),
+        6: lambda: write_file(project_dir / 'main.py', 'def main():\n    pass\n\ndef third():\n    pass\n'),
+    }
+
+    # Helper function to stand in for time.sleep: advance the clock and make the edit planned for this call
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+        if len(sleeps) == len(expected_sleeps):
+            raise KeyboardInterrupt
+        if len(sleeps) in edits:
+            edits[len(sleeps)]()
+
+    write_outputs = psg.ProjectWatcher.write_outputs
+
+    # Helper function to record every rewrite
+    def record_write(watcher):
+        write_outputs(watcher)
+        writes.append((clock[0], (tmp_path / 'watched' / 'functions.txt').read_text(encoding='utf-8')))
+
+    monkeypatch.setattr(psg.time, 'sleep', sleep)
+    monkeypatch.setattr(psg.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(psg.ProjectWatcher, 'write_outputs', record_write)
+    generate(project_dir, tmp_path / 'watched', watch=True, watch_interval=interval, watch_debounce=debounce, **EXPORTS)
+
+    assert sleeps == expected_sleeps
+    assert [time for time, _ in writes] == expected_write_times
+    assert 'first' in writes[1][1] and 'second' in writes[1][1] and 'third' not in writes[1][1]  # The burst is written once.
+    assert 'third' in writes[2][1]  # Changes pending when interrupted are written before stopping.
+    assert_matches_fresh_run(generate, project_dir, tmp_path / 'watched', tmp_path / 'fresh')